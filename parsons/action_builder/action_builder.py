@@ -2,9 +2,8 @@ import json
 import logging
 from typing import Any
 
-from parsons import Table
 from parsons.utilities import check_env
-from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.api_connector import APIConnector, pages_to_table
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +21,38 @@ class ActionBuilder:
             Optional. The 36-character "interact ID" of the campaign whose data is to be retrieved
             or edited. Can also be supplied in individual methods in case multiple campaigns need
             to be referenced.
+        max_workers: int
+            The number of pages to request at once when fetching all records of an object.
+            Defaults to ``1``.
+        requests_per_second: float
+            If set, keep all requests to Action Builder within this rate, across threads
+            and instances.
 
     """
 
-    def __init__(self, api_token=None, subdomain=None, campaign=None):
+    def __init__(
+        self,
+        api_token=None,
+        subdomain=None,
+        campaign=None,
+        max_workers=1,
+        requests_per_second=None,
+    ):
         self.api_token = check_env.check("ACTION_BUILDER_API_TOKEN", api_token)
         self.headers = {
             "Content-Type": "application/json",
             "OSDI-API-Token": self.api_token,
         }
         self.api_url = API_URL.format(subdomain=subdomain)
-        self.api = APIConnector(self.api_url, headers=self.headers)
+        self.api = APIConnector(
+            self.api_url,
+            headers=self.headers,
+            pool_size=max(max_workers, 10),
+            requests_per_second=requests_per_second,
+        )
         self.campaign = campaign
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
 
     def _campaign_check(self, campaign):
         # Raise an error if campaign is not provided via instatiation nor method argument
@@ -66,29 +85,13 @@ class ActionBuilder:
         # Returns a list of entries for a given object, such as people, tags, or connections.
         # See Action Builder API docs for more: https://www.actionbuilder.org/docs/v1/index.html
 
-        count = 0
-        page = 1
-        return_list = []
-
-        # Keep getting the next page until record limit is exceeded or an empty result returns
-        while True:
-            # Get this page and increase page number to the next one
+        def fetch_page(page):
             response = self._get_page(campaign, object_name, page, per_page, filter=filter)
-            page = page + 1
-
-            # Check that there's actually data
-            response_list = response.get("_embedded", {}).get(f"osdi:{object_name}")
-
-            if not response_list:
-                # This page has no data, so we're done
-                return Table(return_list)
+            return response.get("_embedded", {}).get(f"osdi:{object_name}")
 
-            # Assuming there's data, add it to the running response list
-            return_list.extend(response_list)
-            count = count + len(response_list)
-            if limit and count >= limit:
-                # Limit reached or exceeded, so return just the requested limit amount
-                return Table(return_list[0:limit])
+        # Keep getting the next page until record limit is reached or an empty result returns
+        pages = self.api.get_pages(fetch_page, max_workers=self.max_workers)
+        return pages_to_table(pages, limit)
 
     def get_campaign_tags(self, campaign=None, limit=None, per_page=25, filter=None):
         """
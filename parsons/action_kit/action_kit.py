@@ -10,6 +10,7 @@ import requests
 
 from parsons.etl.table import Table
 from parsons.utilities import check_env
+from parsons.utilities.api_connector import pages_to_table
 
 logger = logging.getLogger(__name__)
 
@@ -907,18 +908,19 @@ class ActionKit:
         # (https://roboticdogs.actionkit.com/docs//manual/api/rest/overview.html#ordering)
         # get only `limit` objects if it's below 100, otherwise get 100 at a time
         kwargs["_limit"] = min(100, limit or 1_000_000_000)
-        json_data = self._base_get(object_type, params=kwargs)
-        data = json_data["objects"]
 
-        next_url = json_data.get("meta", {}).get("next")
-        while next_url:
-            resp = self.conn.get(f"https://{self.domain}{next_url}")
-            data.extend(resp.json().get("objects", []))
-            next_url = resp.json().get("meta", {}).get("next")
-            if limit and len(data) >= limit:
-                break
+        def pages():
+            json_data = self._base_get(object_type, params=kwargs)
+            yield json_data["objects"]
 
-        return Table(data[:limit])
+            next_url = json_data.get("meta", {}).get("next")
+            while next_url:
+                resp = self.conn.get(f"https://{self.domain}{next_url}")
+                yield resp.json().get("objects", [])
+                next_url = resp.json().get("meta", {}).get("next")
+
+        # Pages stop being requested once `limit` is reached
+        return pages_to_table(pages(), limit)
 
     def paginated_get_custom_limit(
         self,
@@ -4,9 +4,8 @@ import re
 import warnings
 from typing import Literal
 
-from parsons import Table
 from parsons.utilities import check_env
-from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.api_connector import APIConnector, pages_to_table
 
 logger = logging.getLogger(__name__)
 
@@ -18,17 +17,30 @@ class ActionNetwork:
     Args:
         api_token: str
             OSDI API token
+        max_workers: int
+            The number of pages to request at once when fetching all entries of an object.
+            Defaults to ``1``.
+        requests_per_second: float
+            If set, keep all requests to Action Network within this rate, across threads
+            and instances. Action Network allows up to 4 requests per second.
 
     """
 
-    def __init__(self, api_token=None):
+    def __init__(self, api_token=None, max_workers=1, requests_per_second=None):
         self.api_token = check_env.check("AN_API_TOKEN", api_token)
         self.headers = {
             "Content-Type": "application/json",
             "OSDI-API-Token": self.api_token,
         }
         self.api_url = API_URL
-        self.api = APIConnector(self.api_url, headers=self.headers)
+        self.api = APIConnector(
+            self.api_url,
+            headers=self.headers,
+            pool_size=max(max_workers, 10),
+            requests_per_second=requests_per_second,
+        )
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
 
     def _get_page(self, object_name, page, per_page=25, filter=None):
         # returns data from one page of results
@@ -47,19 +59,12 @@ class ActionNetwork:
         # event_campaigns, campaigns, advocacy_campaigns, signatures, attendances, submissions,
         # donations and outreaches.
         # See Action Network API docs for more info: https://actionnetwork.org/docs/v2/
-        count = 0
-        page = 1
-        return_list = []
-        while True:
+        def fetch_page(page):
             response = self._get_page(object_name, page, per_page, filter=filter)
-            page = page + 1
-            response_list = response["_embedded"][list(response["_embedded"])[0]]
-            if not response_list:
-                return Table(return_list)
-            return_list.extend(response_list)
-            count = count + len(response_list)
-            if limit and count >= limit:
-                return Table(return_list[0:limit])
+            return response["_embedded"][list(response["_embedded"])[0]]
+
+        pages = self.api.get_pages(fetch_page, max_workers=self.max_workers)
+        return pages_to_table(pages, limit)
 
     # Advocacy Campaigns
     def get_advocacy_campaigns(self, limit=None, per_page=25, page=None, filter=None):
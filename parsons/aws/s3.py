@@ -1,7 +1,12 @@
+import io
 import logging
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import ClientError
 
 from parsons.utilities import check_env, files
@@ -60,6 +65,13 @@ class S3:
             Controls use of the ``AWS_SESSION_TOKEN`` environment variable. Defaults
             to ``True``. Set to ``False`` in order to ignore the ``AWS_SESSION_TOKEN`` environment
             variable even if the ``aws_session_token`` argument was not passed in.
+        transfer_config: dict or boto3.s3.transfer.TransferConfig
+            Controls multipart uploads, downloads and copies, e.g.
+            ``{"multipart_threshold": 64 * 1024 ** 2, "multipart_chunksize": 64 * 1024 ** 2,
+            "max_concurrency": 20}``. Either a ``TransferConfig`` or a dict of its
+            arguments. See `AWS TransferConfig documentation
+            <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig>`_
+            for the options. Defaults to the boto3 defaults.
 
     Returns:
         S3 class.
@@ -72,6 +84,7 @@ class S3:
         aws_secret_access_key=None,
         aws_session_token=None,
         use_env_token=True,
+        transfer_config=None,
     ):
         self.aws = AWSConnection(
             aws_access_key_id=aws_access_key_id,
@@ -86,6 +99,12 @@ class S3:
         self.client = self.s3.meta.client
         """Boto3 API Session client object. Use for more advanced boto3 features."""
 
+        if isinstance(transfer_config, dict):
+            transfer_config = TransferConfig(**transfer_config)
+
+        self.transfer_config = transfer_config or TransferConfig()
+        """The ``TransferConfig`` used for uploads, downloads and copies."""
+
     def list_buckets(self):
         """
         List all buckets to which you have access.
@@ -112,7 +131,7 @@ class S3:
             # If we can list the keys, the bucket definitely exists. We do this check since
             # it will account for buckets that live on other AWS accounts and that we
             # have access to.
-            self.list_keys(bucket)
+            next(self.iter_keys(bucket, MaxKeys=1), None)
             return True
         except Exception:
             pass
@@ -132,6 +151,8 @@ class S3:
         """
         List the keys in a bucket, along with extra info about each one.
 
+        All matching keys are held in memory. For large buckets, use :meth:`iter_keys`.
+
         Args:
             bucket: str
                 The bucket name
@@ -156,9 +177,80 @@ class S3:
                 'Size', and 'Owner'.
 
         """
-        keys_dict = {}
         logger.debug(f"Fetching keys in {bucket} bucket")
 
+        keys_dict = {}
+        for key in self.iter_keys(
+            bucket,
+            prefix=prefix,
+            suffix=suffix,
+            regex=regex,
+            date_modified_before=date_modified_before,
+            date_modified_after=date_modified_after,
+            **kwargs,
+        ):
+            # Convert date to iso string
+            key["LastModified"] = key["LastModified"].isoformat()
+
+            # Add to output dict
+            keys_dict[key.get("Key")] = key
+
+        logger.debug(f"Retrieved {len(keys_dict)} keys")
+
+        return keys_dict
+
+    def iter_keys(
+        self,
+        bucket,
+        prefix=None,
+        suffix=None,
+        regex=None,
+        date_modified_before=None,
+        date_modified_after=None,
+        start_after=None,
+        delimiter=None,
+        **kwargs,
+    ):
+        """
+        Lazily iterate over the keys in a bucket, along with extra info about each one.
+
+        Unlike :meth:`list_keys`, keys are yielded as each page of up to 1,000 results
+        arrives, so callers can start work immediately, stop early, and use constant memory
+        on buckets with millions of keys. S3 itself only filters by ``prefix``,
+        ``start_after`` and ``delimiter``, so use them to narrow the listing where
+        possible; the other filters are applied to each page as it arrives.
+
+        Args:
+            bucket: str
+                The bucket name
+            prefix: str
+                Limits the response to keys that begin with the specified prefix.
+            suffix: str
+                Limits the response to keys that end with specified suffix
+            regex: str
+                Limits the reponse to keys that match a regex pattern
+            date_modified_before: datetime.datetime
+                Limits the response to keys with date modified before
+            date_modified_after: datetime.datetime
+                Limits the response to keys with date modified after
+            start_after: str
+                Only list keys that sort after this key, e.g. to resume a listing from the
+                last key that was processed.
+            delimiter: str
+                Skip keys that contain the delimiter after the prefix. E.g. with a
+                ``prefix`` of ``exports/`` and a delimiter of ``/``, keys in
+                ``exports/2024/`` aren't listed at all.
+            kwargs:
+                Additional arguments for the S3 API call. See `AWS ListObjectsV2 documentation
+                <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.list_objects_v2>`_
+                for more info.
+
+        Yields:
+            dict
+                Info about each key, including 'Key', 'LastModified' (a ``datetime``),
+                and 'Size'.
+
+        """
         continuation_token = None
 
         while True:
@@ -167,6 +259,12 @@ class S3:
             if prefix:
                 args["Prefix"] = prefix
 
+            if start_after:
+                args["StartAfter"] = start_after
+
+            if delimiter:
+                args["Delimiter"] = delimiter
+
             if continuation_token:
                 args["ContinuationToken"] = continuation_token
 
@@ -203,11 +301,7 @@ class S3:
                 if date_modified_after and not key["LastModified"] > date_modified_after:
                     continue
 
-                # Convert date to iso string
-                key["LastModified"] = key["LastModified"].isoformat()
-
-                # Add to output dict
-                keys_dict[key.get("Key")] = key
+                yield key
 
             # If more than 1000 results, continue with token
             if resp.get("NextContinuationToken"):
@@ -216,10 +310,6 @@ class S3:
             else:
                 break
 
-        logger.debug(f"Retrieved {len(keys_dict)} keys")
-
-        return keys_dict
-
     def key_exists(self, bucket, key):
         """
         Determine if a key exists in a bucket.
@@ -234,9 +324,7 @@ class S3:
                 ``True`` if key exists and ``False`` if not.
 
         """
-        key_count = len(self.list_keys(bucket, prefix=key))
-
-        if key_count > 0:
+        if next(self.iter_keys(bucket, prefix=key, MaxKeys=1), None) is not None:
             logger.debug(f"Found {key} in {bucket}.")
             return True
         else:
@@ -288,7 +376,52 @@ class S3:
                 info.
 
         """
-        self.client.upload_file(local_path, bucket, key, ExtraArgs={"ACL": acl, **kwargs})
+        self.client.upload_file(
+            local_path,
+            bucket,
+            key,
+            ExtraArgs={"ACL": acl, **kwargs},
+            Config=self.transfer_config,
+        )
+
+    def put_stream(self, bucket, key, stream, acl="bucket-owner-full-control", **kwargs):
+        """
+        Uploads a readable binary file object to an S3 bucket, such as the stream returned
+        by :meth:`~parsons.etl.tofrom.ToFrom.to_csv_stream`.
+
+        The stream is read one part at a time and, once it is larger than the transfer
+        config's ``multipart_threshold``, uploaded as a multipart upload with up to
+        ``max_concurrency`` parts in flight. Nothing is written to disk, and memory use is
+        bounded by the part size times the concurrency.
+
+        Args:
+            bucket: str
+                The bucket name
+            key: str
+                The object key
+            stream: file-like object
+                A readable binary file object. It does not need to be seekable.
+            acl: str
+                The S3 permissions on the file
+            kwargs:
+                Additional arguments for the S3 API call. See `AWS Put Object documentation
+                <https://docs.aws.amazon.com/AmazonS3/latest/API/RESTObjectPUT.html>`_ for more
+                info.
+
+        """
+        if isinstance(stream, io.RawIOBase):
+            # A raw stream may return less than asked for on each read, and the transfer
+            # manager decides whether to use a multipart upload from its first read. So
+            # buffer it to make every read a full part.
+            stream = io.BufferedReader(stream, buffer_size=self.transfer_config.multipart_chunksize)
+
+        self.client.upload_fileobj(
+            stream,
+            bucket,
+            key,
+            ExtraArgs={"ACL": acl, **kwargs},
+            Config=self.transfer_config,
+        )
 
     def remove_file(self, bucket, key):
         """
@@ -329,7 +462,9 @@ class S3:
         if not local_path:
             local_path = files.create_temp_file_for_path(key)
 
-        self.s3.Object(bucket, key).download_file(local_path, ExtraArgs=kwargs)
+        self.s3.Object(bucket, key).download_file(
+            local_path, ExtraArgs=kwargs, Config=self.transfer_config
+        )
 
         return local_path
 
@@ -367,11 +502,18 @@ class S3:
         date_modified_after=None,
         public_read=False,
         remove_original=False,
+        max_workers=1,
+        checkpoint_path=None,
+        dry_run=False,
         **kwargs,
     ):
         """
         Transfer files between s3 buckets
 
+        Files are copied server-side, so their contents never pass through this machine.
+        When transferring a prefix, copies start as soon as the first page of keys has been
+        listed, and with ``max_workers`` greater than one, that many copies run at once.
+
         Args:
             origin_bucket: str
                 The origin bucket
@@ -394,27 +536,53 @@ class S3:
                 If the keys should be set to `public-read`
             remove_original: bool
                 If the original keys should be removed after transfer
+            max_workers: int
+                The number of keys to copy at once. Defaults to ``1``.
+            checkpoint_path: str
+                The path of a local file in which to record each key once it has been
+                transferred. Keys already recorded in the file are skipped, so an
+                interrupted transfer can be resumed by calling this method again with the
+                same ``checkpoint_path``.
+            dry_run: bool
+                If ``True``, only count the keys that would be transferred.
             kwargs:
                 Additional arguments for the S3 API call. See `AWS download_file docs
                 <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.copy>`_
                 for more info.
 
+        Returns:
+            int
+                The number of keys transferred, or that would be transferred if ``dry_run``
+                is ``True``.
+
         """
         # If prefix, get all files for the prefix
         if origin_key.endswith("/"):
-            resp = self.list_keys(
-                origin_bucket,
-                prefix=origin_key,
-                suffix=suffix,
-                regex=regex,
-                date_modified_before=date_modified_before,
-                date_modified_after=date_modified_after,
+            keys = (
+                obj["Key"]
+                for obj in self.iter_keys(
+                    origin_bucket,
+                    prefix=origin_key,
+                    suffix=suffix,
+                    regex=regex,
+                    date_modified_before=date_modified_before,
+                    date_modified_after=date_modified_after,
+                )
             )
-            key_list = [value["Key"] for value in resp.values()]
         else:
-            key_list = [origin_key]
+            keys = iter([origin_key])
 
-        for key in key_list:
+        if checkpoint_path and Path(checkpoint_path).exists():
+            done = set(Path(checkpoint_path).read_text().splitlines())
+            logger.info(f"Skipping {len(done)} keys already transferred")
+            keys = (key for key in keys if key not in done)
+
+        if dry_run:
+            count = sum(1 for _ in keys)
+            logger.info(f"Found {count} keys to transfer")
+            return count
+
+        def transfer(key):
             # If destination_key is prefix, replace
             if destination_key and destination_key.endswith("/"):
                 dest_key = key.replace(origin_key, destination_key)
@@ -428,18 +596,56 @@ class S3:
                 dest_key = key
 
             copy_source = {"Bucket": origin_bucket, "Key": key}
-            self.client.copy(copy_source, destination_bucket, dest_key, ExtraArgs=kwargs)
+            self.client.copy(
+                copy_source,
+                destination_bucket,
+                dest_key,
+                ExtraArgs=kwargs,
+                Config=self.transfer_config,
+            )
             if remove_original:
                 try:
-                    self.remove_file(origin_bucket, origin_key)
+                    self.remove_file(origin_bucket, key)
                 except Exception as e:
                     logger.error("Failed to delete original key: " + str(e))
 
             if public_read:
-                object_acl = self.s3.ObjectAcl(destination_bucket, destination_key)
-                object_acl.put(ACL="public-read")
-
-        logger.info(f"Finished syncing {len(key_list)} keys")
+                self.client.put_object_acl(
+                    Bucket=destination_bucket, Key=dest_key, ACL="public-read"
+                )
+
+            return key
+
+        count = 0
+
+        def record(futures, checkpoint):
+            nonlocal count
+            for future in futures:
+                key = future.result()
+                count += 1
+                if checkpoint:
+                    checkpoint.write(key + "\n")
+                    checkpoint.flush()
+
+        with (
+            Path(checkpoint_path).open("a") if checkpoint_path else nullcontext() as checkpoint,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            # Only keep a couple of copies queued per worker, so the listing is consumed
+            # at the pace of the copies
+            pending = set()
+            for key in keys:
+                if len(pending) >= max_workers * 2:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    record(finished, checkpoint)
+
+                pending.add(executor.submit(transfer, key))
+
+            record(wait(pending).done, checkpoint)
+
+        logger.info(f"Finished syncing {count} keys")
+
+        return count
 
     def get_buckets_with_subname(self, bucket_subname):
         """
@@ -1,5 +1,7 @@
 import logging
 
+import petl
+
 import parsons.databases.database.constants as consts
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,73 @@ class DatabaseCreateStatement:
         self.IS_CASE_SENSITIVE = consts.IS_CASE_SENSITIVE
         self.REPLACE_CHARS = consts.REPLACE_CHARS
 
+    def profile_columns(self, tbl, skip_values=("NA", ""), sample_size=None):
+        """Profile the types, widths and null counts of a table's columns in one pass.
+
+        The profile is cached on the table, so repeated calls (e.g. generating a create
+        statement and then checking column widths) only read the data once.
+
+        Args:
+            tbl: Table
+                The Parsons table to profile.
+            skip_values: tuple
+                Values that are ignored when detecting types. Defaults to the csv null
+                values ``"NA"`` and ``""``.
+            sample_size: int
+                (Optional) Only profile the first ``sample_size`` rows.
+
+        Returns:
+            TableProfile
+                See :meth:`parsons.Table.profile`.
+
+        """
+        return tbl.profile(
+            type_detector=self.detect_data_type,
+            skip_values=skip_values,
+            terminal_types=(self.VARCHAR,),
+            sample_size=sample_size,
+        )
+
+    def profiling_view(self, tbl, skip_values=("NA", "")):
+        """Return a view of a table that profiles it, as :meth:`profile_columns` would,
+        while it is being read.
+
+        Once the view has been read to the end (e.g. while uploading it), the profile is
+        cached on ``tbl``, so :meth:`profile_columns` and column width checks don't need
+        to read the data again.
+
+        Args:
+            tbl: Table
+                The Parsons table to profile.
+            skip_values: tuple
+                See :meth:`profile_columns`.
+
+        Returns:
+            Table
+                See :meth:`parsons.Table.profiling_view`.
+
+        """
+        return tbl.profiling_view(
+            type_detector=self.detect_data_type,
+            skip_values=skip_values,
+            terminal_types=(self.VARCHAR,),
+        )
+
+    def set_column_names(self, tbl, columns):
+        """Set the header of a table, leaving it untouched if the names already match.
+
+        Skipping the no-op rename keeps any profile cached on the table valid.
+
+        Args:
+            tbl: Table
+                The Parsons table to update.
+            columns: list
+                The new column names.
+
+        """
+        if list(columns) != tbl.columns:
+            tbl.table = petl.setheader(tbl.table, columns)
+
     # This will allow child classes to modify how these columns are handled.
     def _rename_reserved_word(self, col, index=None):
         """Return the renamed column.
@@ -1,10 +1,71 @@
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Literal
 
 from parsons.etl.table import Table
 
 logger = logging.getLogger(__name__)
 
+# Placed on the pipeline queue to tell a writer thread there is nothing left to write
+_END_OF_DATA = object()
+
+
+class _StageStats:
+    """Thread-safe running totals of rows processed and time spent in a pipeline stage."""
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.rows = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, rows, seconds):
+        with self._lock:
+            self.rows += rows
+            self.seconds += seconds
+
+    def log(self, wall_seconds):
+        rate = self.rows / self.seconds if self.seconds else 0
+        logger.info(
+            "%s: %s rows in %.1fs busy / %.1fs elapsed (%.0f rows/s per thread)",
+            self.stage,
+            self.rows,
+            self.seconds,
+            wall_seconds,
+            rate,
+        )
+
+
+def _partition_bounds(min_value, max_value, partitions):
+    """
+    Split the range between ``min_value`` and ``max_value`` into at most ``partitions``
+    equal ranges. Returns a list of ``(lower, upper, include_upper)`` tuples; each range
+    includes its lower bound, and only the last range includes its upper bound.
+    """
+    try:
+        span = max_value - min_value
+    except TypeError as e:
+        raise ValueError("The partition column must be numeric or a date.") from e
+
+    # Round integer steps up, so the ranges cover every value
+    step = max(-(-span // partitions), 1) if isinstance(span, int) else span / partitions
+
+    bounds = []
+    lower = min_value
+    for i in range(1, partitions + 1):
+        upper = min_value + step * i
+        if i == partitions or upper >= max_value:
+            bounds.append((lower, max_value, True))
+            break
+        bounds.append((lower, upper, False))
+        lower = upper
+
+    return bounds
+
 
 class DBSync:
     """
@@ -25,6 +86,21 @@ class DBSync:
         retries: int
             The number of times to retry if there is an error processing a
             chunk of data. The default value is 0.
+        pipeline: bool
+            If ``True``, read from the source and write to the destination concurrently, using
+            a bounded queue of chunks between reader and writer threads. Read and write
+            throughput for each stage is logged at the end of the copy. Rows are not guaranteed
+            to be written in ``order_by`` order in this mode. Defaults to ``False``.
+        reader_threads: int
+            The number of threads reading chunks from the source when ``pipeline`` is set.
+            Only used when paginating with ``OFFSET``; keyset pagination is always read by a
+            single thread. Defaults to 1.
+        writer_threads: int
+            The number of threads writing to the destination when ``pipeline`` is set.
+            Defaults to 1.
+        queue_size: int
+            The maximum number of read chunks held in memory waiting to be written when
+            ``pipeline`` is set. Defaults to 2.
 
     Returns:
         A DBSync object.
@@ -38,12 +114,20 @@ class DBSync:
         read_chunk_size=100_000,
         write_chunk_size=None,
         retries=0,
+        pipeline=False,
+        reader_threads=1,
+        writer_threads=1,
+        queue_size=2,
     ):
         self.source_db = source_db
         self.dest_db = destination_db
         self.read_chunk_size = read_chunk_size
         self.write_chunk_size = write_chunk_size or read_chunk_size
         self.retries = retries
+        self.pipeline = pipeline
+        self.reader_threads = reader_threads
+        self.writer_threads = writer_threads
+        self.queue_size = queue_size
 
     def table_sync_full(
         self,
@@ -52,6 +136,9 @@ class DBSync:
         if_exists: Literal["fail", "append", "drop", "truncate"] = "drop",
         order_by=None,
         verify_row_count=True,
+        primary_key=None,
+        partitions=1,
+        partition_column=None,
         **kwargs,
     ):
         """
@@ -74,6 +161,20 @@ class DBSync:
             verify_row_count: bool
                 Whether or not to verify the count of rows in the source and destination table
                 are the same at the end of the sync.
+            primary_key: str
+                The name of a column with unique values, such as the primary key. If provided,
+                rows are read in order of this column and each chunk starts after the last
+                value of the previous chunk, rather than using ``OFFSET``. This keeps the cost
+                of each read constant no matter how far into the table the sync is, and
+                should be used for large tables. Overrides ``order_by``.
+            partitions: int
+                The number of partitions to split the source table into. Each partition covers
+                an equal range of ``partition_column`` values between its minimum and maximum,
+                and is copied in its own thread, over its own database connections. Row
+                counts are verified for each partition. Defaults to 1.
+            partition_column: str
+                The numeric or date column to partition the table by when ``partitions`` is
+                greater than 1. Defaults to ``primary_key``.
             `**kwargs`: args
                 Optional copy arguments for destination database.
 
@@ -82,6 +183,13 @@ class DBSync:
         source_tbl = self.source_db.table(source_table)
         destination_tbl = self.dest_db.table(destination_table)
 
+        if primary_key:
+            order_by = primary_key
+
+        partition_column = partition_column or primary_key
+        if partitions > 1 and not partition_column:
+            raise ValueError("A partition_column or primary_key is required to sync in partitions.")
+
         logger.info(f"Syncing full table data from {source_table} to {destination_table}")
 
         # Drop or truncate if the destination table exists
@@ -105,7 +213,26 @@ class DBSync:
         if not destination_tbl.exists:
             self.create_table(source_table, destination_table)
 
-        copied_rows = self.copy_rows(source_table, destination_table, None, order_by, **kwargs)
+        if partitions > 1:
+            copied_rows = self._copy_partitions(
+                source_tbl,
+                destination_table,
+                partitions,
+                partition_column,
+                order_by,
+                keyset_pagination=primary_key is not None,
+                verify_row_count=verify_row_count,
+                **kwargs,
+            )
+        else:
+            copied_rows = self.copy_rows(
+                source_table,
+                destination_table,
+                None,
+                order_by,
+                keyset_pagination=primary_key is not None,
+                **kwargs,
+            )
 
         if verify_row_count:
             self._row_count_verify(source_tbl, destination_tbl)
@@ -197,8 +324,15 @@ class DBSync:
             return None
 
         else:
+            # Keyset pagination skips rows if the primary key isn't distinct, so only use it
+            # once that's been checked
             rows_copied = self.copy_rows(
-                source_table, destination_table, dest_max_pk, primary_key, **kwargs
+                source_table,
+                destination_table,
+                dest_max_pk,
+                primary_key,
+                keyset_pagination=distinct_check,
+                **kwargs,
             )
 
             logger.info("Copied %s new rows to %s.", rows_copied, destination_table)
@@ -208,10 +342,24 @@ class DBSync:
 
         logger.info(f"{source_table} synced to {destination_table}.")
 
-    def copy_rows(self, source_table_name, destination_table_name, cutoff, order_by, **kwargs):
+    def copy_rows(
+        self,
+        source_table_name,
+        destination_table_name,
+        cutoff,
+        order_by,
+        keyset_pagination=False,
+        **kwargs,
+    ):
         """
         Copy the rows from the source to the destination.
 
+        When a ``cutoff`` is provided, or ``keyset_pagination`` is set, each chunk is read
+        by the last value of ``order_by`` read rather than with an ever-growing ``OFFSET``.
+        With ``keyset_pagination``, each chunk starts after that value, so ``order_by`` must
+        hold unique values. Otherwise, each chunk starts at that value and skips the rows
+        with it that were already copied, so duplicate values are copied correctly.
+
         Args:
             source_table_name: str
                 Full table path (e.g. ``my_schema.my_table``)
@@ -221,6 +369,10 @@ class DBSync:
                 Start value to use as a minimum for incremental updates.
             order_by:
                 Column to use to order the data to ensure a stable sort.
+            keyset_pagination: bool
+                Page through the source table by the last value of ``order_by`` read,
+                even when there is no ``cutoff``. Only set this when ``order_by`` is known
+                to hold unique values.
             `**kwargs`: args
                 Optional copy arguments for destination database.
 
@@ -228,6 +380,40 @@ class DBSync:
         # Create the table objects
         source_table = self.source_db.table(source_table_name)
 
+        return self._copy_rows(
+            source_table,
+            destination_table_name,
+            cutoff,
+            order_by,
+            keyset_pagination=keyset_pagination,
+            **kwargs,
+        )
+
+    def _copy_rows(
+        self,
+        source_table,
+        destination_table_name,
+        cutoff,
+        order_by,
+        keyset_pagination=False,
+        **kwargs,
+    ):
+        """
+        Copy the rows from a source table object to the destination.
+
+        Takes the same arguments as ``copy_rows``, except that ``source_table`` is a table
+        object (such as a partition of a table) rather than a table name.
+        """
+        if self.pipeline:
+            return self._copy_rows_pipelined(
+                source_table,
+                destination_table_name,
+                cutoff,
+                order_by,
+                keyset_pagination=keyset_pagination,
+                **kwargs,
+            )
+
         # Initialize the Parsons table we will use to store rows before writing
         buffer = Table()
 
@@ -238,18 +424,25 @@ class DBSync:
         total_rows_written = 0
         rows_buffered = 0
 
+        # Page by key value: each chunk starts from the last key value we've read (or the
+        # incremental cutoff, for the first chunk)
+        page_by_key = keyset_pagination or bool(cutoff)
+        last_value = cutoff
+        repeated_rows = 0
+
         # Keep going until we break out
         while True:
             try:
                 # Get the records to load into the database
-                if cutoff:
-                    # If we have a cutoff, we are loading data incrementally -- filter out
-                    # any data before our cutoff
+                if page_by_key:
+                    # Filter out any data before the last key we've read, skipping the rows
+                    # with that key that are already copied
                     rows = source_table.get_new_rows(
                         primary_key=order_by,
-                        cutoff_value=cutoff,
-                        offset=total_rows_downloaded,
+                        cutoff_value=last_value,
+                        offset=repeated_rows,
                         chunk_size=self.read_chunk_size,
+                        inclusive=repeated_rows > 0,
                     )
                 else:
                     # Get a chunk
@@ -262,6 +455,11 @@ class DBSync:
                 number_of_rows = rows.num_rows
                 total_rows_downloaded += number_of_rows
 
+                if page_by_key and number_of_rows:
+                    last_value, repeated_rows = self._next_page_start(
+                        rows, order_by, last_value, repeated_rows, unique=keyset_pagination
+                    )
+
                 # If we didn't get any data, exit the loop -- there's nothing to load
                 if number_of_rows == 0:
                     # If we have any rows that are unwritten, flush them to the destination database
@@ -310,6 +508,276 @@ class DBSync:
 
         return total_rows_written
 
+    def _copy_rows_pipelined(
+        self,
+        source_table,
+        destination_table_name,
+        cutoff,
+        order_by,
+        keyset_pagination=False,
+        **kwargs,
+    ):
+        """
+        Copy the rows from the source to the destination, with reader threads pulling chunks
+        from the source while writer threads load previous chunks into the destination.
+
+        Takes the same arguments as ``_copy_rows``.
+        """
+        page_by_key = keyset_pagination or bool(cutoff)
+        reader_threads = 1 if page_by_key else self.reader_threads
+
+        chunks = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        read_stats = _StageStats("Read")
+        write_stats = _StageStats("Write")
+
+        # The first write may need to create the destination table, so it must not race
+        # with any other write.
+        first_write_lock = threading.Lock()
+        first_write_done = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def get():
+            while not stop.is_set():
+                try:
+                    return chunks.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _END_OF_DATA
+
+        def read(reader_index):
+            last_value = cutoff
+            repeated_rows = 0
+            chunk_index = reader_index
+
+            while not stop.is_set():
+                start = time.monotonic()
+                if page_by_key:
+                    rows = self._with_retries(
+                        source_table.get_new_rows,
+                        primary_key=order_by,
+                        cutoff_value=last_value,
+                        offset=repeated_rows,
+                        chunk_size=self.read_chunk_size,
+                        inclusive=repeated_rows > 0,
+                    )
+                else:
+                    rows = self._with_retries(
+                        source_table.get_rows,
+                        offset=chunk_index * self.read_chunk_size,
+                        chunk_size=self.read_chunk_size,
+                        order_by=order_by,
+                    )
+                number_of_rows = rows.num_rows
+                read_stats.add(number_of_rows, time.monotonic() - start)
+
+                if number_of_rows == 0:
+                    return
+
+                if page_by_key:
+                    last_value, repeated_rows = self._next_page_start(
+                        rows, order_by, last_value, repeated_rows, unique=keyset_pagination
+                    )
+
+                put((rows, number_of_rows))
+
+                # A short chunk means we've reached the end of the table
+                if number_of_rows < self.read_chunk_size:
+                    return
+
+                chunk_index += reader_threads
+
+        def flush(buffer, rows_buffered):
+            logger.debug("Copying %s rows to %s", rows_buffered, destination_table_name)
+            start = time.monotonic()
+
+            lock = nullcontext() if first_write_done.is_set() else first_write_lock
+            with lock:
+                self._with_retries(
+                    self.dest_db.copy, buffer, destination_table_name, if_exists="append", **kwargs
+                )
+                first_write_done.set()
+
+            write_stats.add(rows_buffered, time.monotonic() - start)
+
+        def write():
+            buffer = Table()
+            rows_buffered = 0
+            rows_written = 0
+
+            while (item := get()) is not _END_OF_DATA:
+                rows, number_of_rows = item
+                buffer.concat(rows)
+                rows_buffered += number_of_rows
+
+                if rows_buffered >= self.write_chunk_size:
+                    flush(buffer, rows_buffered)
+                    rows_written += rows_buffered
+                    buffer = Table()
+                    rows_buffered = 0
+
+            if rows_buffered > 0 and not stop.is_set():
+                flush(buffer, rows_buffered)
+                rows_written += rows_buffered
+
+            return rows_written
+
+        def run(stage, *args):
+            try:
+                return stage(*args)
+            except Exception:
+                # Shut the rest of the pipeline down
+                stop.set()
+                raise
+
+        start = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=reader_threads + self.writer_threads) as executor:
+            readers = [executor.submit(run, read, i) for i in range(reader_threads)]
+            writers = [executor.submit(run, write) for _ in range(self.writer_threads)]
+
+            try:
+                for reader in readers:
+                    reader.result()
+            finally:
+                for _ in writers:
+                    put(_END_OF_DATA)
+
+            total_rows_written = sum(writer.result() for writer in writers)
+
+        wall_seconds = time.monotonic() - start
+        read_stats.log(wall_seconds)
+        write_stats.log(wall_seconds)
+
+        return total_rows_written
+
+    def _copy_partitions(
+        self,
+        source_tbl,
+        destination_table_name,
+        partitions,
+        partition_column,
+        order_by,
+        keyset_pagination=False,
+        verify_row_count=True,
+        **kwargs,
+    ):
+        """
+        Split the source table into ranges of ``partition_column`` and copy each range to the
+        destination concurrently. Returns the total number of rows copied.
+        """
+        min_value, max_value = source_tbl.get_min_max(partition_column)
+
+        if min_value is None:
+            logger.info("No values found for %s; there is nothing to copy.", partition_column)
+            return 0
+
+        bounds = _partition_bounds(min_value, max_value, partitions)
+        logger.info("Copying %s partitions of %s", len(bounds), partition_column)
+
+        def copy_partition(index):
+            lower, upper, include_upper = bounds[index]
+            partition = {
+                "column": partition_column,
+                "lower": lower,
+                "upper": upper,
+                "include_upper": include_upper,
+                # Rows without a partition value go along with the first partition, unless
+                # the partition column is also the keyset, which can't page over nulls
+                "include_null": index == 0
+                and not (keyset_pagination and partition_column == order_by),
+            }
+
+            source_partition = source_tbl.partition(**partition)
+            copied_rows = self._copy_rows(
+                source_partition,
+                destination_table_name,
+                None,
+                order_by,
+                keyset_pagination=keyset_pagination,
+                **kwargs,
+            )
+            logger.debug("Copied %s rows for %s partition %s", copied_rows, partition_column, index)
+
+            if verify_row_count:
+                destination_partition = self.dest_db.table(destination_table_name).partition(
+                    **partition
+                )
+                if not self._row_count_verify(source_partition, destination_partition):
+                    logger.warning("Row count mismatch in partition %s to %s", lower, upper)
+
+            return copied_rows
+
+        indexes = list(range(len(bounds)))
+        total_rows_copied = 0
+
+        # If the destination doesn't exist yet, the first copy will create it, so it must
+        # not race with the other partitions.
+        if not self.dest_db.table(destination_table_name).exists:
+            total_rows_copied += copy_partition(indexes.pop(0))
+
+        if indexes:
+            with ThreadPoolExecutor(max_workers=len(indexes)) as executor:
+                total_rows_copied += sum(executor.map(copy_partition, indexes))
+
+        return total_rows_copied
+
+    @staticmethod
+    def _last_key_value(rows, key):
+        """Get the key value to start the next chunk after, when using keyset pagination."""
+        last_value = rows.column_data(key)[-1]
+
+        if last_value is None:
+            raise ValueError(
+                f"Column {key} contains null values, so it can't be used to page through "
+                "the source table."
+            )
+
+        return last_value
+
+    @classmethod
+    def _next_page_start(cls, rows, key, last_value, repeated_rows, unique):
+        """
+        Get the key value the next chunk starts from, and the number of rows with that value
+        that have already been read and need to be skipped.
+
+        Unless the key is known to be unique, rows sharing the last value of a chunk may
+        continue into the next one, so the next chunk is read from that value onward
+        (with ``>=``) rather than after it.
+        """
+        next_value = cls._last_key_value(rows, key)
+
+        if unique:
+            return next_value, 0
+
+        values = rows.column_data(key)
+        if repeated_rows and next_value == last_value:
+            return last_value, repeated_rows + len(values)
+
+        return next_value, sum(1 for value in values if value == next_value)
+
+    def _with_retries(self, func, *args, **kwargs):
+        """Call ``func``, retrying up to ``self.retries`` times if it raises an error."""
+        retries_left = self.retries
+
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                if retries_left == 0:
+                    logger.debug("No retries remaining")
+                    raise
+
+                retries_left -= 1
+                logger.exception("Unhandled error copying data; retrying")
+
     @staticmethod
     def _check_column_match(source_table_obj, destination_table_obj):
         """Ensure that the columns from each table match"""
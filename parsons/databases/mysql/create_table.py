@@ -1,7 +1,5 @@
 import logging
 
-import petl
-
 import parsons.databases.mysql.constants as consts
 from parsons.databases.database.database import DatabaseCreateStatement
 
@@ -42,7 +40,7 @@ class MySQLCreateTable(DatabaseCreateStatement):
 
             # Calculate width if a varchar
             if col_type == "varchar":
-                row_width = len(str(row.encode("utf-8")))
+                row_width = len(str(row).encode("utf-8"))
 
                 # Evaluate width vs. current max width
                 if row_width > col_width:
@@ -54,11 +52,14 @@ class MySQLCreateTable(DatabaseCreateStatement):
         # Generate a dict of MySQL column types and widths for all columns
         # in a table.
 
+        # Every value is typed; MySQL treats empty strings as varchar rather than null.
+        profile = self.profile_columns(tbl, skip_values=())
+
         table_map = []
 
-        for col in tbl.columns:
-            col_type, col_width = self.evaluate_column(tbl.column_data(col))
-            col_map = {"name": col, "type": col_type, "width": col_width}
+        for col in profile:
+            col_width = col.max_width if col.type == "varchar" else 0
+            col_map = {"name": col.name, "type": col.type, "width": col_width}
             table_map.append(col_map)
 
         return table_map
@@ -67,7 +68,7 @@ class MySQLCreateTable(DatabaseCreateStatement):
         # Generate create statement SQL for a given Parsons table.
 
         # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.columns_convert(tbl.columns))
+        self.set_column_names(tbl, self.columns_convert(tbl.columns))
 
         # Generate the table map
         table_map = self.evaluate_table(tbl)
@@ -1,3 +1,4 @@
+import itertools
 import logging
 import pickle
 from contextlib import contextmanager
@@ -21,6 +22,18 @@ QUERY_BATCH_SIZE = 100000
 
 logger = logging.getLogger(__name__)
 
+# Escapes for MySQL's native LOAD DATA format (tab separated, backslash escaped)
+_INFILE_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+def _infile_value(value):
+    # Render a value as a LOAD DATA field. \N is read as NULL.
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return str(int(value))
+    return str(value).translate(_INFILE_ESCAPES)
+
 
 class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
     """
@@ -59,7 +72,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         self.timeout = timeout
 
     @contextmanager
-    def connection(self):
+    def connection(self, allow_local_infile=False):
         """
         Generate a MySQL connection. The connection is set up as a python "context manager", so
         it will be closed automatically (and all queries committed) when the connection goes out
@@ -69,6 +82,11 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         any context manager):
         ``with mysql.connection() as conn:``
 
+        Args:
+            allow_local_infile: bool
+                Allow ``LOAD DATA LOCAL INFILE`` statements on this connection. Defaults
+                to ``False``.
+
         Yields:
             MySQL `connection` object
 
@@ -81,6 +99,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
             database=self.db,
             port=self.port,
             connection_timeout=self.timeout,
+            allow_local_infile=allow_local_infile,
         )
 
         try:
@@ -212,15 +231,17 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         if_exists: Literal["fail", "append", "drop", "truncate"] = "fail",
         chunk_size: int = 1000,
         strict_length: bool = True,
+        load_data_local: bool = False,
     ):
         """
         Copy a :ref:`Table` to the database.
 
         .. note::
 
-            This method utilizes extended inserts rather `LOAD DATA INFILE` since
-            many MySQL Database configurations do not allow data files to be
-            loaded. It results in a minor performance hit compared to `LOAD DATA`.
+            By default, this method uses batched, parameterized inserts rather than
+            `LOAD DATA INFILE`, since many MySQL database configurations do not allow data
+            files to be loaded. If your server has ``local_infile`` enabled, pass
+            ``load_data_local=True`` for a faster load.
 
         Args:
             tbl: Table
@@ -231,47 +252,82 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 If the table already exists, either ``fail``, ``append``, ``drop``
                 or ``truncate`` the table.
             chunk_size: int
-                The number of rows to insert per query.
+                The number of rows to insert per batch. Ignored if ``load_data_local``
+                is ``True``.
             strict_length: bool
                 If the database table needs to be created, strict_length determines whether
                 the created table's column sizes will be sized to exactly fit the current data,
                 or if their size will be rounded up to account for future values being larger
                 then the current dataset. defaults to ``True``
+            load_data_local: bool
+                Load the data with ``LOAD DATA LOCAL INFILE``. The table is written to a
+                temp file in MySQL's native tab-separated format and sent to the server in
+                a single statement. Requires ``local_infile`` to be enabled on the server.
+                Defaults to ``False``.
 
         """
-        if tbl.num_rows == 0:
+        if not tbl:
             logger.info("Parsons table is empty. Table will not be created.")
             return None
 
-        with self.connection() as connection:
+        with self.connection(allow_local_infile=load_data_local) as connection:
             # Create table if not exists
             if self._create_table_precheck(connection, table_name, if_exists):
                 sql = self.create_statement(tbl, table_name, strict_length=strict_length)
                 self.query_with_connection(sql, connection, commit=False)
                 logger.info(f"Table {table_name} created.")
 
-            # Chunk tables in batches of 1K rows, though this can be tuned and
-            # optimized further.
-            for t in tbl.chunk(chunk_size):
-                sql = self._insert_statement(t, table_name)
-                self.query_with_connection(sql, connection, commit=False)
+            if load_data_local:
+                row_count = self._load_data_local(tbl, table_name, connection)
+            else:
+                row_count = self._insert_rows(tbl, table_name, connection, chunk_size)
 
-    def _insert_statement(self, tbl, table_name):
-        """Convert the table data into a string for bulk importing."""
-        # Single column tables
-        if len(tbl.columns) == 1:
-            values = [f"({row[0]})" for row in tbl.data]
+            logger.info(f"{row_count} rows copied to {table_name}.")
 
-        # Multi-column tables
-        else:
-            values = [str(row) for row in tbl.data]
+    def _insert_rows(self, tbl, table_name, connection, chunk_size):
+        """Insert the table data in batches with a parameterized statement."""
+        placeholders = ", ".join(["%s"] * len(tbl.columns))
+        sql = f"INSERT INTO {table_name} ({','.join(tbl.columns)}) VALUES ({placeholders})"
+
+        row_count = 0
+        rows = iter(tbl.data)
 
-        # Create full insert statement
-        sql = f"""INSERT INTO {table_name}
-                  ({",".join(tbl.columns)})
-                  VALUES {",".join(values)};"""
+        with self.cursor(connection) as cursor:
+            while True:
+                batch = list(itertools.islice(rows, chunk_size))
+                if not batch:
+                    break
+
+                # The connector escapes each value and sends the batch as a single
+                # multi-row insert.
+                cursor.executemany(sql, batch)
+                row_count += len(batch)
+                logger.debug(f"Inserted {row_count} rows.")
+
+        return row_count
+
+    def _load_data_local(self, tbl, table_name, connection):
+        """Load the table data with ``LOAD DATA LOCAL INFILE``."""
+        local_path = files.create_temp_file(suffix=".tsv")
+
+        row_count = 0
+        with Path(local_path).open(mode="w", encoding="utf-8", newline="") as f:
+            for row in tbl.data:
+                f.write("\t".join(_infile_value(v) for v in row) + "\n")
+                row_count += 1
+
+        sql = f"""LOAD DATA LOCAL INFILE '{local_path}'
+                  INTO TABLE {table_name}
+                  CHARACTER SET utf8mb4
+                  FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+                  LINES TERMINATED BY '\\n'
+                  ({",".join(tbl.columns)})"""
+
+        with self.cursor(connection) as cursor:
+            logger.debug(f"SQL Query: {sql}")
+            cursor.execute(sql)
 
-        return sql
+        return row_count
 
     def _create_table_precheck(
         self, connection, table_name, if_exists: Literal["fail", "append", "drop", "truncate"]
@@ -97,9 +97,13 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
 
             sql = f"""COPY "{table_name}" ("{'","'.join(tbl.columns)}") FROM STDIN CSV HEADER;"""
 
-            with self.cursor(connection) as cursor, Path(tbl.to_csv()).open() as f:
-                cursor.copy_expert(sql, f)
-                logger.info(f"{tbl.num_rows} rows copied to {table_name}.")
+            # Stream the rows to the server as CSV while they are being read from the table,
+            # rather than writing the whole table to a temp file first.
+            stream = tbl.to_csv_stream()
+
+            with self.cursor(connection) as cursor:
+                cursor.copy_expert(sql, stream)
+                logger.info(f"{stream.row_count} rows copied to {table_name}.")
 
     def table(self, table_name):
         # Return a Postgres table object
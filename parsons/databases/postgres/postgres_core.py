@@ -1,16 +1,14 @@
 import logging
-import pickle
+import uuid
 from contextlib import contextmanager
-from pathlib import Path
 from typing import Literal
 
-import petl
 import psycopg2
 import psycopg2.extras
 
 from parsons.databases.postgres.postgres_create_statement import PostgresCreateStatement
+from parsons.databases.query_results import cursor_to_table, iter_cursor_tables
 from parsons.etl.table import Table
-from parsons.utilities import files
 
 # Max number of rows that we query at a time, so we can avoid loading huge
 # data sets into memory.
@@ -57,8 +55,8 @@ class PostgresCore(PostgresCreateStatement):
             conn.close()
 
     @contextmanager
-    def cursor(self, connection):
-        cur = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
+    def cursor(self, connection, name=None):
+        cur = connection.cursor(name=name, cursor_factory=psycopg2.extras.DictCursor)
 
         try:
             yield cur
@@ -105,6 +103,41 @@ class PostgresCore(PostgresCreateStatement):
         with self.connection() as connection:
             return self.query_with_connection(sql, connection, parameters=parameters)
 
+    def query_iter(self, sql: str, parameters: list | None = None, batch_size=QUERY_BATCH_SIZE):
+        """
+        Execute a query against the database and lazily yield the results in batches.
+
+        The query runs on a server-side (named) cursor, so rows are only transferred as each
+        batch is requested and nothing is written to a temp file. This is useful for streaming
+        large result sets through a transformation or into another database.
+
+        .. code-block:: python
+
+            for batch in pg.query_iter("SELECT * FROM my_large_table", batch_size=50000):
+                rs.copy(batch, "my_schema.my_large_table", if_exists="append")
+
+        Args:
+            sql: str
+                A valid SQL statement that returns rows
+            parameters: list
+                A list of python variables to be converted into SQL values in your query
+            batch_size: int
+                The maximum number of rows in each yielded table
+
+        Yields:
+            Table
+                See :ref:`Table` for output options.
+
+        """
+        with (
+            self.connection() as connection,
+            self.cursor(connection, name=f"parsons_{uuid.uuid4().hex}") as cursor,
+        ):
+            logger.debug(f"SQL Query: {sql}")
+            cursor.execute(sql, parameters)
+
+            yield from iter_cursor_tables(cursor, batch_size)
+
     def query_with_connection(self, sql, connection, parameters=None, commit=True):
         """
         Execute a query against the database, with an existing connection. Useful for batching
@@ -140,28 +173,7 @@ class PostgresCore(PostgresCreateStatement):
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
-                # all the type information for each field.)
-
-                temp_file = files.create_temp_file()
-
-                with Path(temp_file).open(mode="wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
-
-                    while True:
-                        batch = cursor.fetchmany(QUERY_BATCH_SIZE)
-                        if not batch:
-                            break
-
-                        logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
-
-                # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = cursor_to_table(cursor, QUERY_BATCH_SIZE)
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
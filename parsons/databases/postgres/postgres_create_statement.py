@@ -1,7 +1,5 @@
 import logging
 
-import petl
-
 import parsons.databases.postgres.constants as consts
 from parsons.databases.database.database import DatabaseCreateStatement
 
@@ -65,7 +63,7 @@ class PostgresCreateStatement(DatabaseCreateStatement):
             raise ValueError("Table is empty. Must have 1 or more rows.")
 
         # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
+        self.set_column_names(tbl, self.column_name_validate(tbl.columns))
 
         mapping = self.generate_data_types(tbl)
 
@@ -103,38 +101,15 @@ class PostgresCreateStatement(DatabaseCreateStatement):
         return self.is_valid_sql_num(val)
 
     def generate_data_types(self, table):
-        # Generate column data types
-
-        longest, type_list = [], []
-
-        cont = petl.records(table.table)
-
-        # Populate empty values for the columns
-        for _col in table.columns:
-            longest.append(0)
-            type_list.append("")
-
-        for row in cont:
-            for i in range(len(row)):
-                # NA is the csv null value
-                if type_list[i] == "varchar" or row[i] in ["NA", ""]:
-                    pass
-                else:
-                    var_type = self.data_type(row[i], type_list[i])
-                    type_list[i] = var_type
-
-                # Calculate width
-                width = len(str(row[i]).encode("utf-8"))
-                if width > longest[i]:
-                    longest[i] = width
-
-        # In L140 'NA' and '' will be skipped
-        # If the entire column is either one of those (or a mix of the two)
-        # the type will be empty.
+        # Generate column data types and widths in a single pass over the table.
+        # NA and '' are the csv null values, and are skipped when detecting types.
+        profile = self.profile_columns(table)
+
+        # If an entire column is null values the type will be empty.
         # Fill with a default varchar
-        type_list = [typ or "varchar" for typ in type_list]
+        type_list = [typ or "varchar" for typ in profile.types]
 
-        return {"longest": longest, "headers": table.columns, "type_list": type_list}
+        return {"longest": profile.max_widths, "headers": table.columns, "type_list": type_list}
 
     def vc_padding(self, mapping, padding):
         # Pad the width of a varchar column
@@ -0,0 +1,97 @@
+import logging
+import pickle
+from pathlib import Path
+
+import petl
+
+from parsons.etl.table import Table
+from parsons.utilities import files
+
+logger = logging.getLogger(__name__)
+
+
+class BatchPickleView(petl.Table):
+    """
+    A petl view over a file written by :func:`cursor_to_table`. The file holds a pickled
+    header followed by one pickled list of rows per fetched batch, which is much cheaper to
+    write and read than pickling every row individually.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def __iter__(self):
+        with Path(self.file_path).open(mode="rb") as f:
+            yield tuple(pickle.load(f))
+
+            while True:
+                try:
+                    batch = pickle.load(f)
+                except EOFError:
+                    return
+                yield from batch
+
+
+def cursor_to_table(cursor, batch_size):
+    """
+    Fetch all results from an executed cursor into a ``Table`` backed by a temp file.
+
+    The rows are fetched ``batch_size`` at a time and each batch is pickled as a single
+    object. (We pickle rather than writing to, say, a CSV, so that we maintain all the type
+    information for each field.)
+
+    Args:
+        cursor: obj
+            A DB-API cursor on which a query returning rows has been executed
+        batch_size: int
+            The number of rows to fetch at a time
+
+    Returns:
+        Table
+            See :ref:`Table` for output options.
+
+    """
+    temp_file = files.create_temp_file()
+
+    with Path(temp_file).open(mode="wb") as f:
+        # Grab the header
+        header = [i[0] for i in cursor.description]
+        pickle.dump(header, f)
+
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+
+            logger.debug(f"Fetched {len(batch)} rows.")
+            pickle.dump([tuple(row) for row in batch], f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return Table(BatchPickleView(temp_file))
+
+
+def iter_cursor_tables(cursor, batch_size):
+    """
+    Lazily fetch results from an executed cursor as a series of in-memory ``Table`` objects.
+
+    Nothing is written to disk; each yielded ``Table`` holds at most ``batch_size`` rows.
+    The header is read after the first fetch, since server-side (named) cursors don't
+    populate ``cursor.description`` until data has been requested.
+
+    Args:
+        cursor: obj
+            A DB-API cursor on which a query returning rows has been executed
+        batch_size: int
+            The number of rows to fetch at a time
+
+    Yields:
+        Table
+
+    """
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            return
+
+        logger.debug(f"Fetched {len(batch)} rows.")
+        header = [i[0] for i in cursor.description]
+        yield Table([header, *(tuple(row) for row in batch)])
@@ -1,25 +1,28 @@
 import datetime
-import json
 import logging
-import pickle
 import random
+import uuid
 from contextlib import contextmanager
-from pathlib import Path
 from typing import Any, Literal
 
-import petl
 import psycopg2
 import psycopg2.extras
 
 from parsons.databases.alchemy import Alchemy
 from parsons.databases.database_connector import DatabaseConnector
-from parsons.databases.redshift.rs_copy_table import RedshiftCopyTable
+from parsons.databases.query_results import cursor_to_table, iter_cursor_tables
+from parsons.databases.redshift.rs_copy_table import (
+    RedshiftCopyTable,
+    build_manifest,
+    put_manifest,
+)
 from parsons.databases.redshift.rs_create_table import RedshiftCreateTable
 from parsons.databases.redshift.rs_schema import RedshiftSchema
 from parsons.databases.redshift.rs_table_utilities import RedshiftTableUtilities
+from parsons.databases.row_hash_index import RowHashIndex
 from parsons.databases.table import BaseTable
 from parsons.etl.table import Table
-from parsons.utilities import check_env, files, sql_helpers
+from parsons.utilities import check_env, sql_helpers
 
 # Max number of rows that we query at a time, so we can avoid loading huge
 # data sets into memory.
@@ -72,6 +75,9 @@ class Redshift(
             Controls use of the ``AWS_SESSION_TOKEN`` environment variable for S3. Defaults
             to ``True``. Set to ``False`` in order to ignore the ``AWS_SESSION_TOKEN`` environment
             variable even if the ``aws_session_token`` argument was not passed in.
+        s3_transfer_config: dict or boto3.s3.transfer.TransferConfig
+            Controls the part size and concurrency of uploads to the S3 temp bucket. See
+            :class:`~parsons.S3`.
 
     """
 
@@ -88,6 +94,7 @@ class Redshift(
         aws_secret_access_key=None,
         iam_role=None,
         use_env_token=True,
+        s3_transfer_config=None,
     ):
         super().__init__()
 
@@ -107,6 +114,7 @@ class Redshift(
             self.s3_temp_bucket = split_temp_bucket_name[0]
             self.s3_temp_bucket_prefix = split_temp_bucket_name[1]
         self.use_env_token = use_env_token
+        self.s3_transfer_config = s3_transfer_config
         # We don't check/load the environment variables for aws_* here
         # because the logic in S3() and rs_copy_table.py does already.
         self.aws_access_key_id = aws_access_key_id
@@ -145,8 +153,8 @@ class Redshift(
             conn.close()
 
     @contextmanager
-    def cursor(self, connection):
-        cur = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
+    def cursor(self, connection, name=None):
+        cur = connection.cursor(name=name, cursor_factory=psycopg2.extras.DictCursor)
         try:
             yield cur
         finally:
@@ -200,6 +208,48 @@ class Redshift(
         with self.connection() as connection:
             return self.query_with_connection(sql, connection, parameters=parameters)
 
+    def query_iter(
+        self,
+        sql: str,
+        parameters: list[Any] | dict[str, Any] | None = None,
+        batch_size=QUERY_BATCH_SIZE,
+    ):
+        """
+        Execute a query against the Redshift database and lazily yield the results in batches.
+
+        The query runs on a server-side (named) cursor, so rows are only transferred as each
+        batch is requested and nothing is written to a temp file. This is useful for streaming
+        large result sets through a transformation or into another database. For very large
+        extracts, :meth:`unload` is usually faster still.
+
+        .. code-block:: python
+
+            for batch in rs.query_iter("SELECT * FROM my_large_table", batch_size=50000):
+                pg.copy(batch, "my_schema.my_large_table", if_exists="append")
+
+        Args:
+            sql: str
+                A valid SQL statement that returns rows
+            parameters: list | dict[str, Any]
+                A list of python variables to be converted into SQL values in your query.
+                Or a dict.
+            batch_size: int
+                The maximum number of rows in each yielded table
+
+        Yields:
+            Table
+                See :ref:`Table` for output options.
+
+        """
+        with (
+            self.connection() as connection,
+            self.cursor(connection, name=f"parsons_{uuid.uuid4().hex}") as cursor,
+        ):
+            logger.debug(f"SQL Query: {sql}")
+            cursor.execute(sql, parameters)
+
+            yield from iter_cursor_tables(cursor, batch_size)
+
     def query_with_connection(
         self,
         sql,
@@ -246,28 +296,7 @@ class Redshift(
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
-                # all the type information for each field.)
-
-                temp_file = files.create_temp_file()
-
-                with Path(temp_file).open(mode="wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
-
-                    while True:
-                        batch = cursor.fetchmany(QUERY_BATCH_SIZE)
-                        if not batch:
-                            break
-
-                        logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
-
-                # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = cursor_to_table(cursor, QUERY_BATCH_SIZE)
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
@@ -508,6 +537,8 @@ class Redshift(
         temp_bucket_region: str | None = None,
         strict_length: bool = True,
         csv_encoding: str = "utf-8",
+        single_pass: bool = False,
+        parts: int = 1,
     ):
         """
         Copy a :ref:`Table` to Redshift.
@@ -622,6 +653,17 @@ class Redshift(
             csv_ecoding: str
                 String encoding to use when writing the temporary CSV file that is uploaded to S3.
                 Defaults to 'utf-8'.
+            single_pass: boolean
+                Read ``tbl`` only once. The table is uploaded to S3 first, and its column
+                types and widths are profiled on the way, so the create statement and any
+                ``alter_table`` changes are worked out from that profile instead of from
+                further passes over the data. Useful for lazy tables that are expensive to
+                read, such as the result of a long chain of transformations.
+            parts: int
+                The number of gzipped CSV files to split the table between. The files are
+                uploaded to S3 concurrently and loaded by a single COPY with a manifest, so
+                that every slice of the cluster loads data in parallel. Use a multiple of
+                the number of slices in the cluster (see :meth:`get_slice_count`).
 
         Returns:
             Table or ``None``
@@ -631,43 +673,61 @@ class Redshift(
         # Specify the columns for a copy statement.
         cols = tbl.columns if specifycols or specifycols is None and template_table else None
 
+        if parts < 1:
+            raise ValueError("parts must be at least 1.")
+
+        upload_args = {
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key,
+            "csv_encoding": csv_encoding,
+            "parts": parts,
+        }
+        key = None
+
         with self.connection() as connection:
-            # Check to see if the table exists. If it does not or if_exists = drop, then
-            # create the new table.
-            if self._create_table_precheck(connection, table_name, if_exists):
-                if template_table:
-                    # Copy the schema from the template table
-                    sql = f"CREATE TABLE {table_name} (LIKE {template_table})"
-                else:
-                    sql = self.create_statement(
-                        tbl,
-                        table_name,
-                        padding=padding,
-                        distkey=distkey,
-                        sortkey=sortkey,
-                        varchar_max=varchar_max,
-                        columntypes=columntypes,
-                        strict_length=strict_length,
-                    )
-                self.query_with_connection(sql, connection, commit=False)
-                logger.info(f"{table_name} created.")
+            try:
+                # Check to see if the table exists. If it does not or if_exists = drop, then
+                # we'll create the new table.
+                create_table = self._create_table_precheck(connection, table_name, if_exists)
+
+                if single_pass:
+                    if alter_table or create_table and not template_table:
+                        # Rename the columns as the create statement and width checks would,
+                        # so the profile is cached for the table they see.
+                        self.set_column_names(tbl, self.column_name_validate(tbl.columns))
+                        key = self.temp_s3_copy(self.profiling_view(tbl), **upload_args)
+                    else:
+                        key = self.temp_s3_copy(tbl, **upload_args)
 
-            # If alter_table is True, then alter table if the table column widths
-            # are wider than the existing table.
-            if alter_table:
-                self.alter_varchar_column_widths(
-                    tbl, table_name, drop_dependencies=alter_table_cascade
-                )
+                if create_table:
+                    if template_table:
+                        # Copy the schema from the template table
+                        sql = f"CREATE TABLE {table_name} (LIKE {template_table})"
+                    else:
+                        sql = self.create_statement(
+                            tbl,
+                            table_name,
+                            padding=padding,
+                            distkey=distkey,
+                            sortkey=sortkey,
+                            varchar_max=varchar_max,
+                            columntypes=columntypes,
+                            strict_length=strict_length,
+                        )
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.info(f"{table_name} created.")
+
+                # If alter_table is True, then alter table if the table column widths
+                # are wider than the existing table.
+                if alter_table:
+                    self.alter_varchar_column_widths(
+                        tbl, table_name, drop_dependencies=alter_table_cascade
+                    )
 
-            # Upload the table to S3
-            key = self.temp_s3_copy(
-                tbl,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                csv_encoding=csv_encoding,
-            )
+                # Upload the table to S3
+                if key is None:
+                    key = self.temp_s3_copy(tbl, **upload_args)
 
-            try:
                 # Copy to Redshift database.
                 copy_args = {
                     "max_errors": max_errors,
@@ -687,6 +747,7 @@ class Redshift(
                     "aws_secret_access_key": aws_secret_access_key,
                     "compression": "gzip",
                     "bucket_region": temp_bucket_region,
+                    "manifest": parts > 1,
                 }
 
                 # Copy from S3 to Redshift
@@ -729,6 +790,10 @@ class Redshift(
         to export data as it can export in parallel and directly into an S3 bucket. Consider
         using this for exports of 10MM or more rows.
 
+        To read the unloaded parts back into a :ref:`Table`, unload with ``header=True`` and
+        use :meth:`~parsons.etl.tofrom.ToFrom.from_s3_csv` on the key prefix (ending in
+        ``/``) or the manifest, which downloads the parts concurrently.
+
         sql: str
             The SQL string to execute to generate the data to unload.
         bucket: str
@@ -946,23 +1011,14 @@ class Redshift(
         manifest = {"entries": []}
         for bucket in buckets:
             # Retrieve list of files in bucket
-            key_list = s3.list_keys(bucket, prefix=prefix)
-            for key in key_list:
-                manifest["entries"].append(
-                    {"url": "/".join(["s3:/", bucket, key]), "mandatory": mandatory}
-                )
+            keys = [key["Key"] for key in s3.iter_keys(bucket, prefix=prefix)]
+            manifest["entries"] += build_manifest(bucket, keys, mandatory)["entries"]
 
         logger.info("Manifest generated.")
 
         # Save the file to s3 bucket if provided
         if manifest_key and manifest_bucket:
-            # Dump the manifest to a temp JSON file
-            manifest_path = files.create_temp_file()
-            with Path(manifest_path).open(mode="w") as manifest_file_obj:
-                json.dump(manifest, manifest_file_obj, sort_keys=True, indent=4)
-
-            # Upload the file to S3
-            s3.put_file(manifest_bucket, manifest_key, manifest_path)
+            put_manifest(s3, manifest, manifest_bucket, manifest_key)
 
             logger.info(f"Manifest saved to s3://{manifest_bucket}/{manifest_key}")
 
@@ -981,6 +1037,7 @@ class Redshift(
         from_s3=False,
         distkey=None,
         sortkey=None,
+        hash_index=None,
         **copy_args,
     ):
         r"""
@@ -1022,6 +1079,13 @@ class Redshift(
             sortkey: str or list
                 The column name(s) of the sortkey.
                 If not provided, will default to ``primary_key``.
+            hash_index: str
+                The path to a local file in which to keep a hash of every upserted row
+                (see :class:`~parsons.databases.row_hash_index.RowHashIndex`). When set,
+                incoming rows that are unchanged since the last upsert with the same file
+                are skipped, and only new and changed rows are staged, deleted and
+                reinserted. The file only tracks changes made through it, so don't use it
+                if the target table is also modified by other means.
             `**copy_args`: kwargs
                 See :meth:`.copy` for options.
 
@@ -1033,110 +1097,139 @@ class Redshift(
         distkey = distkey or primary_keys[0]
         sortkey = sortkey or primary_key
 
-        if not self.table_exists(target_table):
-            logger.info(
-                "Target table does not exist. Copying into newly \
+        target_exists = self.table_exists(target_table)
+
+        index = None
+        if hash_index:
+            if from_s3:
+                raise ValueError("upsert(... from_s3=True) can't be used with a hash_index.")
+
+            index = RowHashIndex(hash_index, target_table)
+
+        try:
+            if index is not None:
+                if not target_exists:
+                    # Whatever the index remembers is no longer in the target table
+                    index.clear()
+
+                table_obj = index.changed_rows(table_obj, primary_keys)
+                if not table_obj:
+                    logger.info(f"No new or changed rows to upsert into {target_table}.")
+                    return None
+
+            if not target_exists:
+                logger.info(
+                    "Target table does not exist. Copying into newly \
                          created target table."
-            )
-            self.copy(table_obj, target_table, distkey=distkey, sortkey=sortkey)
-            return None
+                )
+                self.copy(table_obj, target_table, distkey=distkey, sortkey=sortkey)
+                if index is not None:
+                    index.commit()
+                return None
 
-        if alter_table and table_obj:
-            # Make target table column widths match incoming table, if necessary
-            self.alter_varchar_column_widths(
-                table_obj, target_table, drop_dependencies=alter_table_cascade
-            )
+            if alter_table and table_obj:
+                # Make target table column widths match incoming table, if necessary
+                self.alter_varchar_column_widths(
+                    table_obj, target_table, drop_dependencies=alter_table_cascade
+                )
 
-        noise = f"{random.randrange(0, 10000):04}"[:4]
-        date_stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
-        # Generate a temp table like "table_tmp_20200210_1230_14212"
-        staging_tbl = f"{target_table}_stg_{date_stamp}_{noise}"
-
-        if distinct_check:
-            primary_keys_statement = ", ".join(primary_keys)
-            diff = self.query(
-                f"""
-                select (
-                    select count(*)
-                    from {target_table}
-                ) - (
-                    SELECT COUNT(*) from (
-                        select distinct {primary_keys_statement}
+            noise = f"{random.randrange(0, 10000):04}"[:4]
+            date_stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+            # Generate a temp table like "table_tmp_20200210_1230_14212"
+            staging_tbl = f"{target_table}_stg_{date_stamp}_{noise}"
+
+            if distinct_check:
+                primary_keys_statement = ", ".join(primary_keys)
+                diff = self.query(
+                    f"""
+                    select (
+                        select count(*)
                         from {target_table}
-                    )
-                ) as total_count
-            """
-            ).first
-            if diff > 0:
-                raise ValueError("Primary key column contains duplicate values.")
-
-        with self.connection() as connection:
-            try:
-                # Copy to a staging table
-                logger.info(f"Building staging table: {staging_tbl}")
-                if "compupdate" not in copy_args:
-                    # Especially with a lot of columns, compupdate=True can
-                    # cause a lot of processing/analysis by Redshift before upload.
-                    # Since this is a temporary table, setting compression for each
-                    # column is not impactful barely impactful
-                    # https://docs.aws.amazon.com/redshift/latest/dg/c_Loading_tables_auto_compress.html
-                    copy_args = dict(copy_args, compupdate=False)
-
-                if from_s3:
-                    if table_obj is not None:
-                        raise ValueError(
-                            "upsert(... from_s3=True) requires the first argument (table_obj)"
-                            " to be None. from_s3 and table_obj are mutually exclusive."
+                    ) - (
+                        SELECT COUNT(*) from (
+                            select distinct {primary_keys_statement}
+                            from {target_table}
                         )
-                    self.copy_s3(staging_tbl, template_table=target_table, **copy_args)
-                else:
-                    self.copy(
-                        table_obj,
-                        staging_tbl,
-                        template_table=target_table,
-                        alter_table=False,  # We just did our own alter table above
-                        distkey=distkey,
-                        sortkey=sortkey,
-                        **copy_args,
-                    )
-
-                staging_table_name = staging_tbl.split(".")[1]
-                target_table_name = target_table.split(".")[1]
-
-                # Delete rows
-                comparisons = [
-                    f"{staging_table_name}.{primary_key} = {target_table_name}.{primary_key}"
-                    for primary_key in primary_keys
-                ]
-                where_clause = " and ".join(comparisons)
-
-                sql = f"""
-                       DELETE FROM {target_table}
-                       USING {staging_tbl}
-                       WHERE {where_clause}
-                       """
-                self.query_with_connection(sql, connection, commit=False)
-                logger.debug(f"Target rows deleted from {target_table}.")
+                    ) as total_count
+                """
+                ).first
+                if diff > 0:
+                    raise ValueError("Primary key column contains duplicate values.")
 
-                # Insert rows
-                # ALTER TABLE APPEND would be more efficient, but you can't run it in a
-                # transaction block. It's worth the performance hit to not commit until the
-                # end.
-                sql = f"""
-                       INSERT INTO {target_table}
-                       SELECT * FROM {staging_tbl};
-                       """
+            with self.connection() as connection:
+                try:
+                    # Copy to a staging table
+                    logger.info(f"Building staging table: {staging_tbl}")
+                    if "compupdate" not in copy_args:
+                        # Especially with a lot of columns, compupdate=True can
+                        # cause a lot of processing/analysis by Redshift before upload.
+                        # Since this is a temporary table, setting compression for each
+                        # column is not impactful barely impactful
+                        # https://docs.aws.amazon.com/redshift/latest/dg/c_Loading_tables_auto_compress.html
+                        copy_args = dict(copy_args, compupdate=False)
+
+                    if from_s3:
+                        if table_obj is not None:
+                            raise ValueError(
+                                "upsert(... from_s3=True) requires the first argument (table_obj)"
+                                " to be None. from_s3 and table_obj are mutually exclusive."
+                            )
+                        self.copy_s3(staging_tbl, template_table=target_table, **copy_args)
+                    else:
+                        self.copy(
+                            table_obj,
+                            staging_tbl,
+                            template_table=target_table,
+                            alter_table=False,  # We just did our own alter table above
+                            distkey=distkey,
+                            sortkey=sortkey,
+                            **copy_args,
+                        )
 
-                self.query_with_connection(sql, connection, commit=False)
-                logger.info(f"Target rows inserted to {target_table}")
+                    staging_table_name = staging_tbl.split(".")[1]
+                    target_table_name = target_table.split(".")[1]
+
+                    # Delete rows
+                    comparisons = [
+                        f"{staging_table_name}.{primary_key} = {target_table_name}.{primary_key}"
+                        for primary_key in primary_keys
+                    ]
+                    where_clause = " and ".join(comparisons)
+
+                    sql = f"""
+                           DELETE FROM {target_table}
+                           USING {staging_tbl}
+                           WHERE {where_clause}
+                           """
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.debug(f"Target rows deleted from {target_table}.")
+
+                    # Insert rows
+                    # ALTER TABLE APPEND would be more efficient, but you can't run it in a
+                    # transaction block. It's worth the performance hit to not commit until the
+                    # end.
+                    sql = f"""
+                           INSERT INTO {target_table}
+                           SELECT * FROM {staging_tbl};
+                           """
+
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.info(f"Target rows inserted to {target_table}")
+
+                finally:
+                    if cleanup_temp_table:
+                        # Drop the staging table
+                        self.query_with_connection(
+                            f"DROP TABLE IF EXISTS {staging_tbl};", connection, commit=False
+                        )
+                        logger.info(f"{staging_tbl} staging table dropped.")
 
-            finally:
-                if cleanup_temp_table:
-                    # Drop the staging table
-                    self.query_with_connection(
-                        f"DROP TABLE IF EXISTS {staging_tbl};", connection, commit=False
-                    )
-                    logger.info(f"{staging_tbl} staging table dropped.")
+            # The upsert has been committed, so the hashes of the rows it wrote can be saved
+            if index is not None:
+                index.commit()
+        finally:
+            if index is not None:
+                index.close()
 
         # Vacuum table. You must commit when running this type of transaction.
         if vacuum:
@@ -1195,7 +1288,7 @@ class Redshift(
 
         """
         # Make the Parsons table column names match valid Redshift names
-        tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
+        self.set_column_names(tbl, self.column_name_validate(tbl.columns))
 
         # Create a list of column names and max width for string values.
         pc = {c: tbl.get_column_max_width(c) for c in tbl.columns}
@@ -1248,6 +1341,17 @@ class Redshift(
 
         return RedshiftTable(self, table_name)
 
+    def get_slice_count(self) -> int:
+        """
+        Get the number of slices in the cluster. Each slice loads files in parallel, so
+        splitting a :meth:`copy` into a multiple of this many ``parts`` uses all of them.
+
+        Returns:
+            int
+
+        """
+        return self.query("select count(*) as slices from stv_slices").first
+
     def get_search_path(self):
         """Returns the schema search_path for the current user.
 
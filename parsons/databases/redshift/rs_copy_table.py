@@ -1,18 +1,37 @@
+import json
 import logging
 import os
 import time
+from pathlib import Path
 
 from parsons.aws.s3 import S3
+from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
 S3_TEMP_KEY_PREFIX = "Parsons_RedshiftCopyTable"
+S3_TEMP_MANIFEST = "manifest.json"
+
+
+def build_manifest(bucket, keys, mandatory=True):
+    """Build a Redshift COPY manifest listing files in a bucket."""
+    return {"entries": [{"url": f"s3://{bucket}/{key}", "mandatory": mandatory} for key in keys]}
+
+
+def put_manifest(s3, manifest, bucket, key):
+    """Dump a manifest to a temp JSON file and upload it to S3."""
+    manifest_path = files.create_temp_file()
+    with Path(manifest_path).open(mode="w") as manifest_file_obj:
+        json.dump(manifest, manifest_file_obj, sort_keys=True, indent=4)
+
+    s3.put_file(bucket, key, manifest_path)
 
 
 class RedshiftCopyTable:
     aws_access_key_id = None
     aws_secret_access_key = None
     iam_role = None
+    s3_transfer_config = None
 
     def __init__(self, use_env_token=True):
         self.use_env_token = use_env_token
@@ -143,6 +162,7 @@ class RedshiftCopyTable:
         aws_access_key_id=None,
         aws_secret_access_key=None,
         csv_encoding="utf-8",
+        parts=1,
     ):
         if not self.s3_temp_bucket:
             raise KeyError(
@@ -157,21 +177,50 @@ class RedshiftCopyTable:
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             use_env_token=self.use_env_token,
+            transfer_config=self.s3_transfer_config,
         )
 
         hashed_name = hash(time.time())
-        key = f"{S3_TEMP_KEY_PREFIX}/{hashed_name}.csv.gz"
+        key = f"{S3_TEMP_KEY_PREFIX}/{hashed_name}"
         if self.s3_temp_bucket_prefix:
             key = self.s3_temp_bucket_prefix + "/" + key
 
-        # Convert table to compressed CSV file, to optimize the transfers to S3 and to
-        # Redshift.
-        local_path = tbl.to_csv(temp_file_compression="gzip", encoding=csv_encoding)
-        # Copy table to bucket
-        self.s3.put_file(self.s3_temp_bucket, key, local_path)
+        # Stream the table to the bucket as a compressed CSV, to optimize the transfers to
+        # S3 and to Redshift, without writing it to disk first.
+        if parts == 1:
+            key = f"{key}.csv.gz"
+            stream = tbl.to_csv_stream(compression="gzip", encoding=csv_encoding)
+            self.s3.put_stream(self.s3_temp_bucket, key, stream)
+
+            return key
+
+        # Split the rows between several files, uploaded concurrently, and list them in a
+        # manifest so a single COPY can load them all in parallel.
+        part_keys = [f"{key}/part-{i:05d}.csv.gz" for i in range(parts)]
+        tbl.map_shards(
+            parts,
+            lambda part, i: self.s3.put_stream(
+                self.s3_temp_bucket,
+                part_keys[i],
+                part.to_csv_stream(compression="gzip", encoding=csv_encoding),
+            ),
+        )
+
+        manifest = build_manifest(self.s3_temp_bucket, part_keys)
+        manifest_key = f"{key}/{S3_TEMP_MANIFEST}"
+        put_manifest(self.s3, manifest, self.s3_temp_bucket, manifest_key)
+        logger.debug(f"Uploaded {parts} parts and a manifest to {key}/.")
 
-        return key
+        return manifest_key
 
     def temp_s3_delete(self, key):
-        if key:
+        if not key:
+            return
+
+        if key.endswith(f"/{S3_TEMP_MANIFEST}"):
+            # Remove the parts along with their manifest
+            prefix = key[: -len(S3_TEMP_MANIFEST)]
+            for part in list(self.s3.iter_keys(self.s3_temp_bucket, prefix=prefix)):
+                self.s3.remove_file(self.s3_temp_bucket, part["Key"])
+        else:
             self.s3.remove_file(self.s3_temp_bucket, key)
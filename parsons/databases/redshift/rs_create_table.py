@@ -1,7 +1,5 @@
 import logging
 
-import petl
-
 import parsons.databases.redshift.constants as consts
 from parsons.databases.database.database import DatabaseCreateStatement
 
@@ -61,9 +59,10 @@ class RedshiftCreateTable(DatabaseCreateStatement):
         # Generate a table create statement
 
         # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
+        self.set_column_names(tbl, self.column_name_validate(tbl.columns))
 
-        if tbl.num_rows == 0:
+        # The profile is cached, so checking the row count here doesn't cost a pass
+        if self.profile_columns(tbl).num_rows == 0:
             raise ValueError("Table is empty. Must have 1 or more rows.")
 
         mapping = self.generate_data_types(tbl)
@@ -102,37 +101,15 @@ class RedshiftCreateTable(DatabaseCreateStatement):
         return self.is_valid_sql_num(val)
 
     def generate_data_types(self, table):
-        # Generate column data types
-
-        longest, type_list = [], []
-
-        cont = petl.records(table.table)
-
-        # Populate empty values for the columns
-        for _col in table.columns:
-            longest.append(0)
-            type_list.append("")
-
-        for row in cont:
-            for i in range(len(row)):
-                # NA is the csv null value
-                if type_list[i] == "varchar" or row[i] in ["NA", ""]:
-                    pass
-                else:
-                    var_type = self.data_type(row[i], type_list[i])
-                    type_list[i] = var_type
-
-                # Calculate width
-                if len(str(row[i]).encode("utf-8")) > longest[i]:
-                    longest[i] = len(str(row[i]).encode("utf-8"))
+        # Generate column data types and widths in a single pass over the table.
+        # NA and '' are the csv null values, and are skipped when detecting types.
+        profile = self.profile_columns(table)
 
-        # In L138 'NA' and '' will be skipped
-        # If the entire column is either one of those (or a mix of the two)
-        # the type will be empty.
+        # If an entire column is null values the type will be empty.
         # Fill with a default varchar
-        type_list = [typ or "varchar" for typ in type_list]
+        type_list = [typ or "varchar" for typ in profile.types]
 
-        return {"longest": longest, "headers": table.columns, "type_list": type_list}
+        return {"longest": profile.max_widths, "headers": table.columns, "type_list": type_list}
 
     def vc_padding(self, mapping, padding):
         # Pad the width of a varchar column
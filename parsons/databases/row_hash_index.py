@@ -0,0 +1,173 @@
+import hashlib
+import itertools
+import json
+import logging
+import pickle
+import sqlite3
+from pathlib import Path
+
+from parsons.databases.query_results import BatchPickleView
+from parsons.etl.table import Table
+from parsons.utilities import files
+
+logger = logging.getLogger(__name__)
+
+HASH_BATCH_SIZE = 500
+
+
+def _encode(values):
+    # A stable text form of a list of values. Values JSON can't represent are stringified.
+    return json.dumps(values, default=str, separators=(",", ":"))
+
+
+def row_hash(values) -> str:
+    """
+    Hash a row's values.
+
+    Args:
+        values: list
+            The values to hash
+
+    Returns:
+        str
+
+    """
+    return hashlib.blake2b(_encode(list(values)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RowHashIndex:
+    """
+    A local SQLite file that remembers a hash of the non-key columns of every row that was
+    upserted into a table, by primary key.
+
+    The database connectors' ``upsert`` methods use it to skip incoming rows that are
+    unchanged since the last upsert, so only new and modified rows are uploaded. The index
+    only knows about changes made through it: if the target table is modified by other
+    means, rebuild the index by calling :meth:`clear` or deleting the file.
+
+    One file can hold the indexes of several tables.
+
+    Args:
+        path: str
+            The path to the index file. It is created if it doesn't exist.
+        table_name: str
+            The name of the table the hashes belong to.
+
+    """
+
+    def __init__(self, path: str, table_name: str):
+        self.path = path
+        self.table_name = table_name
+        self._conn = sqlite3.connect(path)
+
+        with self._conn:
+            for table in ("row_hashes", "pending_row_hashes"):
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "table_name TEXT, key TEXT, hash TEXT, PRIMARY KEY (table_name, key))"
+                )
+
+            # Hashes staged by an upsert that never finished are stale
+            self._conn.execute(
+                "DELETE FROM pending_row_hashes WHERE table_name = ?", (self.table_name,)
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM row_hashes WHERE table_name = ?", (self.table_name,)
+        ).fetchone()[0]
+
+    def changed_rows(self, tbl: Table, primary_keys: list[str]) -> Table:
+        """
+        Find the rows of a table that are new or changed since the index was last committed.
+
+        The table is read once. The changed rows are written to a temp file, and their new
+        hashes are staged until :meth:`commit` is called.
+
+        Args:
+            tbl: Table
+                The incoming table.
+            primary_keys: list
+                The primary key columns.
+
+        Returns:
+            Table
+                The new and changed rows.
+
+        """
+        rows = iter(tbl.table)
+        header = tuple(next(rows, ()))
+        missing = [k for k in primary_keys if k not in header]
+        if missing:
+            raise ValueError(f"Primary key columns {missing} are not in the table.")
+
+        key_indexes = [header.index(k) for k in primary_keys]
+        value_indexes = [i for i in range(len(header)) if i not in key_indexes]
+
+        file_path = files.create_temp_file()
+        num_rows = num_changed = 0
+
+        with Path(file_path).open(mode="wb") as f, self._conn:
+            pickle.dump(list(header), f)
+
+            while True:
+                batch = [tuple(row) for row in itertools.islice(rows, HASH_BATCH_SIZE)]
+                if not batch:
+                    break
+
+                hashed = [
+                    (
+                        _encode([row[i] for i in key_indexes]),
+                        row_hash(row[i] for i in value_indexes),
+                    )
+                    for row in batch
+                ]
+                keys = {key for key, _ in hashed}
+                stored = dict(
+                    self._conn.execute(
+                        "SELECT key, hash FROM row_hashes WHERE table_name = ? "
+                        f"AND key IN ({', '.join('?' * len(keys))})",
+                        (self.table_name, *keys),
+                    )
+                )
+
+                changed = [
+                    (key, hash_, row)
+                    for (key, hash_), row in zip(hashed, batch, strict=True)
+                    if stored.get(key) != hash_
+                ]
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO pending_row_hashes VALUES (?, ?, ?)",
+                    ((self.table_name, key, hash_) for key, hash_, _ in changed),
+                )
+
+                if changed:
+                    pickle.dump([row for _, _, row in changed], f)
+                num_rows += len(batch)
+                num_changed += len(changed)
+
+        logger.info(f"{num_changed} of {num_rows} rows are new or changed.")
+
+        return Table(BatchPickleView(file_path))
+
+    def commit(self) -> None:
+        """Save the hashes staged by :meth:`changed_rows`, once they have been upserted."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO row_hashes "
+                "SELECT * FROM pending_row_hashes WHERE table_name = ?",
+                (self.table_name,),
+            )
+            self._conn.execute(
+                "DELETE FROM pending_row_hashes WHERE table_name = ?", (self.table_name,)
+            )
+
+    def clear(self) -> None:
+        """Forget every stored hash, so every row is treated as new."""
+        with self._conn:
+            for table in ("row_hashes", "pending_row_hashes"):
+                self._conn.execute(f"DELETE FROM {table} WHERE table_name = ?", (self.table_name,))
+
+    def close(self) -> None:
+        """Close the index file."""
+        self._conn.close()
@@ -16,6 +16,9 @@ from parsons.databases.table import BaseTable
 from parsons.etl.table import Table
 from parsons.utilities import files
 
+# The column types generated for new tables
+SQLITE_TYPES = ("text", "integer", "float", "datetime", "date")
+
 # Max number of rows that we query at a time, so we can avoid loading huge
 # data sets into memory.
 # 100k rows per batch at ~1k bytes each = ~100MB per batch.
@@ -147,28 +150,27 @@ class Sqlite(DatabaseConnector):
 
     def generate_data_types(self, table: Table) -> dict[str, str]:
         """Generate column data types"""
-        records = petl.records(table.table)
+        # A column's type is set by its first non-empty value, so every type is final.
+        profile = table.profile(type_detector=self._best_type, terminal_types=SQLITE_TYPES)
 
-        type_list: dict[str, str] = {
-            column: self._best_type(records, column) for column in table.columns
-        }
+        type_list: dict[str, str] = {column.name: column.type or "text" for column in profile}
 
         return type_list
 
+    @staticmethod
     def _best_type(
-        self, records: list[dict], column: str
-    ) -> Literal["text", "integer", "float", "datetime", "date"]:
-        values = [record[column] for record in records if record[column]]
-        not_nulls = [i for i in values if i is not None]
-        not_null_value = not_nulls[0] if not_nulls else None
+        value, current_type: str | None
+    ) -> Literal["text", "integer", "float", "datetime", "date"] | None:
+        if current_type or not value:
+            return current_type
 
-        if isinstance(not_null_value, (int, bool)):
+        if isinstance(value, (int, bool)):
             result = "integer"
-        elif isinstance(not_null_value, float):
+        elif isinstance(value, float):
             result = "float"
-        elif isinstance(not_null_value, datetime.date):
+        elif isinstance(value, datetime.date):
             result = "date"
-        elif isinstance(not_null_value, datetime.datetime):
+        elif isinstance(value, datetime.datetime):
             result = "datetime"
         else:
             result = "text"
@@ -247,7 +249,7 @@ class Sqlite(DatabaseConnector):
         import a CSV, but not all machines have the shell utility
         available, so we can fall back to this method.
         """
-        chunked_tbls = tbl.chunk(chunksize)
+        chunked_tbls = tbl.iter_chunks(chunksize)
         insert_sql = "INSERT INTO {} ({}) VALUES ({});".format(
             table_name,
             ", ".join(tbl.columns),
@@ -1,3 +1,4 @@
+import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,37 @@ class BaseTable:
         """
         ).first
 
+    def get_min_max(self, column):
+        """Get the minimum and maximum values of a column in the table."""
+        row = self.db.query(
+            f"""
+            SELECT MIN({column}) AS min_value, MAX({column}) AS max_value
+            FROM {self.table}
+            """
+        )[0]
+
+        return row["min_value"], row["max_value"]
+
+    def partition(self, column, lower, upper, include_upper=False, include_null=False):
+        """
+        Get a table object limited to the rows where ``column`` is at least ``lower`` and
+        less than ``upper`` (or at most ``upper``, if ``include_upper`` is set). Rows where
+        ``column`` is null are also included if ``include_null`` is set.
+
+        The returned object supports the same read methods as the full table (e.g.
+        ``num_rows``, ``get_rows`` and ``get_new_rows``), but should not be modified.
+        """
+        upper_operator = "<=" if include_upper else "<"
+        where_clause = (
+            f"{column} >= {_sql_literal(lower)} AND {column} {upper_operator} {_sql_literal(upper)}"
+        )
+        if include_null:
+            where_clause = f"{column} IS NULL OR ({where_clause})"
+
+        subquery = f"(SELECT * FROM {self.table} WHERE {where_clause}) AS parsons_partition"
+
+        return type(self)(self.db, subquery)
+
     def distinct_primary_key(self, primary_key):
         """Check if the passed primary key column is distinct."""
         sql = f"""
@@ -93,15 +125,20 @@ class BaseTable:
 
         return self.db.query(sql, params).first
 
-    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None):
+    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None, inclusive=False):
         """
         Get rows that have a greater primary key value than the one
         provided.
 
-        It will select every value greater than the provided value.
+        It will select every value greater than the provided value, or greater than or
+        equal to it if ``inclusive`` is set. To page through a large table, pass the last
+        primary key value of the previous page as the ``cutoff_value`` rather than using
+        ``offset``, so the database can seek directly to the start of each page instead
+        of rescanning every prior row.
         """
         if cutoff_value is not None:
-            where_clause = f"WHERE {primary_key} > {self.sql_placeholder}"
+            operator = ">=" if inclusive else ">"
+            where_clause = f"WHERE {primary_key} {operator} {self.sql_placeholder}"
             parameters = [cutoff_value]
         else:
             where_clause = ""
@@ -118,7 +155,8 @@ class BaseTable:
         if chunk_size:
             sql += f" LIMIT {chunk_size}"
 
-        sql += f" OFFSET {offset}"
+        if offset:
+            sql += f" OFFSET {offset}"
 
         return self.db.query(sql, parameters)
 
@@ -135,3 +173,11 @@ class BaseTable:
         """Truncate the table."""
         self.db.query(f"TRUNCATE TABLE {self.table}")
         logger.info(f"{self.table} truncated.")
+
+
+def _sql_literal(value):
+    """Format a numeric or date partition bound as a SQL literal."""
+    if isinstance(value, datetime.date):
+        return f"'{value}'"
+
+    return str(value)
@@ -1,9 +1,13 @@
+import itertools
 import logging
 from collections.abc import Callable
 from typing import Literal
 
 import petl
 
+from parsons.etl.profile import ProfilingView, profile_table
+from parsons.etl.sharding import SHARD_BATCH_SIZE, map_shards
+
 logger = logging.getLogger(__name__)
 
 
@@ -253,6 +257,10 @@ class ETL:
             int
 
         """
+        profile = self._full_profile()
+        if column in profile:
+            return profile[column].max_width
+
         max_width = 0
 
         for v in petl.values(self.table, column):
@@ -261,6 +269,112 @@ class ETL:
 
         return max_width
 
+    def profile(self, type_detector=None, skip_values=(), terminal_types=(), sample_size=None):
+        """
+        Compute the type, maximum width, null count, Python types and distinct count of
+        every column in a single pass over the table.
+
+        The result is cached on the table and reused until the table is transformed, so
+        for example creating a database table and then checking its column widths only
+        reads the data once. Note that changes made to the underlying data outside of
+        Parsons (e.g. editing a source file) are not detected.
+
+        Args:
+            type_detector: function
+                A function ``(value, current_type) -> type`` used to fold each value into
+                the running type of its column. Database connectors pass their own data
+                type detection here. If ``None``, column types are not detected.
+            skip_values: tuple
+                Values that are ignored when detecting types (e.g. ``("", "NA")``)
+            terminal_types: tuple
+                Types that can never be widened; once a column has one of these types,
+                the rest of its values are not passed to ``type_detector``.
+            sample_size: int
+                If set, only profile the first ``sample_size`` rows. Widths and types
+                computed from a sample may not hold for the full table.
+
+        Returns:
+            :class:`~parsons.etl.profile.TableProfile`
+
+        """
+        cache = getattr(self, "_profile_cache", None)
+
+        # Transformations replace ``self.table``, which invalidates the cache. Holding a
+        # reference to the profiled petl table guarantees its identity isn't reused.
+        if cache is None or cache[0] is not self.table:
+            cache = self._profile_cache = (self.table, {})
+
+        key = (type_detector, tuple(skip_values), tuple(terminal_types), sample_size)
+        if key not in cache[1]:
+            cache[1][key] = profile_table(
+                self.table,
+                type_detector=type_detector,
+                skip_values=skip_values,
+                terminal_types=terminal_types,
+                sample_size=sample_size,
+            )
+
+        return cache[1][key]
+
+    def profiling_view(self, type_detector=None, skip_values=(), terminal_types=()):
+        """
+        Return a view of the table that profiles its rows as they are read.
+
+        Once the view has been read to the end, its profile is cached on this table, just
+        as if :meth:`profile` had been called with the same arguments. This allows a table
+        to be profiled while it is being written out, in a single pass over its rows. For
+        example, a database connector can upload a table and then size the columns of the
+        destination table from the cached profile.
+
+        Args:
+            type_detector: function
+                See :meth:`profile`
+            skip_values: tuple
+                See :meth:`profile`
+            terminal_types: tuple
+                See :meth:`profile`
+
+        Returns:
+            Table
+
+        """
+        from parsons.etl import Table
+
+        source = self.table
+        key = (type_detector, tuple(skip_values), tuple(terminal_types), None)
+
+        def cache_profile(profile):
+            # Skip caching if the table was transformed while the view was being read
+            if self.table is not source:
+                return
+
+            cache = getattr(self, "_profile_cache", None)
+            if cache is None or cache[0] is not source:
+                cache = self._profile_cache = (source, {})
+            cache[1][key] = profile
+
+        return Table(
+            ProfilingView(
+                source,
+                cache_profile,
+                type_detector=type_detector,
+                skip_values=skip_values,
+                terminal_types=terminal_types,
+            )
+        )
+
+    def _full_profile(self):
+        # Widths and Python types don't depend on type detection, so any full profile of
+        # the current data will do. Otherwise profile every column now, so looking up the
+        # rest is free.
+        cache = getattr(self, "_profile_cache", None)
+        if cache is not None and cache[0] is self.table:
+            for profile in cache[1].values():
+                if not profile.sampled:
+                    return profile
+
+        return self.profile()
+
     def convert_columns_to_str(self):
         """
         Convenience function to convert all non-string or mixed columns in a
@@ -448,22 +562,35 @@ class ETL:
                 A list of Python types
 
         """
+        profile = self._full_profile()
+        if column in profile:
+            return profile[column].python_types
+
         return list(petl.typeset(self.table, column))
 
     def get_columns_type_stats(self):
         """
         Return descriptive stats for all columns
 
-        Returns:
-            list
-                A list of dicts
+        The stats of every column are gathered in a single pass over the table, and are
+        cached until the table is transformed (see :meth:`profile`).
 
         Returns:
             list[dict]
-                A list of dicts, each containing a column 'name' and a 'type' list
+                A list of dicts, each containing a column 'name', a 'type' list, and its
+                'max_width', 'null_count' and (estimated) 'distinct_count'
 
         """
-        return [{"name": col, "type": self.get_column_types(col)} for col in self.table.columns()]
+        return [
+            {
+                "name": column.name,
+                "type": column.python_types,
+                "max_width": column.max_width,
+                "null_count": column.null_count,
+                "distinct_count": column.distinct_count,
+            }
+            for column in self._full_profile()
+        ]
 
     def convert_table(self, *args):
         r"""
@@ -957,6 +1084,67 @@ class ETL:
             Table(petl.rowslice(self.table, i, i + rows)) for i in range(0, self.num_rows, rows)
         ]
 
+    def iter_chunks(self, rows: int):
+        """
+        Lazily divides a Parsons table into smaller tables of a specified row count. If the
+        table cannot be divided evenly, then the final table will only include the remainder.
+
+        Unlike ``chunk()``, the underlying table is only iterated over once, and each chunk is
+        backed by an in-memory buffer of at most ``rows`` rows. Use this when the table is
+        large or built on a chain of lazy transformations.
+
+        Args:
+            rows: int
+                The number of rows of each new Parsons table
+
+        Yields:
+            Table
+
+        """
+        from parsons.etl import Table
+
+        if rows < 1:
+            raise ValueError("Chunk size must be a positive integer.")
+
+        it = iter(self.table)
+        try:
+            header = tuple(next(it))
+        except StopIteration:
+            return
+
+        while True:
+            buffer = [tuple(row) for row in itertools.islice(it, rows)]
+            if not buffer:
+                return
+            yield Table(petl.wrap([header, *buffer]))
+
+    def map_shards(self, shards: int, func: Callable, batch_size: int = SHARD_BATCH_SIZE):
+        """
+        Split the table's rows between ``shards`` tables and consume them concurrently.
+
+        The table is read once, and its rows are dealt out round robin, ``batch_size`` at
+        a time, to one thread per shard, which calls ``func(shard_table, index)``. Memory
+        use is bounded by a couple of batches per shard, so this can be used to write a
+        large table to several files or uploads in parallel, e.g. with
+        :meth:`~parsons.etl.tofrom.ToFrom.to_csv_stream`.
+
+        Each shard table can only be read once, and ``func`` must read it to the end.
+
+        Args:
+            shards: int
+                The number of shards
+            func: function
+                A function ``(table, index) -> result`` that consumes one shard
+            batch_size: int
+                The number of rows handed to a shard at a time
+
+        Returns:
+            list
+                The results of ``func``, in shard order
+
+        """
+        return map_shards(self.table, shards, func, batch_size=batch_size)
+
     @staticmethod
     def get_normalized_column_name(column_name: str) -> str:
         """
@@ -0,0 +1,324 @@
+import heapq
+import itertools
+import logging
+import sys
+from operator import methodcaller
+
+import petl
+
+logger = logging.getLogger(__name__)
+
+PROFILE_BATCH_SIZE = 10000
+
+# The number of hashes kept per column to estimate its distinct count. The estimate's
+# standard error is about 1 / sqrt(DISTINCT_SKETCH_SIZE), so ~3%. Columns with fewer
+# distinct values than this are counted exactly.
+DISTINCT_SKETCH_SIZE = 1024
+
+# Python's hashes are uniform over this range
+_HASH_MIN = -(2 ** (sys.hash_info.width - 1))
+_HASH_RANGE = 2**sys.hash_info.width
+
+# Fill value for cells missing from short rows, so they are not mistaken for nulls
+_MISSING = object()
+
+_encode_utf8 = methodcaller("encode", "utf-8")
+
+
+class ColumnProfile:
+    """
+    Statistics gathered for a single column by :func:`profile_table`.
+
+    Attributes:
+        name: str
+            The column name
+        type: str
+            The column type reported by the type detector, or ``None`` if no detector
+            was used or no value could be typed
+        max_width: int
+            The maximum width, in UTF-8 bytes, of the string form of the column's values
+        null_count: int
+            The number of ``None`` values in the column
+        python_types: list
+            The sorted names of the Python types of the column's values, as returned by
+            ``petl.typeset`` (e.g. ``["NoneType", "int"]``)
+        distinct_count: int
+            The number of distinct non-null values in the column. Values are compared by
+            their string form. Counts above ``DISTINCT_SKETCH_SIZE`` are estimates.
+
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.type = None
+        self.max_width = 0
+        self.null_count = 0
+        self._type_names = set()
+        # The smallest distinct hashes seen, a "k minimum values" sketch
+        self._min_hashes = []
+
+    def __repr__(self):
+        return (
+            f"ColumnProfile(name={self.name!r}, type={self.type!r}, "
+            f"max_width={self.max_width}, null_count={self.null_count})"
+        )
+
+    @property
+    def python_types(self):
+        return sorted(self._type_names)
+
+    @property
+    def distinct_count(self):
+        if len(self._min_hashes) < DISTINCT_SKETCH_SIZE:
+            return len(self._min_hashes)
+
+        # The k smallest of n uniform hashes span about k / n of the hash range
+        fraction = (self._min_hashes[-1] - _HASH_MIN + 1) / _HASH_RANGE
+        return round((DISTINCT_SKETCH_SIZE - 1) / fraction)
+
+
+class TableProfile:
+    """
+    The result of :func:`profile_table`: a :class:`ColumnProfile` per column, in table order.
+
+    Attributes:
+        columns: list
+            A list of :class:`ColumnProfile` objects
+        num_rows: int
+            The number of rows that were profiled
+        sampled: bool
+            Whether only a sample of the table's rows was profiled
+
+    """
+
+    def __init__(self, columns, num_rows, sampled):
+        self.columns = columns
+        self.num_rows = num_rows
+        self.sampled = sampled
+
+    def __getitem__(self, column):
+        for profile in self.columns:
+            if profile.name == column:
+                return profile
+
+        raise KeyError(column)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __contains__(self, column):
+        return any(profile.name == column for profile in self.columns)
+
+    @property
+    def types(self):
+        """Returns a list of the column types, in table order."""
+        return [c.type for c in self.columns]
+
+    @property
+    def max_widths(self):
+        """Returns a list of the column max widths, in table order."""
+        return [c.max_width for c in self.columns]
+
+    @property
+    def python_types(self):
+        """Returns a list of the Python type names of each column, in table order."""
+        return [c.python_types for c in self.columns]
+
+
+class TableProfiler:
+    """
+    Builds a :class:`TableProfile` incrementally, one batch of rows at a time.
+
+    Each batch is transposed, so widths, null counts, type sets and distinct counts are
+    computed a column at a time with built-in functions rather than cell by cell.
+
+    Args:
+        header: list
+            The column names
+        type_detector: function
+            See :func:`profile_table`
+        skip_values: tuple
+            See :func:`profile_table`
+        terminal_types: tuple
+            See :func:`profile_table`
+
+    """
+
+    def __init__(self, header, type_detector=None, skip_values=(), terminal_types=()):
+        self.columns = [ColumnProfile(name) for name in header]
+        self.type_detector = type_detector
+        self.skip_values = skip_values
+        self.terminal_types = terminal_types
+        self.num_rows = 0
+
+    def update(self, batch):
+        """
+        Fold a batch of rows into the profile.
+
+        Args:
+            batch: list
+                A list of rows
+
+        """
+        if not batch:
+            return
+
+        num_columns = len(self.columns)
+        self.num_rows += len(batch)
+        columns = list(itertools.zip_longest(*batch, fillvalue=_MISSING))
+        ragged = any(len(row) != num_columns for row in batch)
+
+        for profile, values in zip(self.columns, columns, strict=False):
+            if ragged:
+                present = [v for v in values if v is not _MISSING]
+                # Like petl, treat cells missing from short rows as None when typing
+                if len(present) < len(values):
+                    profile._type_names.add("NoneType")
+                values = present
+
+            null_count = values.count(None)
+            profile.null_count += null_count
+            profile._type_names.update(t.__name__ for t in set(map(type, values)))
+
+            strings = set(map(str, values))
+            width = max(map(len, map(_encode_utf8, strings)), default=0)
+            if width > profile.max_width:
+                profile.max_width = width
+
+            if null_count:
+                # Nulls are not distinct values, but the string "None" is
+                strings = {str(v) for v in values if v is not None}
+            hashes = map(hash, strings)
+            if len(profile._min_hashes) == DISTINCT_SKETCH_SIZE:
+                # Once the sketch is full, only hashes below its largest can get in
+                hashes = filter(profile._min_hashes[-1].__gt__, hashes)
+            candidates = set(hashes)
+            if candidates:
+                profile._min_hashes = heapq.nsmallest(
+                    DISTINCT_SKETCH_SIZE, candidates.union(profile._min_hashes)
+                )
+
+            if self.type_detector is None or profile.type in self.terminal_types:
+                continue
+
+            current = profile.type
+            for value in values:
+                if value in self.skip_values:
+                    continue
+                current = self.type_detector(value, current)
+                if current in self.terminal_types:
+                    break
+            profile.type = current
+
+    def result(self, sampled=False):
+        """
+        Returns:
+            TableProfile
+                The profile of the rows seen so far
+
+        """
+        logger.debug(f"Profiled {self.num_rows} rows across {len(self.columns)} columns.")
+        return TableProfile(self.columns, self.num_rows, sampled)
+
+
+class ProfilingView(petl.Table):
+    """
+    A petl view that passes a table's rows through unchanged, profiling them on the way.
+
+    Once the view has been iterated to the end, ``on_complete`` is called with the
+    resulting :class:`TableProfile`. This lets a table be profiled while it is being
+    written somewhere else, in the same pass over its rows.
+
+    Args:
+        source: petl table
+            The table to profile
+        on_complete: function
+            Called with the :class:`TableProfile` after the last row has been read
+        batch_size: int
+            The number of rows to profile at a time
+        `**kwargs`:
+            Arguments for :class:`TableProfiler`
+
+    """
+
+    def __init__(self, source, on_complete, batch_size=PROFILE_BATCH_SIZE, **kwargs):
+        self.source = source
+        self.on_complete = on_complete
+        self.batch_size = batch_size
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        rows = iter(self.source)
+        header = next(rows, None)
+        if header is None:
+            self.on_complete(TableProfiler([], **self.kwargs).result())
+            return
+
+        profiler = TableProfiler(header, **self.kwargs)
+        yield header
+
+        while True:
+            batch = list(itertools.islice(rows, self.batch_size))
+            if not batch:
+                break
+            profiler.update(batch)
+            yield from batch
+
+        self.on_complete(profiler.result())
+
+
+def profile_table(
+    table,
+    type_detector=None,
+    skip_values=(),
+    terminal_types=(),
+    sample_size=None,
+    batch_size=PROFILE_BATCH_SIZE,
+):
+    """
+    Compute column types, max widths, null counts, Python type sets and distinct counts
+    for every column of a table in a single pass over its rows.
+
+    Rows are read and profiled in batches with a :class:`TableProfiler`.
+
+    Args:
+        table: petl table
+            The table to profile
+        type_detector: function
+            A function ``(value, current_type) -> type`` used to fold each value into the
+            running type of its column (e.g. ``DatabaseCreateStatement.data_type``). If
+            ``None``, no types are detected.
+        skip_values: tuple
+            Values that are ignored when detecting types (e.g. ``("", "NA")``). They still
+            count towards widths.
+        terminal_types: tuple
+            Types that can never be widened; once a column has one of these types, its
+            remaining values are not passed to ``type_detector``.
+        sample_size: int
+            If set, only the first ``sample_size`` rows are profiled
+        batch_size: int
+            The number of rows to read at a time
+
+    Returns:
+        TableProfile
+
+    """
+    rows = iter(table)
+    profiler = TableProfiler(
+        next(rows, []),
+        type_detector=type_detector,
+        skip_values=skip_values,
+        terminal_types=terminal_types,
+    )
+
+    if sample_size is not None:
+        rows = itertools.islice(rows, sample_size)
+
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        profiler.update(batch)
+
+    sampled = sample_size is not None and profiler.num_rows >= sample_size
+    return profiler.result(sampled)
@@ -0,0 +1,121 @@
+import itertools
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import petl
+
+logger = logging.getLogger(__name__)
+
+SHARD_BATCH_SIZE = 1000
+
+# Queued after the last batch of a shard, or to abandon it after an error elsewhere
+_DONE = object()
+_ABORT = object()
+
+
+class _ShardAborted(RuntimeError):
+    pass
+
+
+class _ShardView(petl.Table):
+    """
+    A one-shot petl view over the rows fed to a single shard by :func:`map_shards`
+    through a bounded queue.
+    """
+
+    def __init__(self, header, feed):
+        self.header = header
+        self.feed = feed
+
+    def __iter__(self):
+        yield self.header
+        while True:
+            batch = self.feed.get()
+            if batch is _DONE:
+                return
+            if batch is _ABORT:
+                raise _ShardAborted("Shard abandoned after an error in another shard.")
+            yield from batch
+
+
+def _feed_shard(feed, item, future):
+    # Put an item on a shard's queue. Returns False if the shard's consumer has stopped.
+    while not future.done():
+        try:
+            feed.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+
+def map_shards(table, shards, func, batch_size=SHARD_BATCH_SIZE):
+    """
+    Deal the rows of a table out between ``shards`` tables, and consume each of them
+    concurrently, in its own thread, with ``func``.
+
+    The table is read once, a batch at a time, and batches are handed to the shards
+    round robin. Each shard's queue holds at most two batches, so memory use stays
+    bounded and a slow consumer holds back the reader rather than letting rows pile up.
+    The shard tables can only be iterated over once.
+
+    Args:
+        table: petl table
+            The table to split
+        shards: int
+            The number of shards
+        func: function
+            A function ``(table, index) -> result`` that consumes a shard, e.g. by
+            streaming it to a file. It is called with a Parsons Table.
+        batch_size: int
+            The number of rows handed to a shard at a time
+
+    Returns:
+        list
+            The results of ``func``, in shard order
+
+    """
+    from parsons.etl import Table
+
+    if shards < 1:
+        raise ValueError("shards must be at least 1.")
+
+    rows = iter(table)
+    header = tuple(next(rows, ()))
+    feeds = [queue.Queue(maxsize=2) for _ in range(shards)]
+
+    with ThreadPoolExecutor(max_workers=shards) as executor:
+        futures = [
+            executor.submit(func, Table(_ShardView(header, feed)), i)
+            for i, feed in enumerate(feeds)
+        ]
+        end = _ABORT
+
+        try:
+            for i in itertools.count():
+                batch = [tuple(row) for row in itertools.islice(rows, batch_size)]
+                if not batch:
+                    end = _DONE
+                    break
+                shard = i % shards
+                if not _feed_shard(feeds[shard], batch, futures[shard]):
+                    break
+        finally:
+            for feed, future in zip(feeds, futures, strict=True):
+                _feed_shard(feed, end, future)
+
+        # Report the error that stopped the write, rather than the shards it abandoned
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            raise min(errors, key=lambda e: isinstance(e, _ShardAborted))
+
+        results = [future.result() for future in futures]
+
+    if end is _ABORT:
+        raise RuntimeError("A shard stopped reading before all of its rows were sent.")
+
+    logger.debug(f"Split table between {shards} shards.")
+
+    return results
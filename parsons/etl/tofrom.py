@@ -1,6 +1,10 @@
+import csv
 import gzip
 import io
+import itertools
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
@@ -8,6 +12,249 @@ import petl
 
 from parsons.utilities import files, zip_archive
 
+PARQUET_BATCH_SIZE = 100000
+S3_DOWNLOAD_WORKERS = 8
+CSV_STREAM_BATCH_SIZE = 1000
+
+
+class _ParquetView(petl.Table):
+    """
+    A lazy petl view over a Parquet file. Rows are read one Arrow record batch at a time,
+    and each batch is converted to Python values column by column before being yielded as
+    tuples.
+    """
+
+    def __init__(self, source, columns=None, batch_size=PARQUET_BATCH_SIZE):
+        self.source = source
+        self.columns = columns
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(self.source)
+        try:
+            schema = parquet_file.schema_arrow
+            yield tuple(self.columns or schema.names)
+
+            for batch in parquet_file.iter_batches(
+                batch_size=self.batch_size, columns=self.columns
+            ):
+                yield from zip(*(column.to_pylist() for column in batch.columns), strict=True)
+        finally:
+            parquet_file.close()
+
+
+def _rewrite_parquet(path, schema, **parquet_args):
+    # Rewrite a Parquet file with a wider schema, returning a writer open at its end
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    old_path = files.create_temp_file(suffix=".parquet")
+    Path(path).replace(old_path)
+
+    writer = pq.ParquetWriter(path, schema, **parquet_args)
+    for batch in pq.ParquetFile(old_path).iter_batches():
+        writer.write(pa.Table.from_batches([batch]).cast(schema))
+    Path(old_path).unlink()
+
+    return writer
+
+
+class _S3PartsView(petl.Table):
+    """
+    A lazy petl view over a set of CSV files in S3, such as the parts written by a
+    Redshift ``UNLOAD``, read as one table.
+
+    The files are downloaded in the background, up to ``max_workers`` at a time, as
+    soon as the view is created. Iterating over the view waits for every download, so
+    a failed download is raised by the first read. If every file has the same columns,
+    their rows are simply chained together. Otherwise they are combined as by
+    ``petl.cat``, with the columns of all the files matched by name.
+    """
+
+    def __init__(self, s3, keys, max_workers=S3_DOWNLOAD_WORKERS, **csvargs):
+        self.csvargs = csvargs
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._downloads = [executor.submit(self._download, s3, *key) for key in keys]
+        # Let the downloads finish in the background
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _download(s3, bucket, key):
+        local_path = s3.get_file(bucket, key)
+        if files.compression_type_for_path(key) == "zip":
+            local_path = zip_archive.unzip_archive(local_path)
+
+        return local_path
+
+    def __iter__(self):
+        tables = []
+        headers = []
+        for download in self._downloads:
+            table = petl.fromcsv(download.result(), **self.csvargs)
+            header = next(iter(table), None)
+            # Skip empty files, which have no header
+            if header is not None:
+                tables.append(table)
+                headers.append(tuple(header))
+
+        if not tables:
+            yield ()
+        elif all(header == headers[0] for header in headers):
+            yield headers[0]
+            for table in tables:
+                yield from itertools.islice(table, 1, None)
+        else:
+            yield from petl.cat(*tables)
+
+
+class _TableStream(io.RawIOBase):
+    """
+    Base class for read-only binary file objects that render a table while being read.
+
+    Subclasses turn each batch of rows into text with ``_render_batch``. Rows are pulled and
+    rendered ``batch_size`` at a time, so memory use is bounded by the size of one batch
+    no matter how large the table is, and nothing is written to disk.
+    """
+
+    def __init__(self, rows, encoding, errors, batch_size, compression):
+        super().__init__()
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Cannot stream {compression} compressed files; use gzip or None.")
+
+        self.encoding = encoding
+        self.errors = errors
+        self.batch_size = batch_size
+        self.row_count = 0
+
+        self._rows = rows
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        self._compressor = zlib.compressobj(wbits=31) if compression else None
+        self._pending = memoryview(b"")
+        self._offset = 0
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def readinto(self, buffer):
+        if self._offset >= len(self._pending):
+            self._pending = memoryview(self._next_batch())
+            self._offset = 0
+
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset : self._offset + size]
+        self._offset += size
+        self._position += size
+
+        return size
+
+    def _next_batch(self):
+        # Returns b"" only at the end of the stream
+        while True:
+            batch = list(itertools.islice(self._rows, self.batch_size))
+            if not batch:
+                if self._compressor is None:
+                    return b""
+
+                tail = self._compressor.flush()
+                self._compressor = None
+                return tail
+
+            self.row_count += len(batch)
+
+            # The compressor may buffer a whole small batch without returning anything
+            data = self._encode(self._render_batch(batch))
+            if data:
+                return data
+
+    def _encode(self, text):
+        data = text.encode(self.encoding, self.errors)
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+
+        return data
+
+
+class CSVStream(_TableStream):
+    """
+    A read-only binary file object that renders a table as CSV while it is being read.
+
+    Rows are pulled from the table and encoded ``batch_size`` at a time, so memory use is
+    bounded by the size of one batch no matter how large the table is, and nothing is
+    written to disk. This makes it suitable for passing directly to anything that reads
+    from a file object, such as ``cursor.copy_expert`` or a multipart S3 upload.
+
+    With ``compression="gzip"``, each batch is compressed as it is rendered, and the
+    stream holds a complete gzip file.
+
+    Attributes:
+        row_count: int
+            The number of data rows (excluding the header) rendered so far. Once the stream
+            has been read to the end, this is the number of rows in the table.
+
+    """
+
+    def __init__(
+        self,
+        table,
+        encoding="utf-8",
+        errors="strict",
+        write_header=True,
+        batch_size=CSV_STREAM_BATCH_SIZE,
+        compression=None,
+        **csvargs,
+    ):
+        super().__init__(iter(table), encoding, errors, batch_size, compression)
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, **csvargs)
+
+        header = next(self._rows, None)
+        if write_header and header is not None:
+            self._writer.writerow(header)
+            self._pending = memoryview(self._encode(self._flush()))
+
+    def _render_batch(self, batch):
+        self._writer.writerows(batch)
+        return self._flush()
+
+    def _flush(self):
+        text = self._text.getvalue()
+        self._text.seek(0)
+        self._text.truncate()
+
+        return text
+
+
+class JSONStream(_TableStream):
+    """
+    A read-only binary file object that renders a table as newline-delimited JSON, with
+    one object per row, while it is being read. It works like :class:`CSVStream`.
+
+    Attributes:
+        row_count: int
+            The number of rows rendered so far.
+
+    """
+
+    def __init__(
+        self,
+        table,
+        encoding="utf-8",
+        errors="strict",
+        batch_size=CSV_STREAM_BATCH_SIZE,
+        compression=None,
+    ):
+        super().__init__(iter(petl.dicts(table)), encoding, errors, batch_size, compression)
+
+    def _render_batch(self, batch):
+        return "".join(json.dumps(row) + "\n" for row in batch)
+
 
 class ToFrom:
     def to_dataframe(self, index=None, exclude=None, columns=None, coerce_float=False):
@@ -226,6 +473,107 @@ class ToFrom:
         """
         return petl.appendavro(self.table, target, schema=schema, sample=sample, **avro_args)
 
+    def to_parquet(
+        self,
+        local_path=None,
+        schema=None,
+        compression="snappy",
+        batch_size=PARQUET_BATCH_SIZE,
+        **parquet_args,
+    ):
+        r"""
+        Outputs table to a Parquet file.
+
+        In order to use this method, you must have the `pyarrow` library installed.
+        If using limited dependencies, you can install it with `pip install parsons[parquet]`.
+
+        Rows are buffered into Arrow record batches of ``batch_size`` rows and written
+        as they are produced, so the table is only iterated over once and never held in
+        memory in full.
+
+        .. warning::
+                If a file already exists at the given location, it will be
+                overwritten.
+
+        Args:
+            local_path: str
+                The path to write the Parquet file locally. If not specified, a temporary file
+                will be created and returned, and that file will be removed automatically when
+                the script is done running.
+            schema: pyarrow.Schema
+                The schema of the file. If not specified, column types are inferred from
+                each batch of rows and widened as needed (e.g. from ``int64`` to ``double``,
+                or from an all-null column to ``string``), rewriting the batches already
+                written. Columns whose types can't be reconciled (e.g. ``int64`` and
+                ``string``) raise a ``ValueError``; pass a schema to write them.
+            compression: str
+                The compression codec, e.g. ``snappy`` (default), ``gzip``, ``zstd`` or ``none``.
+            batch_size: int
+                The number of rows to convert to Arrow and write at a time.
+            `**parquet_args`: kwargs
+                Additional arguments passed to ``pyarrow.parquet.ParquetWriter``.
+
+        Returns:
+            str
+                The path of the new file
+
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not local_path:
+            local_path = files.create_temp_file(suffix=".parquet")
+
+        header = self.columns
+        infer_schema = schema is None
+        writer = None
+        try:
+            for chunk in self.iter_chunks(batch_size):
+                columns = zip(*chunk.data, strict=True)
+                arrays = dict(zip(header, map(list, columns), strict=True))
+                try:
+                    if not infer_schema:
+                        batch = pa.RecordBatch.from_pydict(arrays, schema=schema)
+                    elif writer is None:
+                        batch = pa.RecordBatch.from_pydict(arrays)
+                        schema = batch.schema
+                    else:
+                        batch = pa.RecordBatch.from_pydict(arrays)
+                        widened = pa.unify_schemas(
+                            [schema, batch.schema], promote_options="permissive"
+                        )
+                        if widened != schema:
+                            # Rewrite the rows already written with the wider types
+                            writer.close()
+                            writer = _rewrite_parquet(
+                                local_path, widened, compression=compression, **parquet_args
+                            )
+                            schema = widened
+                        batch = pa.Table.from_batches([batch]).cast(schema)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    raise ValueError(
+                        f"Unable to convert rows to Parquet: {e}. Pass a schema to set the "
+                        "column types."
+                    ) from e
+
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        local_path, schema, compression=compression, **parquet_args
+                    )
+                writer.write(batch)
+
+            # Still write a valid, empty file if the table has no rows
+            if writer is None:
+                schema = schema or pa.schema([(col, pa.string()) for col in header])
+                writer = pq.ParquetWriter(
+                    local_path, schema, compression=compression, **parquet_args
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return local_path
+
     def to_csv(
         self,
         local_path=None,
@@ -299,6 +647,53 @@ class ToFrom:
 
         return local_path
 
+    def to_csv_stream(
+        self,
+        encoding="utf-8",
+        errors="strict",
+        write_header=True,
+        batch_size=CSV_STREAM_BATCH_SIZE,
+        compression=None,
+        **csvargs,
+    ):
+        r"""
+        Outputs table as a readable, binary CSV file object that is rendered lazily as it is
+        read. Additional key word arguments are passed to ``csv.writer()``.
+
+        Unlike :meth:`to_csv`, nothing is written to disk and only ``batch_size`` rows are
+        held in memory at a time, so the table is read in a single pass as the stream is
+        consumed. The stream can only be read once.
+
+        Args:
+            encoding: str
+                The encoding of the bytes returned by the stream. Defaults to ``utf-8``.
+            errors: str
+                How encoding errors are handled, as in ``str.encode()``
+            write_header: boolean
+                Include header in output
+            batch_size: int
+                The number of rows to render at a time
+            compression: str
+                Set to ``gzip`` to stream a gzipped CSV. Defaults to no compression.
+            `**csvargs`: kwargs
+                ``csv_writer`` optional arguments
+
+        Returns:
+            :class:`~parsons.etl.tofrom.CSVStream`
+                A file object. After it has been read to the end, its ``row_count``
+                attribute holds the number of rows written.
+
+        """
+        return CSVStream(
+            self.table,
+            encoding=encoding,
+            errors=errors,
+            write_header=write_header,
+            batch_size=batch_size,
+            compression=compression,
+            **csvargs,
+        )
+
     def append_csv(self, local_path, encoding=None, errors="strict", **csvargs):
         r"""
         Appends table to an existing CSV.
@@ -437,6 +832,44 @@ class ToFrom:
 
         return local_path
 
+    def to_json_stream(
+        self,
+        encoding="utf-8",
+        errors="strict",
+        batch_size=CSV_STREAM_BATCH_SIZE,
+        compression=None,
+    ):
+        """
+        Outputs table as a readable, binary file object of newline-delimited JSON that is
+        rendered lazily as it is read.
+
+        Like :meth:`to_csv_stream`, nothing is written to disk and only ``batch_size`` rows
+        are held in memory at a time. The stream can only be read once.
+
+        Args:
+            encoding: str
+                The encoding of the bytes returned by the stream. Defaults to ``utf-8``.
+            errors: str
+                How encoding errors are handled, as in ``str.encode()``
+            batch_size: int
+                The number of rows to render at a time
+            compression: str
+                Set to ``gzip`` to stream gzipped JSON. Defaults to no compression.
+
+        Returns:
+            :class:`~parsons.etl.tofrom.JSONStream`
+                A file object. After it has been read to the end, its ``row_count``
+                attribute holds the number of rows written.
+
+        """
+        return JSONStream(
+            self.table,
+            encoding=encoding,
+            errors=errors,
+            batch_size=batch_size,
+            compression=compression,
+        )
+
     def to_dicts(self):
         """
         Output table as a list of dicts.
@@ -518,11 +951,16 @@ class ToFrom:
         public_url=False,
         public_url_expires=3600,
         use_env_token=True,
+        transfer_config=None,
         **csvargs,
     ):
         r"""
         Writes the table to an s3 object as a CSV
 
+        Uncompressed and gzipped CSVs are streamed straight to S3 as a multipart upload
+        while the table is read, without being written to disk first. Zip archives are
+        written to a temp file and then uploaded.
+
         Args:
             bucket: str
                 The s3 bucket to upload to
@@ -553,6 +991,8 @@ class ToFrom:
                 Controls use of the ``AWS_SESSION_TOKEN`` environment variable for S3. Defaults
                 to ``True``. Set to ``False`` in order to ignore the ``AWS_SESSION_TOKEN`` env
                 variable even if the ``aws_session_token`` argument was not passed in.
+            transfer_config: dict or boto3.s3.transfer.TransferConfig
+                Controls the part size and concurrency of the upload. See :class:`~parsons.S3`.
             `**csvargs`: kwargs
                 ``csv_writer`` optional arguments
         Returns:
@@ -561,27 +1001,37 @@ class ToFrom:
         """
         compression = compression or files.compression_type_for_path(key)
 
-        csv_name = files.extract_file_name(key, include_suffix=False) + ".csv"
-
-        # Save the CSV as a temp file
-        local_path = self.to_csv(
-            temp_file_compression=compression,
-            encoding=encoding,
-            errors=errors,
-            write_header=write_header,
-            csv_name=csv_name,
-            **csvargs,
-        )
-
-        # Put the file on S3
         from parsons.aws import S3
 
         self.s3 = S3(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             use_env_token=use_env_token,
+            transfer_config=transfer_config,
         )
-        self.s3.put_file(bucket, key, local_path, acl=acl)
+
+        if compression == "zip":
+            # Zip archives can't be streamed, so save the CSV as a temp file
+            csv_name = files.extract_file_name(key, include_suffix=False) + ".csv"
+            local_path = self.to_csv(
+                temp_file_compression=compression,
+                encoding=encoding,
+                errors=errors,
+                write_header=write_header,
+                csv_name=csv_name,
+                **csvargs,
+            )
+            self.s3.put_file(bucket, key, local_path, acl=acl)
+
+        else:
+            stream = self.to_csv_stream(
+                encoding=encoding or "utf-8",
+                errors=errors,
+                write_header=write_header,
+                compression=compression,
+                **csvargs,
+            )
+            self.s3.put_stream(bucket, key, stream, acl=acl)
 
         if public_url:
             return self.s3.get_url(bucket, key, expires_in=public_url_expires)
@@ -855,6 +1305,32 @@ class ToFrom:
         """
         return cls(petl.fromavro(local_path, limit=limit, skips=skips, **avro_args))
 
+    @classmethod
+    def from_parquet(cls, local_path, columns=None, batch_size=PARQUET_BATCH_SIZE):
+        """
+        Create a ``parsons table`` from a Parquet file.
+
+        In order to use this method, you must have the `pyarrow` library installed.
+        If using limited dependencies, you can install it with `pip install parsons[parquet]`.
+
+        The file is read lazily, one Arrow record batch at a time. Only the requested
+        ``columns`` are read from disk.
+
+        Args:
+            local_path: str
+                The path to the Parquet file.
+            columns: list, optional
+                The columns to read. Defaults to all columns.
+            batch_size: int, optional
+                The maximum number of rows to read into memory at a time.
+
+        Returns:
+            Table
+                See :ref:`Table` for output options.
+
+        """
+        return cls(_ParquetView(local_path, columns=columns, batch_size=batch_size))
+
     @classmethod
     def from_csv(cls, local_path, **csvargs):
         r"""
@@ -1008,16 +1484,22 @@ class ToFrom:
         from_manifest=False,
         aws_access_key_id=None,
         aws_secret_access_key=None,
+        max_workers=S3_DOWNLOAD_WORKERS,
         **csvargs,
     ):
         r"""
         Create a ``parsons table`` from a key in an S3 bucket.
 
+        When the table is made up of several files, such as the parts written by
+        :meth:`~parsons.databases.redshift.Redshift.unload`, they are downloaded
+        concurrently, and their columns are matched by name.
+
         Args:
             bucket: str
                 The S3 bucket.
             key: str
-                The S3 key
+                The S3 key. If it ends in ``/``, all of the keys under that prefix are
+                loaded into a single :ref:`Table`.
             from_manifest: bool
                 If True, treats `key` as a manifest file and loads all urls into a :ref:`Table`.
                 Defaults to False.
@@ -1025,6 +1507,8 @@ class ToFrom:
                 Required if not included as environmental variable.
             aws_secret_access_key: str
                 Required if not included as environmental variable.
+            max_workers: int
+                The number of files to download at once.
             `**csvargs`: kwargs
                 ``csv_reader`` optional arguments
         Returns:
@@ -1044,17 +1528,21 @@ class ToFrom:
         else:
             s3_keys = [f"s3://{bucket}/{key}"]
 
-        tbls = []
-        for key in s3_keys:
-            # TODO(dannyboy15): handle urls that end with '/', i.e. urls that point to "folders"
-            _, _, bucket_, key_ = key.split("/", 3)
-            file_ = s3.get_file(bucket_, key_)
-            if files.compression_type_for_path(key_) == "zip":
-                file_ = zip_archive.unzip_archive(file_)
-
-            tbls.append(petl.fromcsv(file_, **csvargs))
-
-        return cls(petl.cat(*tbls))
+        keys = []
+        for url in s3_keys:
+            _, _, bucket_, prefix = url.split("/", 3)
+
+            # Urls that end with '/' point to "folders", so load every file under them
+            if prefix.endswith("/"):
+                keys.extend(
+                    (bucket_, obj["Key"])
+                    for obj in s3.iter_keys(bucket_, prefix=prefix)
+                    if obj["Size"]
+                )
+            else:
+                keys.append((bucket_, prefix))
+
+        return cls(_S3PartsView(s3, keys, max_workers=max_workers, **csvargs))
 
     @classmethod
     def from_bigquery(cls, sql: str, app_creds: str | None = None, project: str | None = None):
@@ -18,6 +18,7 @@ from google.oauth2.credentials import Credentials
 
 from parsons import Table
 from parsons.databases.database_connector import DatabaseConnector
+from parsons.databases.row_hash_index import RowHashIndex
 from parsons.databases.table import BaseTable
 from parsons.google.google_cloud_storage import GoogleCloudStorage
 from parsons.google.utilities import (
@@ -925,11 +926,18 @@ class GoogleBigQuery(DatabaseConnector):
         max_timeout: int = 21600,
         convert_dict_list_columns_to_json: bool = True,
         keep_gcs_file: bool = False,
+        shards: int = 1,
         **load_kwargs,
     ):
         """
         Copy a :ref:`Table` into Google BigQuery via Google Cloud Storage.
 
+        By default the table is uploaded as a single CSV blob. With ``shards`` greater than
+        one, the rows are dealt out between that many gzipped CSV blobs, which are written
+        and uploaded concurrently under a common prefix and then loaded with a single
+        wildcard-URI load job. The table is still only read once, and nothing is written
+        to local disk.
+
         Args:
             tbl: obj
                 The Parsons Table to copy into BigQuery.
@@ -959,11 +967,19 @@ class GoogleBigQuery(DatabaseConnector):
                 The maximum number of seconds to wait for a request before the job fails.
             convert_dict_list_columns_to_json: bool
                 If set to True, will convert any dict or list columns (which cannot by default be successfully loaded to BigQuery to JSON strings)
+            keep_gcs_file: bool
+                If set to True, the staged blobs are not deleted after the load.
+            shards: int
+                The number of blobs to split the table between. When greater than one,
+                ``temp_blob_name`` is used as the prefix the shards are uploaded under.
             `**load_kwargs`: kwargs
                 Arguments to pass to the underlying load_table_from_uri call on the BigQuery
                 client.
 
         """
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+
         data_type = "csv"
         tmp_gcs_bucket = (
             tmp_gcs_bucket
@@ -996,11 +1012,29 @@ class GoogleBigQuery(DatabaseConnector):
         )
 
         gcs_client = gcs_client or GoogleCloudStorage(app_creds=self.app_creds)
-        temp_blob_name = temp_blob_name if temp_blob_name else f"{uuid.uuid4()}.{data_type}"
-        temp_blob_uri = gcs_client.upload_table(tbl, tmp_gcs_bucket, temp_blob_name)
+
+        if shards > 1:
+            prefix = temp_blob_name or str(uuid.uuid4())
+            blob_names = [f"{prefix}/shard-{i:05d}.{data_type}.gz" for i in range(shards)]
+            temp_blob_uri = f"gs://{tmp_gcs_bucket}/{prefix}/shard-*.{data_type}.gz"
+        else:
+            temp_blob_name = temp_blob_name if temp_blob_name else f"{uuid.uuid4()}.{data_type}"
+            blob_names = [temp_blob_name]
 
         # load CSV from Cloud Storage into BigQuery
         try:
+            if shards > 1:
+                tbl.map_shards(
+                    shards,
+                    lambda shard, i: gcs_client.upload_table(
+                        shard, tmp_gcs_bucket, blob_names[i], stream=True, compression="gzip"
+                    ),
+                )
+            else:
+                temp_blob_uri = gcs_client.upload_table(
+                    tbl, tmp_gcs_bucket, temp_blob_name, stream=True
+                )
+
             self._load_table_from_uri(
                 source_uris=temp_blob_uri,
                 destination=self.get_table_ref(table_name=table_name),
@@ -1010,24 +1044,27 @@ class GoogleBigQuery(DatabaseConnector):
             )
         finally:
             if not keep_gcs_file:
-                gcs_client.delete_blob(tmp_gcs_bucket, temp_blob_name)
+                for blob_name in blob_names:
+                    gcs_client.delete_blob(tmp_gcs_bucket, blob_name)
 
     @staticmethod
     def _stringify_records(tbl):
-        # Convert dict columns to JSON strings
-        for field in tbl.get_columns_type_stats():
-            if "dict" in field["type"] or "list" in field["type"]:
-                new_petl = tbl.table.addfield(
-                    field["name"] + "_replace",
-                    lambda row, field=field: json.dumps(row[field["name"]]),
-                )
-                new_tbl = Table(new_petl)
-                new_tbl.remove_column(field["name"])
-                new_tbl.rename_column(field["name"] + "_replace", field["name"])
-                new_tbl.materialize()
-                tbl = new_tbl
+        # Convert dict and list columns to JSON strings. The column types come from a
+        # single pass over the table, and all the columns are converted in one view.
+        columns = [
+            field["name"]
+            for field in tbl.get_columns_type_stats()
+            if "dict" in field["type"] or "list" in field["type"]
+        ]
+        if not columns:
+            return tbl
 
-        return tbl
+        # The converted columns are moved to the end of the table, as they always have been
+        header = tbl.columns
+        order = [i for i, c in enumerate(header) if c not in columns]
+        order += [i for i, c in enumerate(header) if c in columns]
+
+        return Table(petl.convert(tbl.table, columns, json.dumps).cut(*order))
 
     def _prepare_local_upload_job(
         self,
@@ -1138,6 +1175,7 @@ class GoogleBigQuery(DatabaseConnector):
         distinct_check=True,
         cleanup_temp_table=True,
         from_s3=False,
+        hash_index=None,
         **copy_args,
     ):
         r"""
@@ -1159,86 +1197,120 @@ class GoogleBigQuery(DatabaseConnector):
                 Instead of specifying a table_obj (set the first argument to None),
                 set this to True and include :meth:`.copy_s3`
                 arguments to upsert a pre-existing s3 file into the target_table
+            hash_index: str
+                The path to a local file in which to keep a hash of every upserted row
+                (see :class:`~parsons.databases.row_hash_index.RowHashIndex`). When set,
+                incoming rows that are unchanged since the last upsert with the same file
+                are skipped, and only new and changed rows are staged, deleted and
+                reinserted. The file only tracks changes made through it, so don't use it
+                if the target table is also modified by other means.
             `**copy_args`: kwargs
                 See :meth:`.copy` for options.
 
         """
-        if not self.table_exists(target_table):
-            logger.info("Target table does not exist. Copying into newly created target table.")
+        primary_keys = [primary_key] if isinstance(primary_key, str) else primary_key
+        target_exists = self.table_exists(target_table)
 
-            self.copy(table_obj, target_table)
-            return None
+        index = None
+        if hash_index:
+            if from_s3:
+                raise ValueError("upsert(... from_s3=True) can't be used with a hash_index.")
 
-        primary_keys = [primary_key] if isinstance(primary_key, str) else primary_key
+            index = RowHashIndex(hash_index, target_table)
 
-        if distinct_check:
-            primary_keys_statement = ", ".join(primary_keys)
-            diff = self.query(
-                f"""
-                select (
-                    select count(*)
-                    from {target_table}
-                ) - (
-                    SELECT COUNT(*) from (
-                        select distinct {primary_keys_statement}
+        try:
+            if index is not None:
+                if not target_exists:
+                    # Whatever the index remembers is no longer in the target table
+                    index.clear()
+
+                table_obj = index.changed_rows(table_obj, primary_keys)
+                if not table_obj:
+                    logger.info(f"No new or changed rows to upsert into {target_table}.")
+                    return None
+
+            if not target_exists:
+                logger.info("Target table does not exist. Copying into newly created target table.")
+
+                self.copy(table_obj, target_table)
+                if index is not None:
+                    index.commit()
+                return None
+
+            if distinct_check:
+                primary_keys_statement = ", ".join(primary_keys)
+                diff = self.query(
+                    f"""
+                    select (
+                        select count(*)
                         from {target_table}
+                    ) - (
+                        SELECT COUNT(*) from (
+                            select distinct {primary_keys_statement}
+                            from {target_table}
+                        )
+                    ) as total_count
+                """
+                ).first
+                if diff > 0:
+                    raise ValueError("Primary key column contains duplicate values.")
+
+            noise = f"{random.randrange(0, 10000):04}"[:4]
+            date_stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+            # Generate a temp table like "table_tmp_20200210_1230_14212"
+            staging_tbl = f"{target_table}_stg_{date_stamp}_{noise}"
+
+            # Copy to a staging table
+            logger.info(f"Building staging table: {staging_tbl}")
+
+            if from_s3:
+                if table_obj is not None:
+                    raise ValueError(
+                        "upsert(... from_s3=True) requires the first argument (table_obj)"
+                        " to be None. from_s3 and table_obj are mutually exclusive."
                     )
-                ) as total_count
-            """
-            ).first
-            if diff > 0:
-                raise ValueError("Primary key column contains duplicate values.")
-
-        noise = f"{random.randrange(0, 10000):04}"[:4]
-        date_stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
-        # Generate a temp table like "table_tmp_20200210_1230_14212"
-        staging_tbl = f"{target_table}_stg_{date_stamp}_{noise}"
-
-        # Copy to a staging table
-        logger.info(f"Building staging table: {staging_tbl}")
-
-        if from_s3:
-            if table_obj is not None:
-                raise ValueError(
-                    "upsert(... from_s3=True) requires the first argument (table_obj)"
-                    " to be None. from_s3 and table_obj are mutually exclusive."
+                self.copy_s3(staging_tbl, template_table=target_table, **copy_args)
+
+            else:
+                self.copy(
+                    tbl=table_obj,
+                    table_name=staging_tbl,
+                    template_table=target_table,
+                    **copy_args,
                 )
-            self.copy_s3(staging_tbl, template_table=target_table, **copy_args)
 
-        else:
-            self.copy(
-                tbl=table_obj,
-                table_name=staging_tbl,
-                template_table=target_table,
-                **copy_args,
-            )
+            # Delete rows
+            comparisons = [
+                f"`{staging_tbl}`.{primary_key} = `{target_table}`.{primary_key}"
+                for primary_key in primary_keys
+            ]
+            where_clause = " and ".join(comparisons)
 
-        # Delete rows
-        comparisons = [
-            f"`{staging_tbl}`.{primary_key} = `{target_table}`.{primary_key}"
-            for primary_key in primary_keys
-        ]
-        where_clause = " and ".join(comparisons)
-
-        queries = [
-            f"""
-                DELETE FROM `{target_table}`
-                WHERE EXISTS
-                (SELECT * FROM `{staging_tbl}`
-                WHERE {where_clause})
-                """,
-            f"""
-                INSERT INTO `{target_table}`
-                SELECT * FROM `{staging_tbl}`
-                """,
-        ]
+            queries = [
+                f"""
+                    DELETE FROM `{target_table}`
+                    WHERE EXISTS
+                    (SELECT * FROM `{staging_tbl}`
+                    WHERE {where_clause})
+                    """,
+                f"""
+                    INSERT INTO `{target_table}`
+                    SELECT * FROM `{staging_tbl}`
+                    """,
+            ]
 
-        try:
-            return self.query_with_transaction(queries=queries)
+            try:
+                result = self.query_with_transaction(queries=queries)
+                if index is not None:
+                    index.commit()
+                return result
+            finally:
+                if cleanup_temp_table:
+                    logger.info(f"Deleting staging table: {staging_tbl}")
+                    self.query(f"DROP TABLE IF EXISTS {staging_tbl}", return_values=False)
         finally:
-            if cleanup_temp_table:
-                logger.info(f"Deleting staging table: {staging_tbl}")
-                self.query(f"DROP TABLE IF EXISTS {staging_tbl}", return_values=False)
+            if index is not None:
+                index.close()
 
     def delete_table(self, table_name):
         """
@@ -1,5 +1,6 @@
 import datetime
 import gzip
+import io
 import logging
 import time
 import uuid
@@ -20,6 +21,10 @@ from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
+# Bytes sent per request when streaming a table into a resumable upload. GCS requires
+# chunks to be a multiple of 256 KB.
+STREAM_CHUNK_SIZE = 32 * 1024 * 1024
+
 
 class GoogleCloudStorage:
     """Google Cloud Storage connector utility
@@ -321,10 +326,19 @@ class GoogleCloudStorage:
         data_type: Literal["csv", "json"] = "csv",
         default_acl=None,
         timeout: int = 60,
+        stream: bool = False,
+        compression: Literal["gzip"] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
     ):
         """
         Load the data from a Parsons table into a blob.
 
+        By default the table is written to a local temp file, which is then uploaded. With
+        ``stream=True``, the table is rendered straight into a resumable upload instead,
+        ``chunk_size`` bytes at a time, so no local disk is used and memory use is bounded
+        by the chunk size however large the table is. A streamed upload can't be retried
+        from the middle, so a failed upload must be restarted.
+
         Args:
             table: obj
                 A :ref:`Table`
@@ -333,9 +347,20 @@ class GoogleCloudStorage:
             blob_name: str
                 The name of the blob to upload the data into.
             data_type: str
-                The file format to use when writing the data. One of: `csv` or `json`
+                The file format to use when writing the data. One of: `csv` or `json`.
+                JSON is written as an array of objects, or as newline-delimited JSON when
+                streaming.
             default_acl:
                 ACL desired for newly uploaded table
+            timeout: int
+                Seconds to wait for each request to GCS.
+            stream: bool
+                If ``True``, upload the table without writing it to a local file first.
+            compression: str
+                Set to ``gzip`` to gzip the data before uploading it.
+            chunk_size: int
+                When streaming, the number of bytes to send in each request. Must be a
+                multiple of 256 KB.
 
         Returns:
             String representation of file URI in GCS
@@ -344,25 +369,50 @@ class GoogleCloudStorage:
         bucket = storage.Bucket(self.client, name=bucket_name)
         blob = storage.Blob(blob_name, bucket)
 
-        if data_type == "csv":
-            # If a parsons Table is loaded from a CSV and has had no
-            # transformations, the Table.table object will be a petl
-            # CSVView. Once any transformations are made, the Table.table
-            # becomes a different petl class
-            if isinstance(table.table, petl.io.csv_py3.CSVView):
-                try:
-                    local_file = table.table.source.filename
-                except AttributeError:
-                    local_file = table.to_csv()
-            else:
-                local_file = table.to_csv()
-            content_type = "text/csv"
-        elif data_type == "json":
-            local_file = table.to_json()
-            content_type = "application/json"
-        else:
+        if data_type not in ("csv", "json"):
             raise ValueError(f"Unknown data_type value ({data_type}): must be one of: csv or json")
 
+        content_type = "text/csv" if data_type == "csv" else "application/json"
+        if compression:
+            content_type = "application/gzip"
+
+        # If a parsons Table is loaded from a CSV and has had no
+        # transformations, the Table.table object will be a petl
+        # CSVView. Once any transformations are made, the Table.table
+        # becomes a different petl class
+        local_file = None
+        if (
+            data_type == "csv"
+            and not compression
+            and isinstance(table.table, petl.io.csv_py3.CSVView)
+        ):
+            local_file = getattr(table.table.source, "filename", None)
+
+        if stream and not local_file:
+            if data_type == "csv":
+                file_obj = table.to_csv_stream(compression=compression)
+            else:
+                file_obj = table.to_json_stream(compression=compression)
+
+            # Without a size, the upload is resumable and sent one chunk at a time
+            blob.chunk_size = chunk_size
+            blob.upload_from_file(
+                io.BufferedReader(file_obj),
+                content_type=content_type,
+                client=self.client,
+                predefined_acl=default_acl,
+                timeout=timeout,
+            )
+            logger.debug(f"Streamed {file_obj.row_count} rows to {blob_name}.")
+
+            return f"gs://{bucket_name}/{blob_name}"
+
+        if not local_file:
+            if data_type == "csv":
+                local_file = table.to_csv(temp_file_compression=compression)
+            else:
+                local_file = table.to_json(temp_file_compression=compression)
+
         try:
             blob.upload_from_filename(
                 local_file,
@@ -7,6 +7,7 @@ from requests import request as _request
 
 from parsons.etl.table import Table
 from parsons.utilities import check_env
+from parsons.utilities.api_connector import pages_to_table
 from parsons.utilities.datetime import date_to_timestamp
 
 logger = logging.getLogger(__name__)
@@ -55,16 +56,17 @@ class MobilizeAmerica:
 
         return r
 
-    def _request_paginate(self, url, req_type="GET", args=None, auth=False):
+    def _iter_pages(self, url, req_type="GET", args=None, auth=False):
+        # Yield the data from each page as it is requested
         r = self._request(url, req_type=req_type, args=args, auth=auth)
-
-        json = r.json()["data"]
+        yield r.json()["data"]
 
         while r.json()["next"]:
             r = self._request(r.json()["next"], req_type=req_type, auth=auth)
-            json.extend(r.json()["data"])
+            yield r.json()["data"]
 
-        return json
+    def _paginated_table(self, url, req_type="GET", args=None, auth=False):
+        return pages_to_table(self._iter_pages(url, req_type, args, auth))
 
     def _time_parse(self, time_arg):
         # Parse the date filters
@@ -97,11 +99,9 @@ class MobilizeAmerica:
                 See :ref:`Table` for output options.
 
         """
-        return Table(
-            self._request_paginate(
-                self.uri + "organizations",
-                args={"updated_since": date_to_timestamp(updated_since)},
-            )
+        return self._paginated_table(
+            self.uri + "organizations",
+            args={"updated_since": date_to_timestamp(updated_since)},
         )
 
     def get_promoted_organizations(self, organization_id):
@@ -117,7 +117,7 @@ class MobilizeAmerica:
 
         """
         url = self.uri + "organizations/" + str(organization_id) + "/promoted_organizations"
-        return Table(self._request_paginate(url, auth=True))
+        return self._paginated_table(url, auth=True)
 
     def get_events(
         self,
@@ -174,7 +174,7 @@ class MobilizeAmerica:
             "timeslot_end": self._time_parse(timeslot_end),
         }
 
-        tbl = Table(self._request_paginate(self.uri + "events", args=args))
+        tbl = self._paginated_table(self.uri + "events", args=args)
 
         if tbl.num_rows > 0:
             tbl.unpack_dict("sponsor")
@@ -276,12 +276,10 @@ class MobilizeAmerica:
             "timeslot_end": self._time_parse(timeslot_end),
         }
 
-        tbl = Table(
-            self._request_paginate(
-                self.uri + "organizations/" + str(organization_id) + "/events",
-                args=args,
-                auth=True,
-            )
+        tbl = self._paginated_table(
+            self.uri + "organizations/" + str(organization_id) + "/events",
+            args=args,
+            auth=True,
         )
 
         if tbl.num_rows > 0:
@@ -330,7 +328,7 @@ class MobilizeAmerica:
             "updated_since": date_to_timestamp(updated_since),
         }
 
-        return Table(self._request_paginate(self.uri + "events/deleted", args=args))
+        return self._paginated_table(self.uri + "events/deleted", args=args)
 
     def get_people(self, organization_id, updated_since=None):
         """
@@ -359,7 +357,7 @@ class MobilizeAmerica:
         else:
             url = self.uri + "organizations/" + str(organization_id) + "/people"
             args = {"updated_since": date_to_timestamp(updated_since)}
-            return Table(self._request_paginate(url, args=args, auth=True))
+            return self._paginated_table(url, args=args, auth=True)
 
     def get_attendances(self, organization_id, updated_since=None):
         """
@@ -383,4 +381,4 @@ class MobilizeAmerica:
         """
         url = self.uri + "organizations/" + str(organization_id) + "/attendances"
         args = {"updated_since": date_to_timestamp(updated_since)}
-        return Table(self._request_paginate(url, args=args, auth=True))
+        return self._paginated_table(url, args=args, auth=True)
@@ -3,7 +3,6 @@
 import logging
 from typing import Literal
 
-from parsons.etl.table import Table
 from parsons.ngpvan.utilities import action_parse
 
 logger = logging.getLogger(__name__)
@@ -22,7 +21,7 @@ class ActivistCodes:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("activistCodes"))
+        tbl = self.connection.get_table("activistCodes")
         logger.info(f"Found {tbl.num_rows} activist codes.")
         return tbl
 
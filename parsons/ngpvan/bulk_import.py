@@ -79,7 +79,7 @@ class BulkImport:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("bulkImportMappingTypes"))
+        tbl = self.connection.get_table("bulkImportMappingTypes")
         logger.info(f"Found {tbl.num_rows} bulk import mapping types.")
         return tbl
 
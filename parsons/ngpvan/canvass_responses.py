@@ -20,7 +20,7 @@ class CanvassResponses:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("canvassResponses/contactTypes"))
+        tbl = self.connection.get_table("canvassResponses/contactTypes")
         logger.info(f"Found {tbl.num_rows} canvass response contact types.")
         return tbl
 
@@ -33,7 +33,7 @@ class CanvassResponses:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("canvassResponses/inputTypes"))
+        tbl = self.connection.get_table("canvassResponses/inputTypes")
         logger.info(f"Found {tbl.num_rows} canvass response input types.")
         return tbl
 
@@ -45,7 +45,7 @@ class CanvassResponses:
             See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("canvassResponses/resultCodes"))
+        tbl = self.connection.get_table("canvassResponses/resultCodes")
         logger.info(f"Found {tbl.num_rows} canvass response result codes.")
 
         return tbl
@@ -37,7 +37,7 @@ class ChangedEntities:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request(f"changedEntityExportJobs/fields/{resource_type}"))
+        tbl = self.connection.get_table(f"changedEntityExportJobs/fields/{resource_type}")
         logger.info(f"Found {tbl.num_rows} fields for {resource_type}.")
         return tbl
 
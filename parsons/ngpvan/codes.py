@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +36,7 @@ class Codes:
             "$top": 200,
         }
 
-        tbl = Table(self.connection.get_request("codes", params=params))
+        tbl = self.connection.get_table("codes", params=params)
         logger.info(f"Found {tbl.num_rows} codes.")
         return tbl
 
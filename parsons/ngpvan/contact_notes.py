@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +22,7 @@ class ContactNotes:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request(f"people/{van_id}/notes"))
+        tbl = self.connection.get_table(f"people/{van_id}/notes")
         logger.info(f"Found {tbl.num_rows} custom fields.")
         return tbl
 
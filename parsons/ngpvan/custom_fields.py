@@ -26,7 +26,7 @@ class CustomFields:
         """
         params = {"customFieldsGroupType": field_type.capitalize()}
 
-        tbl = Table(self.connection.get_request("customFields", params=params))
+        tbl = self.connection.get_table("customFields", params=params)
         logger.info(f"Found {tbl.num_rows} custom fields.")
         return tbl
 
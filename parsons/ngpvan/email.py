@@ -42,7 +42,7 @@ class Email:
                 "$orderby": "dateModified desc",
             }
 
-        tbl = Table(self.connection.get_request("email/messages", params=params))
+        tbl = self.connection.get_table("email/messages", params=params)
         logger.debug(f"Found {tbl.num_rows} emails.")
         return tbl
 
@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -73,7 +71,7 @@ class Events:
             "$expand": expand_fields,
         }
 
-        tbl = Table(self.connection.get_request("events", params=params))
+        tbl = self.connection.get_table("events", params=params)
         logger.info(f"Found {tbl.num_rows} events.")
         return tbl
 
@@ -276,6 +274,6 @@ class Events:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("events/types"))
+        tbl = self.connection.get_table("events/types")
         logger.info(f"Found {tbl.num_rows} events.")
         return tbl
@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +22,7 @@ class Locations:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("locations", params={"name": name}))
+        tbl = self.connection.get_table("locations", params={"name": name})
         logger.info(f"Found {tbl.num_rows} locations.")
         return self._unpack_loc(tbl)
 
@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -41,7 +39,7 @@ class PrintedLists:
 
         params = {key: value for key, value in params.items() if value is not None}
 
-        tbl = Table(self.connection.get_request("printedLists", params=params))
+        tbl = self.connection.get_table("printedLists", params=params)
 
         logger.info(f"Found {tbl.num_rows} printed lists.")
         return tbl
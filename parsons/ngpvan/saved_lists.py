@@ -29,7 +29,7 @@ class SavedLists:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("savedLists", params={"folderId": folder_id}))
+        tbl = self.connection.get_table("savedLists", params={"folderId": folder_id})
         logger.info(f"Found {tbl.num_rows} saved lists.")
         return tbl
 
@@ -295,7 +295,7 @@ class Folders:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("folders"))
+        tbl = self.connection.get_table("folders")
         logger.info(f"Found {tbl.num_rows} folders.")
         return tbl
 
@@ -330,7 +330,7 @@ class ExportJobs:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("exportJobTypes"))
+        tbl = self.connection.get_table("exportJobTypes")
         logger.info(f"Found {tbl.num_rows} export job types.")
         return tbl
 
@@ -6,7 +6,6 @@ from typing import Literal
 
 import petl
 
-from parsons.etl.table import Table
 from parsons.utilities import cloud_storage
 
 logger = logging.getLogger(__name__)
@@ -25,7 +24,7 @@ class Scores:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("scores"))
+        tbl = self.connection.get_table("scores")
         logger.info(f"Found {tbl.num_rows} scores.")
         return tbl
 
@@ -67,7 +66,7 @@ class Scores:
             "scoreId": score_id,
         }
 
-        tbl = Table(self.connection.get_request("scoreUpdates", params=params))
+        tbl = self.connection.get_table("scoreUpdates", params=params)
         if tbl.num_rows:
             tbl.unpack_dict("updateStatistics", prepend=False)
             tbl.unpack_dict("score", prepend=False)
@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +37,7 @@ class Signups:
         if event_type_id:
             params = {"eventTypeId": event_type_id}
 
-        tbl = Table(self.connection.get_request("signups/statuses", params=params))
+        tbl = self.connection.get_table("signups/statuses", params=params)
         logger.info(f"Found {tbl.num_rows} signups.")
         return tbl
 
@@ -56,7 +54,7 @@ class Signups:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("signups", params={"vanID": vanid}))
+        tbl = self.connection.get_table("signups", params={"vanID": vanid})
         logger.info(f"Found {tbl.num_rows} signups for {vanid}.")
         return self._unpack_signups(tbl)
 
@@ -72,7 +70,7 @@ class Signups:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("signups", params={"eventId": event_id}))
+        tbl = self.connection.get_table("signups", params={"eventId": event_id})
         logger.info(f"Found {tbl.num_rows} signups for event {event_id}.")
         return self._unpack_signups(tbl)
 
@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +18,7 @@ class SupporterGroups:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("supporterGroups"))
+        tbl = self.connection.get_table("supporterGroups")
         logger.info(f"Found {tbl.num_rows} supporter groups.")
         return tbl
 
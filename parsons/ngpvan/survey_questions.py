@@ -2,8 +2,6 @@
 
 import logging
 
-from parsons.etl.table import Table
-
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +44,7 @@ class SurveyQuestions:
             "cycle": cycle,
         }
 
-        tbl = Table(self.connection.get_request("surveyQuestions", params=params))
+        tbl = self.connection.get_table("surveyQuestions", params=params)
         logger.info(f"Found {tbl.num_rows} survey questions.")
         return tbl
 
@@ -29,7 +29,7 @@ class Targets:
                 See :ref:`Table` for output options.
 
         """
-        tbl = Table(self.connection.get_request("targets"))
+        tbl = self.connection.get_table("targets")
         logger.info(f"Found {tbl.num_rows} targets.")
         return tbl
 
@@ -5,7 +5,7 @@ from requests.auth import HTTPBasicAuth
 from suds.client import Client
 
 from parsons.utilities import check_env
-from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.api_connector import APIConnector, pages_to_table
 
 logger = logging.getLogger(__name__)
 
@@ -78,8 +78,23 @@ class VANConnector:
             return self.db
 
     def get_request(self, endpoint, **kwargs):
+        pages = self.iter_pages(endpoint, **kwargs)
+        data = next(pages)
+
+        if isinstance(data, list):
+            for page in pages:
+                data.extend(page)
+
+        return data
+
+    def get_table(self, endpoint, **kwargs):
+        """Return the records from a paginated endpoint as a ``Table``."""
+        return pages_to_table(self.iter_pages(endpoint, **kwargs))
+
+    def iter_pages(self, endpoint, **kwargs):
+        """Yield the parsed data of each page of an endpoint, requesting pages as needed."""
         r = self.api.get_request(url=(self.uri + endpoint), **kwargs)
-        data = self.api.data_parse(r)
+        yield self.api.data_parse(r)
 
         # Paginate. `nextPageLink` is a fully-formed URL that already encodes the
         # original query parameters, so we must not re-pass `params` on
@@ -94,8 +109,7 @@ class VANConnector:
             if endpoint == "printedLists" and not r["items"]:
                 break
             r = self.api.get_request(url=r[self.pagination_key], **page_kwargs)
-            data.extend(self.api.data_parse(r))
-        return data
+            yield self.api.data_parse(r)
 
     def post_request(self, endpoint, **kwargs):
         return self.api.post_request(url=endpoint, **kwargs)
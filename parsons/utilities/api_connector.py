@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import time
 import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any, overload
 
+import petl
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from simplejson.errors import JSONDecodeError
+from urllib3.util.retry import Retry
 
 from parsons import Table
+from parsons.utilities.rate_limiter import RateLimiter, retry_after_seconds
+from parsons.utilities.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    is_cacheable,
+)
 
 from ._api_connector_types import (
     _AuthType,
@@ -26,10 +41,78 @@ _Params = _ParamsType
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# The number of connections kept alive per host
+DEFAULT_POOL_SIZE = 10
+
+# Statuses that are safe to retry for idempotent requests
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def pages_to_table(pages: Iterable[list], limit: int | None = None, lazy: bool = False) -> Table:
+    """
+    Build a Parsons Table from an iterable of pages of records.
+
+    By default every page is requested before the table is returned, so any error is
+    raised right away. With ``lazy``, pages are only requested as the table is read, so
+    transformations can start before the last page has arrived and the full result set
+    is never held in memory as a list. The rows are cached to a temp file as they are
+    read, so the table can still be read more than once, and the columns are taken from
+    the first 1,000 records. If a page fails, the error is raised by that read and by
+    every later read of the table, rather than leaving it silently truncated.
+
+    Args:
+        pages: An iterable, usually a generator, yielding lists of record dicts.
+        limit: If set, stop after this many records.
+        lazy: Whether to request pages only as the table is read.
+
+    Returns:
+        Table
+
+    """
+    records = itertools.chain.from_iterable(pages)
+    if limit:
+        records = itertools.islice(records, limit)
+
+    if not lazy:
+        return Table(list(records))
+
+    errors = []
+
+    def guarded_records():
+        try:
+            yield from records
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    # Table only streams generators; other iterators are read into a list
+    return Table(_PagesView(Table(guarded_records()).table, errors))
+
+
+class _PagesView(petl.Table):
+    """
+    A petl view over a lazily paged table that re-raises the error that stopped paging,
+    since the rows cached before it would otherwise read as a complete table.
+    """
+
+    def __init__(self, source, errors):
+        self.source = source
+        self.errors = errors
+
+    def __iter__(self):
+        if self.errors:
+            raise self.errors[0]
+
+        yield from self.source
+
+        if self.errors:
+            raise self.errors[0]
+
 
 class APIConnector:
     """
@@ -40,8 +123,31 @@ class APIConnector:
     The goal of this class is create series of utilities that can be
     mixed and matched to, hopefully, meet the needs of the specific API.
 
+    All requests are made through a single :class:`requests.Session`, so connections
+    (and their TLS handshakes) are pooled and reused across requests to the same host.
+
+    If a rate limit is set, every connector calling the same host shares one
+    :class:`~parsons.utilities.rate_limiter.RateLimiter`, so requests from all threads
+    stay within the host's budget, and a ``429 Too Many Requests`` response pauses all
+    of them until the ``Retry-After`` time has passed. If connectors set different limits
+    for the same host, the slowest rate and smallest burst are used by all of them.
+
+    ``GET`` responses can be cached by setting ``cache`` to a
+    :class:`~parsons.utilities.response_cache.ResponseCache`, which is useful for
+    metadata endpoints that are called repeatedly. Cached responses are reused until the
+    cache's ``ttl`` expires, then revalidated with ``If-None-Match`` or
+    ``If-Modified-Since`` where the server supports it.
+
     """
 
+    # Defaults for subclasses that don't call ``APIConnector.__init__``
+    pool_size = DEFAULT_POOL_SIZE
+    max_retries: int | Retry = 0
+    backoff_factor = 0.0
+    rate_limiter: RateLimiter | None = None
+    cache: ResponseCache | None = None
+    _session = None
+
     def __init__(
         self,
         uri: str,
@@ -49,6 +155,12 @@ class APIConnector:
         auth: _AuthType | None = None,
         pagination_key: str | None = None,
         data_key: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int | Retry = 0,
+        backoff_factor: float = 0.0,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialize the APIConnector.
@@ -68,6 +180,30 @@ class APIConnector:
                 The name of the key in the response json
                 where the data is contained.
                 Required if the data is nested in the response json.
+            pool_size:
+                The maximum number of connections to keep alive per host.
+                Raise this if the connector is used from many threads at once.
+            max_retries:
+                The number of times to retry a request that fails to connect, or an
+                idempotent request (e.g. ``GET``) that returns a 429 or 5xx status.
+                Alternatively, a :class:`urllib3.util.Retry` for full control.
+                Defaults to ``0``.
+            backoff_factor:
+                The backoff factor between retries. Retries sleep for
+                ``backoff_factor * 2 ** (retry - 1)`` seconds, unless the response
+                includes a ``Retry-After`` header.
+            requests_per_second:
+                If set, keep requests to the host of ``uri`` within this rate, across
+                all threads and all connectors for the host. Requests that are rate
+                limited (``429``) are then retried, up to ``max_retries`` times, once
+                the host's ``Retry-After`` time has passed.
+            burst:
+                The number of requests that may start at once after a quiet period,
+                when ``requests_per_second`` is set.
+            cache:
+                If set, a :class:`~parsons.utilities.response_cache.MemoryCache` or
+                :class:`~parsons.utilities.response_cache.SQLiteCache` in which to cache
+                successful ``GET`` responses. Other requests are never cached.
 
         """
         # Add a trailing slash if it's missing
@@ -79,6 +215,63 @@ class APIConnector:
         self.auth = auth
         self.pagination_key = pagination_key
         self.data_key = data_key
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+
+        if requests_per_second:
+            host = urllib.parse.urlsplit(uri).netloc
+            self.rate_limiter = RateLimiter.for_host(host, requests_per_second, burst)
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled :class:`requests.Session` used for requests. Created on first use."""
+        if self._session is None:
+            session = requests.Session()
+
+            # Like module-level ``requests`` calls, don't carry cookies between requests
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+            self.mount_adapters(session)
+            self._session = session
+
+        return self._session
+
+    def mount_adapters(self, session: requests.Session) -> None:
+        """
+        Mount connection pooling and retry adapters on a session.
+
+        Args:
+            session: The session to configure.
+
+        """
+        if isinstance(self.max_retries, Retry):
+            retries = self.max_retries
+        else:
+            # With a rate limiter, 429s are retried in ``request``, so the backoff is shared
+            statuses = RETRY_STATUSES
+            if self.rate_limiter is not None:
+                statuses = tuple(status for status in RETRY_STATUSES if status != 429)
+
+            retries = Retry(
+                total=self.max_retries,
+                backoff_factor=self.backoff_factor,
+                status_forcelist=statuses,
+                respect_retry_after_header=True,
+                # Return the last response, so validate_response can raise a useful error
+                raise_on_status=False,
+            )
+
+        adapter = HTTPAdapter(pool_maxsize=self.pool_size, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the session, releasing any pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def request(
         self,
@@ -122,7 +315,7 @@ class APIConnector:
                 ``additional_headers``, the value from ``additional_headers``
                 takes precedence. This does not mutate ``self.headers``.
             `**kwargs`:
-                Additional keyword arguments to pass to :func:`requests.request`.
+                Additional keyword arguments to pass to :meth:`requests.Session.request`.
 
         """
         full_url = urllib.parse.urljoin(self.uri, url)
@@ -132,22 +325,79 @@ class APIConnector:
         if additional_headers:
             complete_headers.update(additional_headers)
 
-        resp = requests.request(
+        key = entry = None
+        if self.cache is not None and req_type == "GET" and not kwargs.get("stream"):
+            prepared = self.session.prepare_request(
+                requests.Request(
+                    req_type, full_url, headers=complete_headers, auth=self.auth, params=params
+                )
+            )
+            key = cache_key(prepared)
+            entry = self.cache.get(key)
+
+            if entry is not None:
+                if entry.is_fresh(self.cache.ttl):
+                    logger.debug(f"Using cached response for {prepared.url}.")
+                    return entry.to_response()
+
+                complete_headers.update(entry.validators())
+
+        resp = self._send(
             req_type,
             full_url,
             headers=complete_headers,
-            auth=self.auth,
             json=json,
             data=data,
             params=params,
             **kwargs,
         )
 
+        if key is not None:
+            if resp.status_code == 304 and entry is not None:
+                logger.debug(f"Cached response for {resp.url} is still valid.")
+                entry.stored_at = time.time()
+                self.cache.set(key, entry)
+                resp = entry.to_response()
+
+            elif is_cacheable(resp):
+                self.cache.set(key, CachedResponse.from_response(resp))
+
         if raise_on_error:
             self.validate_response(resp)
 
         return resp
 
+    def _send(self, req_type: str, full_url: str, **kwargs) -> requests.Response:
+        # Send a request through the session, retrying rate limited requests
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            resp = self.session.request(req_type, full_url, auth=self.auth, **kwargs)
+
+            if not self._should_retry(resp, attempt):
+                return resp
+
+            attempt += 1
+            delay = retry_after_seconds(resp)
+            if delay is None:
+                delay = max(self.backoff_factor * 2 ** (attempt - 1), self.rate_limiter.interval)
+
+            logger.info(f"Rate limited by {full_url}, retrying in {delay:.1f} seconds.")
+            self.rate_limiter.backoff(delay)
+
+    def _should_retry(self, resp: requests.Response, attempt: int) -> bool:
+        # Only rate limited responses are retried here; urllib3 retries everything else
+        if self.rate_limiter is None or resp.status_code != 429:
+            return False
+
+        max_retries = self.max_retries
+        if isinstance(max_retries, Retry):
+            max_retries = max_retries.total or 0
+
+        return attempt < max_retries
+
     @overload
     def get_request(
         self,
@@ -426,6 +676,66 @@ class APIConnector:
 
             return r.status_code
 
+    def get_pages(
+        self,
+        fetch_page: Callable[[int], list],
+        start_page: int = 1,
+        max_workers: int = 1,
+        requests_per_second: float | None = None,
+    ) -> Iterator[list]:
+        """
+        Fetch consecutive, numbered pages until the first empty page.
+
+        With ``max_workers`` greater than one, up to that many pages are requested at
+        once, ahead of the page currently being consumed, but pages are always yielded in
+        order. Pages requested past the first empty page are discarded, along with any
+        errors they raise.
+
+        Close the generator (or stop iterating and let it be garbage collected) to stop
+        early, e.g. once a record limit is reached.
+
+        Args:
+            fetch_page:
+                A function that takes a page number and returns the list of records on
+                that page. Usually wraps :meth:`get_request`.
+            start_page: The number of the first page.
+            max_workers: The maximum number of pages to request concurrently.
+            requests_per_second:
+                If set, the page requests made by all workers are spaced out to stay
+                within this budget. To limit every request to the host instead, set
+                ``requests_per_second`` on the connector.
+
+        Yields:
+            The list of records on each page, in page order.
+
+        """
+        budget = RateLimiter(requests_per_second) if requests_per_second else None
+
+        def fetch(page: int) -> list:
+            if budget:
+                budget.acquire()
+            return fetch_page(page)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            next_page = start_page
+
+            try:
+                while True:
+                    while len(pending) < max_workers:
+                        pending.append(executor.submit(fetch, next_page))
+                        next_page += 1
+
+                    records = pending.popleft().result()
+                    if not records:
+                        return
+
+                    yield records
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def validate_response(self, resp: requests.Response) -> None:
         """
         Validate that the response is not an error code.
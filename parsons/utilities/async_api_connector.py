@@ -0,0 +1,610 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import urllib.parse
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from requests.exceptions import HTTPError
+
+from parsons import Table
+from parsons.utilities.api_connector import DEFAULT_POOL_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+    from typing import Literal
+
+    import httpx
+
+    from ._api_connector_types import (
+        _AuthType,
+        _DataType,
+        _HeadersType,
+        _JsonType,
+        _ParamsType,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait to connect, or for data, before giving up on a request
+DEFAULT_TIMEOUT = 60.0
+
+
+async def pages_to_table(pages: AsyncIterable[list], limit: int | None = None) -> Table:
+    """
+    Collect an async iterable of pages of records into a Parsons Table.
+
+    Args:
+        pages: An async iterable, usually :meth:`AsyncAPIConnector.get_pages`, yielding
+            lists of record dicts.
+        limit: If set, stop after this many records.
+
+    Returns:
+        Table
+
+    """
+    records = []
+    async for page in pages:
+        records.extend(page)
+        if limit and len(records) >= limit:
+            del records[limit:]
+            break
+
+    return Table(records)
+
+
+class AsyncAPIConnector:
+    """
+    Low level class for asynchronous API requests, built on :mod:`httpx`.
+
+    This mirrors :class:`~parsons.utilities.api_connector.APIConnector`, but every request
+    method is a coroutine. All requests share one :class:`httpx.AsyncClient`, so
+    connections are pooled, and at most ``max_concurrency`` requests are in flight at
+    once, however many are awaited together. That makes it safe to fan out thousands
+    of calls with :meth:`gather`.
+
+    The client is bound to the event loop it was first used on. Use the connector as an
+    async context manager, or call :meth:`aclose` when done:
+
+    .. code-block:: python
+
+        async def fetch_people(ids):
+            async with AsyncAPIConnector("https://api.example.com/v1/") as api:
+                return await api.gather(lambda i: api.get_request(f"people/{i}"), ids)
+
+        people = asyncio.run(fetch_people(ids))
+
+    Requires the ``async`` extra (``pip install parsons[async]``).
+
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        headers: _HeadersType | None = None,
+        auth: _AuthType | None = None,
+        pagination_key: str | None = None,
+        data_key: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_concurrency: int | None = None,
+        max_retries: int = 0,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the AsyncAPIConnector.
+
+        Args:
+            uri:
+                The base uri for the api.
+                Must include a trailing ``/``.
+                E.g. ``http://myapi.com/v1/``.
+            headers: The request headers
+            auth:
+                The request authorization parameters, e.g. a ``(username, password)``
+                tuple or an :class:`httpx.Auth`.
+            pagination_key:
+                The name of the key in the response json
+                where the pagination url is located.
+                Required for pagination.
+            data_key:
+                The name of the key in the response json
+                where the data is contained.
+                Required if the data is nested in the response json.
+            pool_size: The maximum number of open connections.
+            max_concurrency:
+                The maximum number of requests in flight at once.
+                Defaults to ``pool_size``.
+            max_retries:
+                The number of times to retry a request that fails to connect.
+                Defaults to ``0``.
+            timeout:
+                Seconds to wait to connect, or for data, before raising an error.
+                ``None`` waits forever.
+
+        """
+        # Add a trailing slash if it's missing
+        if not uri.endswith("/"):
+            uri = uri + "/"
+
+        self.uri = uri
+        self.headers = headers
+        self.auth = auth
+        self.pagination_key = pagination_key
+        self.data_key = data_key
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency or pool_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> AsyncAPIConnector:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled :class:`httpx.AsyncClient` used for requests. Created on first use."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                auth=self.auth,
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                    ),
+                    retries=self.max_retries,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client, releasing any pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    async def request(
+        self,
+        url: str,
+        req_type: Literal["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        *,
+        json: Any | None = None,
+        data: _DataType | None = None,
+        params: _ParamsType | None = None,
+        raise_on_error: bool = True,
+        additional_headers: _HeadersType | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Base request using httpx.
+
+        Args:
+            url:
+                The url request string.
+                If ``url`` is a relative URL,
+                it will be joined with the ``uri`` of the ``AsyncAPIConnector``.
+                If ``url`` is an absolute URL, it will be used as is.
+            req_type: The request type.
+            json:
+                The payload of the request object.
+                By using json, it will automatically serialize the dictionary.
+            data:
+                The payload of the request object.
+                Use instead of json in some instances.
+            params:
+                The parameters to append to the url.
+                E.g. ``http://myapi.com/things?id=1``
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an :class:`HTTPError`.
+            additional_headers:
+                Additional headers to include in this specific request.
+                If a header key exists in both ``self.headers`` and
+                ``additional_headers``, the value from ``additional_headers``
+                takes precedence. This does not mutate ``self.headers``.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        """
+        full_url = urllib.parse.urljoin(self.uri, url)
+        complete_headers = {}
+        if self.headers:
+            complete_headers.update(self.headers)
+        if additional_headers:
+            complete_headers.update(additional_headers)
+
+        # httpx takes form data and raw content as separate arguments
+        if isinstance(data, (str, bytes)):
+            kwargs["content"] = data
+            data = None
+
+        client = self.client
+        async with self._semaphore:
+            resp = await client.request(
+                req_type,
+                full_url,
+                headers=complete_headers,
+                json=json,
+                data=data,
+                params=params,
+                **kwargs,
+            )
+
+        if raise_on_error:
+            self.validate_response(resp)
+
+        return resp
+
+    async def get_request(
+        self,
+        url: str,
+        *,
+        params: _ParamsType | None = None,
+        return_format: Literal["json", "content"] = "json",
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> _JsonType | bytes:
+        """
+        Make a GET request.
+
+        Args:
+            url: A complete and valid url for the api request.
+            params: The request parameters.
+            return_format: ``json`` or ``content``.
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an error.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        Returns:
+            The json from the response if `return_format` is ``json``,
+            or the raw bytes of the response if `return_format` is ``content``.
+
+        Raises:
+            RuntimeError: If `return_format` is not ``json`` or ``content``.
+
+        """
+        r = await self.request(url, "GET", params=params, raise_on_error=raise_on_error, **kwargs)
+        self.validate_response(r)
+
+        if return_format == "json":
+            return r.json()
+
+        if return_format == "content":
+            return r.content
+
+        raise RuntimeError(f"{return_format} is not a valid format, change to json or content")
+
+    async def _send(
+        self,
+        url: str,
+        req_type: Literal["POST", "PUT", "PATCH", "DELETE"],
+        success_codes: list[int] | None,
+        **kwargs,
+    ) -> _JsonType:
+        r = await self.request(url, req_type, **kwargs)
+
+        # Some APIs return messages with the success code and some do not.
+        # Be able to account for both of these types.
+        if success_codes is None:
+            success_codes = [200, 201, 202, 204]
+
+        if r.status_code in success_codes:
+            if self.json_check(r):
+                return r.json()
+
+            return r.status_code
+
+    async def post_request(
+        self,
+        url: str,
+        *,
+        params: _ParamsType | None = None,
+        data: _DataType | None = None,
+        json: _JsonType | None = None,
+        success_codes: list[int] | None = None,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> _JsonType:
+        """
+        Make a POST request.
+
+        Args:
+            url: A complete and valid url for the api request
+            params: The request parameters
+            data: A data object to post
+            json: A JSON object to post
+            success_codes:
+                The expected success code to be returned.
+                If not provided, accepts 200, 201, 202, and 204.
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an error.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        Returns:
+            If successful, the json from the response or its status code, as available.
+            ``None`` if the request fails and `raise_on_error` is ``False``.
+
+        """
+        return await self._send(
+            url,
+            "POST",
+            success_codes,
+            params=params,
+            data=data,
+            json=json,
+            raise_on_error=raise_on_error,
+            **kwargs,
+        )
+
+    async def delete_request(
+        self,
+        url: str,
+        *,
+        params: _ParamsType | None = None,
+        success_codes: list[int] | None = None,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> _JsonType:
+        """
+        Make a DELETE request.
+
+        Args:
+            url: A complete and valid url for the api request
+            params: The request parameters
+            success_codes:
+                The expected success codes to be returned.
+                If not provided, accepts 200, 201, 202, and 204.
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an error.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        Returns:
+            If successful, the json from the response or its status code, as available.
+            ``None`` if the request fails and `raise_on_error` is ``False``.
+
+        """
+        return await self._send(
+            url, "DELETE", success_codes, params=params, raise_on_error=raise_on_error, **kwargs
+        )
+
+    async def put_request(
+        self,
+        url: str,
+        *,
+        data: _DataType | None = None,
+        json: _JsonType | None = None,
+        params: _ParamsType | None = None,
+        success_codes: list[int] | None = None,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> _JsonType:
+        """
+        Make a PUT request.
+
+        Args:
+            url: A complete and valid url for the api request
+            data: A data object to post
+            json: A JSON object to post
+            params: The request parameters
+            success_codes:
+                The expected success codes to be returned.
+                If not provided, accepts 200, 201, 202, and 204.
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an error.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        Returns:
+            If successful, the json from the response or its status code, as available.
+            ``None`` if the request fails and `raise_on_error` is ``False``.
+
+        """
+        return await self._send(
+            url,
+            "PUT",
+            success_codes,
+            params=params,
+            data=data,
+            json=json,
+            raise_on_error=raise_on_error,
+            **kwargs,
+        )
+
+    async def patch_request(
+        self,
+        url: str,
+        *,
+        params: _ParamsType | None = None,
+        data: _DataType | None = None,
+        json: _JsonType | None = None,
+        success_codes: list[int] | None = None,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> _JsonType:
+        """
+        Make a PATCH request.
+
+        Args:
+            url: A complete and valid url for the api request
+            params: The request parameters
+            data: A data object to post
+            json: A JSON object to post
+            success_codes:
+                The expected success codes to be returned.
+                If not provided, accepts 200, 201, 202, and 204.
+            raise_on_error:
+                If the request yields an error status code (anything above 400),
+                raise an error.
+            `**kwargs`:
+                Additional keyword arguments to pass to :meth:`httpx.AsyncClient.request`.
+
+        Returns:
+            If successful, the json from the response or its status code, as available.
+            ``None`` if the request fails and `raise_on_error` is ``False``.
+
+        """
+        return await self._send(
+            url,
+            "PATCH",
+            success_codes,
+            params=params,
+            data=data,
+            json=json,
+            raise_on_error=raise_on_error,
+            **kwargs,
+        )
+
+    async def gather(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Call a coroutine function on every item concurrently.
+
+        The requests it makes are still limited to ``max_concurrency`` at a time.
+
+        Args:
+            func:
+                A coroutine function that takes one item, usually wrapping
+                :meth:`get_request` or :meth:`post_request`.
+            items: The items to call ``func`` on.
+            return_exceptions:
+                If ``True``, exceptions are returned in place of the failed items'
+                results, instead of being raised.
+
+        Returns:
+            The results, in the same order as ``items``.
+
+        """
+        return await asyncio.gather(
+            *(func(item) for item in items), return_exceptions=return_exceptions
+        )
+
+    async def get_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[list]],
+        start_page: int = 1,
+        max_workers: int = 1,
+    ) -> AsyncIterator[list]:
+        """
+        Fetch consecutive, numbered pages until the first empty page.
+
+        With ``max_workers`` greater than one, up to that many pages are requested at
+        once, ahead of the page currently being consumed, but pages are always yielded in
+        order. Pages requested past the first empty page are cancelled.
+
+        Args:
+            fetch_page:
+                A coroutine function that takes a page number and returns the list of
+                records on that page. Usually wraps :meth:`get_request`.
+            start_page: The number of the first page.
+            max_workers: The maximum number of pages to request concurrently.
+
+        Yields:
+            The list of records on each page, in page order.
+
+        """
+        pending = deque()
+        page_numbers = itertools.count(start_page)
+
+        try:
+            while True:
+                while len(pending) < max_workers:
+                    pending.append(asyncio.ensure_future(fetch_page(next(page_numbers))))
+
+                records = await pending.popleft()
+                if not records:
+                    return
+
+                yield records
+
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let cancelled requests release their connections
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def validate_response(self, resp: httpx.Response) -> None:
+        """
+        Validate that the response is not an error code.
+
+        If it is, then raise an :class:`HTTPError` and display the error message.
+
+        """
+        if resp.status_code < 400:
+            return
+
+        message = f"Code: {resp.status_code}; URL: {resp.url}"
+
+        if resp.reason_phrase:
+            message = f"{message}; Reason: {resp.reason_phrase}"
+
+        elif resp.text:
+            message = f"{message}; Text: {resp.text}"
+
+        # Some errors return JSONs with useful info about the error.
+        if self.json_check(resp):
+            message = f"{message}; JSON: {resp.json()}"
+
+        raise HTTPError(message)
+
+    def data_parse(self, resp: dict[str, Any] | list) -> dict[str, Any] | list:
+        """
+        Determines if the response json has nested data.
+
+        If it is nested, it just returns the data.
+
+        """
+        if isinstance(resp, list):
+            return resp
+
+        if self.data_key and self.data_key in resp:
+            return resp[self.data_key]
+
+        return resp
+
+    def next_page_check_url(self, resp: dict[str, Any]) -> bool:
+        """
+        Check to determine if there is a next page.
+
+        This requires that the response json contains a pagination key
+        that is empty if there is not a next page.
+
+        """
+        if self.pagination_key and self.pagination_key in resp:
+            return bool(resp[self.pagination_key])
+
+        return False
+
+    def json_check(self, resp: httpx.Response) -> bool:
+        """Check to see if a response has a json included in it."""
+        try:
+            resp.json()
+            return True
+
+        except ValueError:
+            return False
+
+    def convert_to_table(self, data: list | Any) -> Table:
+        """Internal method to create a Parsons table from a data element."""
+        return Table(data) if isinstance(data, list) else Table([data])
@@ -79,6 +79,7 @@ class OAuth2APIConnector(APIConnector):
             token_updater=self.token_saver,
             auto_refresh_kwargs=authorization_kwargs,
         )
+        self.mount_adapters(self.client)
 
     def request(
         self,
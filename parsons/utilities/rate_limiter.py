@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import email.utils
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket that keeps requests within a rate limit.
+
+    Up to ``burst`` requests may start at once, after which requests start no more often
+    than ``requests_per_second``. Every thread sharing a limiter draws from the same
+    budget, and a :meth:`backoff` (e.g. after a ``429 Too Many Requests`` response)
+    pauses all of them, so concurrent workers slow down together rather than each
+    running into the limit.
+
+    Use :meth:`for_host` to share one limiter between every connector that calls the same
+    host. When connectors configure different limits for a host, the slowest one wins.
+
+    Args:
+        requests_per_second: The sustained rate at which requests may start.
+        burst:
+            The number of requests that may start at once after a quiet period.
+            Defaults to ``1``, which evenly spaces out every request.
+
+    """
+
+    _host_limiters: dict[str, RateLimiter] = {}
+    _host_lock = threading.Lock()
+
+    def __init__(self, requests_per_second: float, burst: int = 1) -> None:
+        self._lock = threading.Lock()
+        # The time at which the bucket will next be full
+        self._full_at = time.monotonic()
+        self.configure(requests_per_second, burst)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(requests_per_second={self.requests_per_second}, burst={self.burst})"
+
+    @classmethod
+    def for_host(cls, host: str, requests_per_second: float, burst: int = 1) -> RateLimiter:
+        """
+        Get the limiter shared by all requests to a host, creating it if needed.
+
+        If a limiter already exists for the host, it keeps the lower of its own and the
+        given rate, and likewise for burst, so a connector can slow down every other
+        connector for the host but never speed them up past their own limits.
+
+        Args:
+            host: The host name, e.g. ``api.example.com``.
+            requests_per_second: The sustained rate at which requests to the host may start.
+            burst: The number of requests that may start at once.
+
+        """
+        with cls._host_lock:
+            limiter = cls._host_limiters.get(host)
+            if limiter is None:
+                limiter = cls._host_limiters[host] = cls(requests_per_second, burst)
+            else:
+                limiter.configure(
+                    min(limiter.requests_per_second, requests_per_second),
+                    min(limiter.burst, burst),
+                )
+
+        return limiter
+
+    def configure(self, requests_per_second: float, burst: int = 1) -> None:
+        """
+        Change the rate and burst of the limiter.
+
+        Args:
+            requests_per_second: The sustained rate at which requests may start.
+            burst: The number of requests that may start at once.
+
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+
+        with self._lock:
+            self.requests_per_second = requests_per_second
+            self.burst = burst
+            self.interval = 1 / requests_per_second
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket without waiting for it.
+
+        Returns:
+            The number of seconds to wait before starting the request.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            full_at = max(self._full_at, now)
+            start = max(now, full_at - (self.burst - 1) * self.interval)
+            self._full_at = full_at + self.interval
+
+        return start - now
+
+    def acquire(self) -> None:
+        """Block until a request may start."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, seconds: float) -> None:
+        """
+        Stop any request from starting for the next ``seconds`` seconds.
+
+        Args:
+            seconds: How long to pause.
+
+        """
+        logger.debug(f"Backing off for {seconds:.2f} seconds.")
+        with self._lock:
+            resume_at = time.monotonic() + seconds + (self.burst - 1) * self.interval
+            self._full_at = max(self._full_at, resume_at)
+
+
+def retry_after_seconds(resp: requests.Response) -> float | None:
+    """
+    Read the ``Retry-After`` header of a response.
+
+    Args:
+        resp: The response.
+
+    Returns:
+        The number of seconds the server asked clients to wait, or ``None`` if the header
+        is missing or can't be parsed.
+
+    """
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response is used without asking the server whether it has changed
+DEFAULT_CACHE_TTL = 300
+
+DEFAULT_CACHE_SIZE = 256
+
+
+def cache_key(prepared: requests.PreparedRequest) -> str:
+    """
+    Build the cache key for a request from its method, full URL and headers.
+
+    The headers are part of the key, so responses are never shared between requests
+    made with different credentials.
+
+    Args:
+        prepared: The prepared request.
+
+    """
+    headers = sorted((k.lower(), str(v)) for k, v in prepared.headers.items())
+    raw = json.dumps([prepared.method, prepared.url, headers])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(resp: requests.Response) -> bool:
+    """Whether a response may be stored: a ``200`` that the server didn't mark ``no-store``."""
+    return resp.status_code == 200 and "no-store" not in resp.headers.get("Cache-Control", "")
+
+
+class CachedResponse:
+    """
+    A stored ``GET`` response.
+
+    Attributes:
+        url: The URL of the response.
+        status_code: The status code of the response.
+        headers: The response headers.
+        content: The response body.
+        stored_at: The :func:`time.time` when the response was stored or last revalidated.
+
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: dict[str, str],
+        content: bytes,
+        stored_at: float | None = None,
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = dict(headers)
+        self.content = content
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    @classmethod
+    def from_response(cls, resp: requests.Response) -> CachedResponse:
+        return cls(resp.url, resp.status_code, dict(resp.headers), resp.content)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the response is younger than ``ttl`` seconds."""
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """The conditional request headers that ask the server whether this response changed."""
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+
+        return validators
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a :class:`requests.Response` from the stored response."""
+        resp = requests.Response()
+        resp.url = self.url
+        resp.status_code = self.status_code
+        resp.reason = "OK"
+        resp.headers = CaseInsensitiveDict(self.headers)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = self.content
+        return resp
+
+
+class ResponseCache(ABC):
+    """
+    Base class for :class:`~parsons.utilities.api_connector.APIConnector` response caches.
+
+    Subclasses store :class:`CachedResponse` objects by key, by implementing :meth:`get`,
+    :meth:`set` and :meth:`clear`.
+
+    Args:
+        ttl:
+            Seconds to use a cached response without asking the server whether it has
+            changed. After that, responses with an ``ETag`` or ``Last-Modified`` header are
+            revalidated with a conditional request, and others are fetched again.
+
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(ResponseCache):
+    """
+    An in-memory, least recently used response cache, for caching within a single run.
+
+    Args:
+        ttl: See :class:`ResponseCache`.
+        max_entries: The number of responses to keep. The least recently used is evicted.
+
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL, max_entries: int = DEFAULT_CACHE_SIZE):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    A response cache stored in a SQLite database, so it can be shared between runs and
+    processes.
+
+    Args:
+        path: The path to the database file. It is created if it doesn't exist.
+        ttl: See :class:`ResponseCache`.
+
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        super().__init__(ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT, "
+                "content BLOB, stored_at REAL)"
+            )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, content, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        url, status_code, headers, content, stored_at = row
+        return CachedResponse(url, status_code, json.loads(headers), content, stored_at)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.url,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.stored_at,
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
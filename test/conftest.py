@@ -2,6 +2,7 @@ import os
 import warnings
 from pathlib import Path
 
+import petl
 import pytest
 from _pytest.mark import MarkDecorator
 
@@ -112,6 +113,32 @@ def assert_matching_tables(
         assert list(r1_compare) == list(r2_compare)
 
 
+class CountingTable(petl.Table):
+    """A petl table that counts how many times it has been read all the way through."""
+
+    def __init__(self, header: tuple, rows: list[tuple]) -> None:
+        self.header = header
+        self.rows = rows
+        self.passes = 0
+
+    def __iter__(self):
+        yield self.header
+        yield from self.rows
+        # Count full passes, not reads of the header
+        self.passes += 1
+
+
+def counting_table(header: tuple, rows: list[tuple]) -> tuple[Table, CountingTable]:
+    """
+    Build a Table from ``header`` and ``rows`` that counts full passes over its data.
+
+    Returns the Table and the underlying :class:`CountingTable`, whose ``passes``
+    attribute holds the number of passes so far.
+    """
+    counter = CountingTable(header, rows)
+    return Table(counter), counter
+
+
 @pytest.fixture
 def sample_data() -> dict[str, list[dict[str, str | int]]]:
     """Provides sample dict containing two lists for use in tests."""
@@ -4311,6 +4311,24 @@ class TestActionNetwork(unittest.TestCase):
         )
         assert_matching_tables(self.an.get_people(), Table(self.fake_people_list))
 
+    @requests_mock.Mocker()
+    def test_get_people_concurrent(self, m):
+        m.get(
+            f"{self.api_url}/people?page=1&per_page=25",
+            text=json.dumps(self.fake_people_list_1),
+        )
+        m.get(
+            f"{self.api_url}/people?page=2&per_page=25",
+            text=json.dumps(self.fake_people_list_2),
+        )
+        m.get(
+            f"{self.api_url}/people?page=3&per_page=25",
+            text=json.dumps({"_embedded": {"osdi:people": []}}),
+        )
+        # Pages requested past the last one fail, but are never used
+        an = ActionNetwork(self.api_key, max_workers=4)
+        assert_matching_tables(an.get_people(), Table(self.fake_people_list))
+
     @requests_mock.Mocker()
     def test_get_person(self, m):
         m.get(
@@ -11,6 +11,7 @@ from google.cloud import bigquery, exceptions
 from testfixtures import log_capture
 
 from parsons import GoogleBigQuery, Table
+from parsons.databases.row_hash_index import RowHashIndex
 from parsons.google.google_cloud_storage import GoogleCloudStorage
 from test.test_google.test_utilities import FakeCredentialTest
 
@@ -38,7 +39,9 @@ class FakeGoogleCloudStorage(GoogleCloudStorage):
     def __init__(self, load_creds_mock):
         super().__init__(None, None)
 
-    def upload_table(self, table, bucket_name, blob_name, data_type="csv", default_acl=None):
+    def upload_table(
+        self, table, bucket_name, blob_name, data_type="csv", default_acl=None, **kwargs
+    ):
         pass
 
     def delete_blob(self, bucket_name, blob_name):
@@ -384,6 +387,7 @@ class TestGoogleBigQuery(FakeCredentialTest):
         upload_call_args = gcs_client.upload_table.call_args
         assert upload_call_args[0][0] == tbl
         assert upload_call_args[0][1] == self.tmp_gcs_bucket
+        assert upload_call_args[1]["stream"] is True
         tmp_blob_name = upload_call_args[0][2]
 
         assert bq._load_table_from_uri.call_count == 1
@@ -403,6 +407,55 @@ class TestGoogleBigQuery(FakeCredentialTest):
         assert delete_call_args[0][0] == self.tmp_gcs_bucket
         assert delete_call_args[0][1] == tmp_blob_name
 
+    def test_copy__shards(self):
+        gcs_client = self._build_mock_cloud_storage_client()
+        uploaded = {}
+
+        def upload_table(table, bucket_name, blob_name, **kwargs):
+            assert kwargs == {"stream": True, "compression": "gzip"}
+            uploaded[blob_name] = table.to_petl().records().list()
+
+        gcs_client.upload_table.side_effect = upload_table
+        tbl = Table([{"num": i, "name": f"name {i}"} for i in range(2500)])
+        bq = self._build_mock_client_for_copying(table_exists=False)
+        bq._load_table_from_uri = mock.MagicMock()
+
+        bq.copy(
+            tbl,
+            "dataset.table",
+            tmp_gcs_bucket=self.tmp_gcs_bucket,
+            temp_blob_name="staging",
+            gcs_client=gcs_client,
+            shards=3,
+        )
+
+        blob_names = [f"staging/shard-{i:05d}.csv.gz" for i in range(3)]
+        assert sorted(uploaded) == blob_names
+        assert [len(uploaded[name]) for name in blob_names] == [1000, 1000, 500]
+        assert sorted(row["num"] for rows in uploaded.values() for row in rows) == list(range(2500))
+
+        load_call_args = bq._load_table_from_uri.call_args
+        assert load_call_args[1]["source_uris"] == "gs://tmp/staging/shard-*.csv.gz"
+        assert [c[0][1] for c in gcs_client.delete_blob.call_args_list] == blob_names
+
+    def test_copy__shard_upload_fails(self):
+        gcs_client = self._build_mock_cloud_storage_client()
+        gcs_client.upload_table.side_effect = OSError("upload failed")
+        bq = self._build_mock_client_for_copying(table_exists=False)
+        bq._load_table_from_uri = mock.MagicMock()
+
+        with pytest.raises(OSError, match="upload failed"):
+            bq.copy(
+                self.default_table,
+                "dataset.table",
+                tmp_gcs_bucket=self.tmp_gcs_bucket,
+                gcs_client=gcs_client,
+                shards=2,
+            )
+
+        bq._load_table_from_uri.assert_not_called()
+        assert gcs_client.delete_blob.call_count == 2
+
     @mock.patch("parsons.google.google_cloud_storage.load_google_application_credentials")
     @mock.patch("parsons.google.google_bigquery.load_google_application_credentials")
     def test_copy__credentials_are_correctly_set__from_filepath(
@@ -563,6 +616,58 @@ class TestGoogleBigQuery(FakeCredentialTest):
         assert "DELETE" in actual_queries[0]
         assert "INSERT" in actual_queries[1]
 
+    @mock.patch.object(BigQuery, "table_exists", return_value=True)
+    @mock.patch.object(BigQuery, "query_with_transaction", return_value=None)
+    @mock.patch.object(BigQuery, "copy", return_value=None)
+    def test_upsert__hash_index(self, copy_mock, query_mock, *_):
+        hash_index = str(Path(self.dir.name) / "hashes.db")
+        bq = self._build_mock_client_for_querying(results=[])
+
+        def upsert(tbl):
+            copy_mock.reset_mock()
+            query_mock.reset_mock()
+            bq.upsert(
+                tbl, "my_dataset.my_target_table", "id", distinct_check=False, hash_index=hash_index
+            )
+
+        def staged():
+            return [list(row) for row in copy_mock.call_args[1]["tbl"].table]
+
+        with mock.patch.object(
+            RowHashIndex, "close", autospec=True, side_effect=RowHashIndex.close
+        ) as close_mock:
+            upsert(Table([["id", "name"], [1, "Jane"], [2, "Ida"]]))
+            assert staged() == [["id", "name"], [1, "Jane"], [2, "Ida"]]
+
+            # A failed upsert closes the index without saving its hashes
+            copy_mock.side_effect = ValueError("copy failed")
+            with pytest.raises(ValueError, match="copy failed"):
+                upsert(Table([["id", "name"], [1, "Jane"], [2, "Ada"], [3, "Kim"]]))
+            assert close_mock.call_count == 2
+
+            # Only the changed and new rows are staged
+            copy_mock.side_effect = None
+            upsert(Table([["id", "name"], [1, "Jane"], [2, "Ada"], [3, "Kim"]]))
+            assert staged() == [["id", "name"], [2, "Ada"], [3, "Kim"]]
+            query_mock.assert_called_once()
+
+            # Nothing changed, so nothing is run
+            upsert(Table([["id", "name"], [1, "Jane"], [2, "Ada"], [3, "Kim"]]))
+            copy_mock.assert_not_called()
+            query_mock.assert_not_called()
+            assert close_mock.call_count == 4
+
+    def test_stringify_records(self):
+        tbl = Table([["a", "b", "c"], [{"x": 1}, 1, [1, 2]], [None, 2, []]])
+
+        result = BigQuery._stringify_records(tbl)
+
+        assert result.columns == ["b", "a", "c"]
+        assert [list(row) for row in result.data] == [
+            [1, '{"x": 1}', "[1, 2]"],
+            [2, "null", "[]"],
+        ]
+
     @mock.patch.object(BigQuery, "query")
     def test_get_row_count(self, query_mock):
         # Arrange
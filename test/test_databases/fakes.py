@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from parsons.databases.database_connector import DatabaseConnector
 from parsons.etl.table import Table
@@ -10,6 +11,7 @@ class FakeDatabase(DatabaseConnector):
     def __init__(self):
         self.table_map = {}
         self.copy_call_args = []
+        self._copy_lock = threading.Lock()
 
     def query(self, sql: str, parameters: list | dict | None = None) -> Table:
         return Table()
@@ -31,6 +33,10 @@ class FakeDatabase(DatabaseConnector):
         return self.table_map[table_name]["table"]
 
     def copy(self, data, table_name, **kwargs):
+        with self._copy_lock:
+            self._copy(data, table_name, **kwargs)
+
+    def _copy(self, data, table_name, **kwargs):
         logger.info("Copying %s rows", data.num_rows)
         if table_name not in self.table_map:
             self.setup_table(table_name, Table())
@@ -65,6 +71,7 @@ class FakeTable:
     def __init__(self, table_name, data):
         self.table_name = table_name
         self.data = data
+        self.get_new_rows_calls = []
 
     def drop(self, cascade=False):
         self.data = None
@@ -84,6 +91,20 @@ class FakeTable:
     def columns(self):
         return self.data.columns
 
+    def get_min_max(self, column):
+        values = [value for value in self.data[column] if value is not None]
+        return (min(values), max(values)) if values else (None, None)
+
+    def partition(self, column, lower, upper, include_upper=False, include_null=False):
+        def in_partition(row):
+            value = row[column]
+            if value is None:
+                return include_null
+            return lower <= value <= upper if include_upper else lower <= value < upper
+
+        data = self.data.cut(*self.data.columns).select_rows(in_partition)
+        return FakeTable(self.table_name, data)
+
     def max_primary_key(self, primary_key):
         if primary_key not in self.data.columns:
             return None
@@ -115,8 +136,17 @@ class FakeTable:
         data = self.data.select_rows(lambda row: row[primary_key_col] > start_value)
         return data.num_rows
 
-    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None):
-        data = self.data.select_rows(lambda row: row[primary_key] > cutoff_value)
+    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None, inclusive=False):
+        self.get_new_rows_calls.append(cutoff_value)
+
+        if cutoff_value is None:
+            data = self.data.cut(*self.data.columns)
+        elif inclusive:
+            data = self.data.select_rows(lambda row: row[primary_key] >= cutoff_value)
+        else:
+            data = self.data.select_rows(lambda row: row[primary_key] > cutoff_value)
         data.sort(primary_key)
 
-        return Table(data[offset : chunk_size + offset])
+        subset = data[offset : chunk_size + offset] if chunk_size else data[offset:]
+
+        return Table(subset)
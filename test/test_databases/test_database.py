@@ -9,6 +9,7 @@ from parsons.databases.database.constants import (
     VARCHAR,
 )
 from parsons.databases.database.database import DatabaseCreateStatement
+from parsons.etl.table import Table
 
 
 @pytest.fixture
@@ -133,3 +134,30 @@ def test_default_format_column(dcs, col, renamed):
 )
 def test_default_format_columns(dcs, cols, cols_formatted):
     assert dcs.format_columns(cols) == cols_formatted
+
+
+def test_profile_columns(dcs):
+    tbl = Table(
+        [
+            ["ints", "mixed", "empty", "bools"],
+            [1, "NA", "", True],
+            [40000, "abc", None, False],
+            [None, 5, "NA", None],
+        ]
+    )
+    profile = dcs.profile_columns(tbl)
+
+    assert profile.types == [MEDIUMINT, VARCHAR, None, BOOL]
+    assert profile.max_widths == [5, 3, 4, 5]
+    assert dcs.profile_columns(tbl) is profile
+
+
+def test_set_column_names(dcs):
+    tbl = Table([["a", "b"], [1, 2]])
+    petl_tbl = tbl.table
+
+    dcs.set_column_names(tbl, ["a", "b"])
+    assert tbl.table is petl_tbl
+
+    dcs.set_column_names(tbl, ["c", "d"])
+    assert tbl.columns == ["c", "d"]
@@ -7,6 +7,7 @@ import pytest
 
 from parsons import DBSync, Postgres, Redshift, Table
 from parsons.databases.database_connector import DatabaseConnector
+from parsons.databases.db_sync import _partition_bounds
 from parsons.databases.sqlite import Sqlite
 from test.conftest import assert_matching_tables
 from test.test_databases.fakes import FakeDatabase
@@ -106,6 +107,42 @@ class TestDBSync(ABC, unittest.TestCase):
         self.db_sync.table_sync_full(self.source_table, self.destination_table, if_exists="drop")
         self.assert_matching_tables()
 
+    def test_table_sync_full_primary_key(self):
+        # Test keyset pagination in full sync.
+        self.set_up_db_sync(read_chunk_size=7)
+        self.table_sync_full(if_exists="drop", primary_key="pk")
+        self.assert_matching_tables()
+
+    def test_table_sync_full_pipeline_chunk(self):
+        # Test reading and writing concurrently in full sync.
+        self.set_up_db_sync(read_chunk_size=9, write_chunk_size=20, pipeline=True, reader_threads=2)
+        self.table_sync_full(if_exists="drop", order_by="pk")
+
+        source = self.source_db.query(f"SELECT * FROM {self.source_table} ORDER BY pk")
+        destination = self.destination_db.query(
+            f"SELECT * FROM {self.destination_table} ORDER BY pk"
+        )
+        assert_matching_tables(source, destination)
+
+    def test_table_sync_full_partitions(self):
+        # Test copying ranges of a numeric column concurrently in full sync.
+        tbl = Table([{"id": i, "data": f"row {i}"} for i in range(1, 51)])
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(tbl, self.source_table)
+
+        self.set_up_db_sync(read_chunk_size=6)
+        self.table_sync_full(if_exists="drop", partitions=4, partition_column="id")
+
+        source = self.source_db.query(f"SELECT * FROM {self.source_table} ORDER BY data")
+        destination = self.destination_db.query(
+            f"SELECT * FROM {self.destination_table} ORDER BY data"
+        )
+        assert_matching_tables(source, destination)
+
+    def test_table_sync_full_partitions_requires_column(self):
+        with pytest.raises(ValueError, match="partition_column or primary_key"):
+            self.table_sync_full(if_exists="drop", partitions=4)
+
     def test_table_sync_incremental(self):
         # Test that incremental sync
 
@@ -140,6 +177,22 @@ class TestDBSync(ABC, unittest.TestCase):
             self.source_table, self.destination_table, "pk", verify_row_count=False
         )
 
+    def test_table_sync_incremental_duplicate_keys(self):
+        # Rows sharing a key value across chunk boundaries must all be copied when the
+        # key isn't checked for uniqueness
+        rows = [{"id": 1, "name": "a"}, {"id": 1, "name": "b"}]
+        rows += [{"id": 2, "name": name} for name in "cdefg"]
+        rows += [{"id": 3, "name": "h"}, {"id": 3, "name": "i"}, {"id": 4, "name": "j"}]
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(Table(rows), self.source_table)
+        self.destination_db.copy(Table(rows[:2]), self.destination_table)
+
+        self.set_up_db_sync(read_chunk_size=2, write_chunk_size=3)
+        self.db_sync.table_sync_incremental(
+            self.source_table, self.destination_table, "id", distinct_check=False
+        )
+        self.assert_matching_tables()
+
 
 class TestFakeDBSync(TestDBSync):
     db = FakeDatabase
@@ -181,6 +234,128 @@ class TestFakeDBSync(TestDBSync):
             0
         ]
 
+    def test_table_sync_full_primary_key_pages_by_last_value(self):
+        self.set_up_db_sync(read_chunk_size=40)
+        self.table_sync_full(if_exists="drop", primary_key="pk")
+        self.assert_matching_tables()
+
+        # Each read starts after the last primary key of the previous chunk
+        source_tbl = self.source_db.table(self.source_table)
+        assert source_tbl.get_new_rows_calls == [None, "040", "080", "100"]
+
+    def test_table_sync_incremental_pages_by_last_value(self):
+        self.set_up_db_sync(read_chunk_size=20)
+        self.destination_db.copy(self.table1, self.destination_table)
+        self.source_db.copy(self.table2, self.source_table, if_exists="append")
+        self.db_sync.table_sync_incremental(self.source_table, self.destination_table, "pk")
+        self.assert_matching_tables()
+
+        source_tbl = self.source_db.table(self.source_table)
+        assert source_tbl.get_new_rows_calls == ["100", "120", "140", "149"]
+
+    def test_table_sync_incremental_duplicate_keys_pipeline(self):
+        rows = [{"id": 1}, {"id": 2}, {"id": 2}, {"id": 2}, {"id": 2}, {"id": 3}]
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(Table(rows), self.source_table)
+        self.destination_db.copy(Table(rows[:1]), self.destination_table)
+
+        self.set_up_db_sync(read_chunk_size=2, pipeline=True)
+        self.db_sync.table_sync_incremental(
+            self.source_table, self.destination_table, "id", distinct_check=False
+        )
+        assert_matching_tables(self.destination_db.table(self.destination_table).data, Table(rows))
+
+        # Chunks after the first start at the last key read, rather than after it
+        source_tbl = self.source_db.table(self.source_table)
+        assert source_tbl.get_new_rows_calls == [1, 2, 2]
+
+    def test_table_sync_full_pipeline(self):
+        self.set_up_db_sync(
+            read_chunk_size=7,
+            write_chunk_size=20,
+            pipeline=True,
+            reader_threads=3,
+            writer_threads=2,
+        )
+        self.table_sync_full(if_exists="drop")
+
+        source = self.source_db.table(self.source_table).data
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(source.sort("pk"), destination.sort("pk"))
+
+        # Each writer buffers at least write_chunk_size rows before copying
+        assert all(call["data"].num_rows >= 20 for call in self.destination_db.copy_call_args[:-2])
+
+    def test_table_sync_full_pipeline_primary_key(self):
+        self.set_up_db_sync(read_chunk_size=40, pipeline=True, reader_threads=3)
+        self.table_sync_full(if_exists="drop", primary_key="pk")
+
+        source = self.source_db.table(self.source_table).data
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(source, destination)
+
+        # Keyset pagination is read by a single thread, stopping at the first short chunk
+        source_tbl = self.source_db.table(self.source_table)
+        assert source_tbl.get_new_rows_calls == [None, "040", "080"]
+
+    def test_table_sync_full_partitions_with_nulls(self):
+        tbl = Table([{"id": i, "data": f"row {i}"} for i in range(1, 51)])
+        tbl.concat(Table([{"id": None, "data": "no id"}]))
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(tbl, self.source_table)
+
+        self.table_sync_full(if_exists="drop", partitions=4, partition_column="id")
+
+        # Rows without a partition value are copied along with the first partition
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(tbl.sort("data"), destination.sort("data"))
+
+    def test_table_sync_full_partitions_with_nulls_and_primary_key(self):
+        tbl = Table(
+            [
+                {"id": i, "group": None if i % 7 == 0 else i % 5, "data": f"row {i}"}
+                for i in range(1, 51)
+            ]
+        )
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(tbl, self.source_table)
+
+        self.set_up_db_sync(read_chunk_size=6)
+        self.table_sync_full(
+            if_exists="drop", partitions=3, partition_column="group", primary_key="id"
+        )
+
+        # Rows without a partition value are still copied, with the first partition
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(tbl, destination.sort("id"))
+
+    def test_table_sync_full_partitions_by_primary_key(self):
+        tbl = Table([{"id": i, "data": f"row {i}"} for i in range(1, 51)])
+        self.source_db.table(self.source_table).drop()
+        self.source_db.copy(tbl, self.source_table)
+
+        self.set_up_db_sync(read_chunk_size=6)
+        self.table_sync_full(if_exists="drop", partitions=3, primary_key="id")
+
+        destination = self.destination_db.table(self.destination_table).data
+        assert_matching_tables(tbl, destination.sort("id"))
+
+        # Every partition was read with keyset pagination
+        assert max(call["data"].num_rows for call in self.destination_db.copy_call_args) == 6
+
+    def test_table_sync_full_pipeline_with_retry(self):
+        self.destination_db.setup_table(self.destination_table, Table(), failures=2)
+        self.set_up_db_sync(pipeline=True, retries=2)
+        self.table_sync_full(if_exists="drop")
+        self.assert_matching_tables()
+
+    def test_table_sync_full_pipeline_without_retry(self):
+        self.destination_db.setup_table(self.destination_table, Table(), failures=1)
+        self.set_up_db_sync(read_chunk_size=10, pipeline=True, writer_threads=2)
+
+        with pytest.raises(ValueError, match="Canned error"):
+            self.table_sync_full(if_exists="drop")
+
 
 class TestSqliteDBSync(TestDBSync):
     db = Sqlite
@@ -190,6 +365,9 @@ class TestSqliteDBSync(TestDBSync):
         self.source_db = self.db(tempfile.mkstemp()[1])
         self.destination_db = self.db(tempfile.mkstemp()[1])
 
+    def test_table_sync_full_partitions(self):
+        pytest.skip("SQLite does not support concurrent writes to the same database")
+
 
 # These tests interact directly with the Postgres database. In order to run, set the
 # env to LIVE_TEST='TRUE'.
@@ -210,3 +388,30 @@ class TestPostgresDBSync(TestDBSync):
 @pytest.mark.live
 class TestRedshiftDBSync(TestPostgresDBSync):
     db = Redshift
+
+
+@pytest.mark.parametrize(
+    ("min_value", "max_value", "partitions", "expected"),
+    [
+        (0, 10, 3, [(0, 4, False), (4, 8, False), (8, 10, True)]),
+        (1, 4, 2, [(1, 3, False), (3, 4, True)]),
+        (5, 5, 4, [(5, 5, True)]),
+        (1, 3, 10, [(1, 2, False), (2, 3, True)]),
+        (0.0, 1.0, 2, [(0.0, 0.5, False), (0.5, 1.0, True)]),
+    ],
+)
+def test_partition_bounds(min_value, max_value, partitions, expected):
+    assert _partition_bounds(min_value, max_value, partitions) == expected
+
+
+def test_partition_bounds_not_numeric():
+    with pytest.raises(ValueError, match="numeric or a date"):
+        _partition_bounds("a", "z", 2)
+
+
+def test_last_key_value():
+    rows = Table([{"id": 1}, {"id": 2}])
+    assert DBSync._last_key_value(rows, "id") == 2
+
+    with pytest.raises(ValueError, match="contains null values"):
+        DBSync._last_key_value(Table([{"id": 1}, {"id": None}]), "id")
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from parsons import Table
+from parsons.databases.query_results import cursor_to_table, iter_cursor_tables
+from test.conftest import assert_matching_tables
+
+
+@pytest.fixture
+def cursor():
+    connection = sqlite3.connect(":memory:")
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE people (id INTEGER, name TEXT, score REAL)")
+    cur.executemany(
+        "INSERT INTO people VALUES (?, ?, ?)",
+        [(1, "Jim", 1.5), (2, "John", None), (3, "Sarah", 3.0)],
+    )
+    cur.execute("SELECT * FROM people ORDER BY id")
+    yield cur
+    connection.close()
+
+
+EXPECTED = Table(
+    [
+        ["id", "name", "score"],
+        [1, "Jim", 1.5],
+        [2, "John", None],
+        [3, "Sarah", 3.0],
+    ]
+)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_cursor_to_table(cursor, batch_size):
+    tbl = cursor_to_table(cursor, batch_size)
+
+    assert_matching_tables(tbl, EXPECTED)
+    # The temp file can be read more than once
+    assert tbl.num_rows == 3
+    assert tbl[2] == {"id": 3, "name": "Sarah", "score": 3.0}
+
+
+def test_cursor_to_table_empty(cursor):
+    cursor.execute("SELECT * FROM people WHERE id > 10")
+
+    tbl = cursor_to_table(cursor, 10)
+
+    assert tbl.columns == ["id", "name", "score"]
+    assert tbl.num_rows == 0
+
+
+def test_iter_cursor_tables(cursor):
+    batches = list(iter_cursor_tables(cursor, 2))
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert_matching_tables(Table(EXPECTED.table).head(2), batches[0])
+    assert batches[1][0] == {"id": 3, "name": "Sarah", "score": 3.0}
+
+
+def test_iter_cursor_tables_empty(cursor):
+    cursor.execute("SELECT * FROM people WHERE id > 10")
+
+    assert list(iter_cursor_tables(cursor, 2)) == []
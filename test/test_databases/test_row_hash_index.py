@@ -0,0 +1,67 @@
+import pytest
+
+from parsons import Table
+from parsons.databases.row_hash_index import RowHashIndex
+
+ROWS = [["id", "name"], [1, "Jim"], [2, "John"], [3, "Sarah"]]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = RowHashIndex(str(tmp_path / "hashes.db"), "people")
+    yield index
+    index.close()
+
+
+def test_changed_rows(index):
+    assert [list(r) for r in index.changed_rows(Table(ROWS), ["id"]).table] == ROWS
+
+    # Nothing was committed, so every row is still new
+    assert index.changed_rows(Table(ROWS), ["id"]).num_rows == 3
+    index.commit()
+    assert len(index) == 3
+
+    assert not index.changed_rows(Table(ROWS), ["id"])
+
+    updated = Table([["id", "name"], [1, "Jim"], [2, "Jon"], [4, "Ida"]])
+    assert [list(r) for r in index.changed_rows(updated, ["id"]).table] == [
+        ["id", "name"],
+        [2, "Jon"],
+        [4, "Ida"],
+    ]
+
+
+def test_pending_hashes_are_dropped(tmp_path):
+    path = str(tmp_path / "hashes.db")
+    index = RowHashIndex(path, "people")
+    index.changed_rows(Table(ROWS), ["id"])
+    index.close()
+
+    # An upsert that never committed leaves nothing behind
+    index = RowHashIndex(path, "people")
+    index.commit()
+    assert len(index) == 0
+    index.close()
+
+
+def test_tables_are_separate(tmp_path, index):
+    index.changed_rows(Table(ROWS), ["id"])
+    index.commit()
+
+    other = RowHashIndex(index.path, "other_people")
+    assert other.changed_rows(Table(ROWS), ["id"]).num_rows == 3
+    other.close()
+
+
+def test_clear(index):
+    index.changed_rows(Table(ROWS), ["id"])
+    index.commit()
+    index.clear()
+
+    assert len(index) == 0
+    assert index.changed_rows(Table(ROWS), ["id"]).num_rows == 3
+
+
+def test_missing_primary_key(index):
+    with pytest.raises(ValueError, match="not in the table"):
+        index.changed_rows(Table(ROWS), ["email"])
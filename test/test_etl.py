@@ -1,13 +1,16 @@
+import gzip
+import io
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any
+from unittest import mock
 
 import petl
 import pytest
 
 from parsons import Table
 from parsons.utilities import zip_archive
-from test.conftest import assert_matching_tables
+from test.conftest import assert_matching_tables, counting_table
 
 # Notes :
 # - The `Table.to_postgres()` test is housed in the Postgres tests
@@ -186,6 +189,31 @@ class TestFileOperations:
         path = tbl.to_csv(temp_file_compression=compression) if compression else tbl.to_csv()
         self._assert_expected_csv(path, tbl)
 
+    def test_to_csv_stream(self, tbl):
+        expected = Path(tbl.to_csv(encoding="utf-8")).read_bytes()
+
+        # Read in pieces smaller than a batch to exercise the buffering
+        stream = tbl.to_csv_stream(batch_size=1)
+        chunks = iter(lambda: stream.read(7), b"")
+        assert b"".join(chunks) == expected
+        assert stream.row_count == tbl.num_rows
+
+        assert tbl.to_csv_stream(write_header=False).readlines() == expected.splitlines(True)[1:]
+        assert Table([["a", "b"]]).to_csv_stream().read() == b"a,b\r\n"
+
+    def test_to_csv_stream_gzip(self, tbl):
+        expected = Path(tbl.to_csv(encoding="utf-8")).read_bytes()
+
+        stream = tbl.to_csv_stream(batch_size=1, compression="gzip")
+        assert gzip.decompress(b"".join(iter(lambda: stream.read(5), b""))) == expected
+        assert stream.row_count == tbl.num_rows
+
+        empty = Table([["a", "b"]]).to_csv_stream(compression="gzip")
+        assert gzip.decompress(empty.read()) == b"a,b\r\n"
+
+        with pytest.raises(ValueError, match="zip"):
+            tbl.to_csv_stream(compression="zip")
+
     def test_from_csv_string(self, tbl):
         path = tbl.to_csv()
         # Pull the file into a string
@@ -263,6 +291,67 @@ class TestFileOperations:
         result_tbl = Table.from_json(path, line_delimited=True)
         assert_matching_tables(tbl, result_tbl)
 
+    @pytest.mark.parametrize("compression", [None, "gzip"], ids=["uncompressed", "compressed"])
+    def test_to_json_stream(self, tbl, tmp_path, compression):
+        path = tmp_path / "test.json"
+
+        # Full reads through a buffer, as a resumable upload does
+        stream = io.BufferedReader(tbl.to_json_stream(batch_size=1, compression=compression))
+        data = b"".join(iter(lambda: stream.read(5), b""))
+        assert stream.tell() == len(data)
+
+        path.write_bytes(gzip.decompress(data) if compression else data)
+        assert_matching_tables(tbl, Table.from_json(str(path), line_delimited=True))
+
+    def test_from_s3_csv_parts(self, tmp_path):
+        class FakeS3:
+            def __init__(self, *args):
+                self.objects = {}
+
+            def iter_keys(self, bucket, prefix=None):
+                for key, path in self.objects.items():
+                    if key.startswith(prefix):
+                        yield {"Key": key, "Size": Path(path).stat().st_size}
+
+            def get_file(self, bucket, key):
+                return self.objects[key]
+
+        s3 = FakeS3()
+        parts = [
+            ("id,name\n1,a\n2,b\n", "unload/0000_part_00.gz"),
+            ("name,id\nc,3\n", "unload/0001_part_00.gz"),
+            ("", "unload/0002_part_00"),
+        ]
+        for i, (text, key) in enumerate(parts):
+            path = tmp_path / f"part{i}{'.gz' if key.endswith('.gz') else ''}"
+            path.write_bytes(gzip.compress(text.encode()) if key.endswith(".gz") else b"")
+            s3.objects[key] = str(path)
+
+        with mock.patch("parsons.aws.S3", return_value=s3):
+            tbl = Table.from_s3_csv("bucket", "unload/", max_workers=2)
+
+        # Empty parts are skipped, and columns are matched by name
+        assert tbl.columns == ["id", "name"]
+        assert list(tbl.to_petl().data()) == [("1", "a"), ("2", "b"), ("3", "c")]
+
+        # Columns that are not in the first file are added, as by petl.cat
+        path = tmp_path / "part3.gz"
+        path.write_bytes(gzip.compress(b"id,email\n4,d@example.com\n"))
+        s3.objects["unload/0003_part_00.gz"] = str(path)
+
+        with mock.patch("parsons.aws.S3", return_value=s3):
+            tbl = Table.from_s3_csv("bucket", "unload/")
+
+        assert tbl.columns == ["id", "name", "email"]
+        assert list(tbl.to_petl().data())[-2:] == [("3", "c", None), ("4", None, "d@example.com")]
+
+        # A missing file is raised as the table is created, not when it is first read
+        with (
+            mock.patch("parsons.aws.S3", return_value=s3),
+            pytest.raises(KeyError, match="missing.csv"),
+        ):
+            Table.from_s3_csv("bucket", "missing.csv")
+
     def test_to_html(self, tbl, tmp_path: Path):
         html_file = str(tmp_path / "test.html")
 
@@ -616,6 +705,120 @@ class TestColumnOperations:
         )
         assert tbl.get_column_max_width(column) == expected_width
 
+    def test_profile(self):
+        tbl = Table(
+            [
+                ["a", "b", "c"],
+                ["wide_text", None, "🤩"],
+                ["text", 2],
+                ["", 3, None],
+            ]
+        )
+        profile = tbl.profile()
+
+        assert profile.num_rows == 3
+        assert not profile.sampled
+        assert [c.name for c in profile] == ["a", "b", "c"]
+        assert profile.max_widths == [9, 4, 4]
+        assert [c.null_count for c in profile] == [0, 1, 1]
+        assert profile.types == [None, None, None]
+
+        def detect(value, current_type):
+            return "str" if isinstance(value, str) or current_type == "str" else "num"
+
+        profile = tbl.profile(type_detector=detect, skip_values=("", None))
+        assert profile.types == ["str", "num", "str"]
+
+        sampled = tbl.profile(sample_size=1)
+        assert sampled.num_rows == 1
+        assert sampled.sampled
+        assert sampled["a"].max_width == 9
+
+    def test_profile_python_types_and_distinct_counts(self):
+        tbl = Table([["a", "b", "c"], [1, "x", None], [2.5, "x"], [1, "y", None]])
+        profile = tbl.profile()
+
+        assert profile.python_types == [["float", "int"], ["str"], ["NoneType"]]
+        assert [c.distinct_count for c in profile] == [2, 2, 0]
+
+        # The string "None" counts as a value, whether or not there are nulls alongside it
+        tbl = Table([{"a": "None"}, {"a": None}, {"a": "x"}])
+        assert tbl.get_columns_type_stats()[0]["distinct_count"] == 2
+
+        # Large counts are estimated
+        tbl = Table([["id"]] + [[i] for i in range(50000)])
+        assert tbl.profile()["id"].distinct_count == pytest.approx(50000, rel=0.1)
+
+    def test_profile_single_pass_and_cache(self):
+        tbl, counter = counting_table(("a", "b"), [(str(i) * i, i) for i in range(5)])
+
+        profile = tbl.profile()
+        assert counter.passes == 1
+        assert tbl.profile() is profile
+
+        # Widths are read from the cached profile
+        assert [tbl.get_column_max_width(c) for c in ["a", "b"]] == [4, 1]
+        assert counter.passes == 1
+
+        # Transforming the table invalidates the cache
+        tbl.convert_column("b", lambda v: v * 100)
+        assert tbl.get_column_max_width("b") == 3
+        assert counter.passes == 2
+
+    def test_get_columns_type_stats_single_pass(self):
+        tbl, counter = counting_table(
+            ("a", "b", "c"), [(i, str(i), {"i": i} if i else None) for i in range(5)]
+        )
+
+        stats = tbl.get_columns_type_stats()
+        assert counter.passes == 1
+        assert [(s["name"], s["type"]) for s in stats] == [
+            ("a", ["int"]),
+            ("b", ["str"]),
+            ("c", ["NoneType", "dict"]),
+        ]
+        assert [s["null_count"] for s in stats] == [0, 0, 1]
+        assert [s["distinct_count"] for s in stats] == [5, 5, 4]
+
+        assert tbl.get_column_types("c") == ["NoneType", "dict"]
+        assert tbl.get_column_max_width("b") == 1
+        assert counter.passes == 1
+
+    def test_profiling_view(self):
+        tbl, counter = counting_table(("a", "b"), [(str(i) * i, i) for i in range(5)])
+
+        view = tbl.profiling_view()
+        assert view.to_petl().nrows() == 5
+        assert counter.passes == 1
+
+        # The profile gathered while reading the view is cached on the table
+        assert tbl.profile().max_widths == [4, 1]
+        assert tbl.get_column_max_width("a") == 4
+        assert counter.passes == 1
+
+    def test_map_shards(self):
+        tbl = Table([{"a": i} for i in range(7)])
+
+        shards = tbl.map_shards(3, lambda shard, i: (i, [row["a"] for row in shard]), batch_size=2)
+
+        # Batches of two rows are dealt out round robin
+        assert shards == [(0, [0, 1, 6]), (1, [2, 3]), (2, [4, 5])]
+
+    def test_map_shards_error(self):
+        tbl = Table([{"a": i} for i in range(100)])
+
+        def consume(shard, i):
+            if i == 1:
+                raise OSError("shard failed")
+            return shard.num_rows
+
+        with pytest.raises(OSError, match="shard failed"):
+            tbl.map_shards(2, consume, batch_size=5)
+
+        # A consumer that stops reading early is an error too
+        with pytest.raises(RuntimeError, match="stopped reading"):
+            tbl.map_shards(2, lambda shard, i: None, batch_size=5)
+
     def test_column_data(self, sample_data):
         # Test that that the data in the column is returned as a list
 
@@ -858,6 +1061,29 @@ class TestTableTransformations:
         # Assert last table is 99
         assert chunks[4].num_rows == 99
 
+    def test_iter_chunks(self):
+        test_table = Table(petl.randomtable(3, 499, seed=42))
+        chunks = list(test_table.iter_chunks(100))
+
+        assert [c.num_rows for c in chunks] == [100, 100, 100, 100, 99]
+        assert chunks[0].columns == test_table.columns
+        assert_matching_tables(Table(petl.cat(*[c.table for c in chunks])), test_table)
+
+    def test_iter_chunks_single_pass(self):
+        tbl, counter = counting_table(("a",), [(i,) for i in range(5)])
+        tbl.convert_column("a", lambda v: v * 2)
+
+        chunks = list(tbl.iter_chunks(2))
+
+        assert counter.passes == 1
+        assert [c["a"] for c in chunks] == [[0, 2], [4, 6], [8]]
+
+    def test_iter_chunks_empty(self):
+        assert list(Table([["a", "b"]]).iter_chunks(10)) == []
+
+        with pytest.raises(ValueError, match="positive integer"):
+            next(Table([{"a": 1}]).iter_chunks(0))
+
     def test_match_columns(self):
         raw = [
             {"first name": "Mary", "LASTNAME": "Nichols", "Middle__Name": "D"},
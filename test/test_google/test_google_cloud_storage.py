@@ -95,6 +95,18 @@ class TestGoogleStorageBuckets(unittest.TestCase):
         self.cloud.delete_blob(TEMP_BUCKET_NAME, file_name)
         assert not self.cloud.blob_exists(TEMP_BUCKET_NAME, file_name)
 
+    def test_upload_table_stream(self):
+        file_name = "streamed.csv.gz"
+        input_tbl = Table([["a", "b"], ["1", "x"], ["2", "y"]])
+        uri = self.cloud.upload_table(
+            input_tbl, TEMP_BUCKET_NAME, file_name, stream=True, compression="gzip"
+        )
+        assert uri == f"gs://{TEMP_BUCKET_NAME}/{file_name}"
+
+        local_file = files.create_temp_file(suffix=".csv.gz")
+        self.cloud.download_blob(TEMP_BUCKET_NAME, file_name, local_file)
+        assert_matching_tables(input_tbl, Table.from_csv(local_file))
+
     def test_get_url(self):
         file_name = "delete_me.csv"
         input_tbl = Table([["a"], ["1"]])
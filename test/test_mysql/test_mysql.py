@@ -1,6 +1,7 @@
 import os
 import unittest
 import unittest.mock as mock
+from pathlib import Path
 
 import pytest
 
@@ -88,6 +89,52 @@ class TestMySQLConnectionTimeout(unittest.TestCase):
         assert kwargs["connection_timeout"] == 42
 
 
+@mock.patch.object(MySQL, "table_exists", return_value=True)
+@mock.patch("parsons.databases.mysql.mysql.mysql.connect")
+class TestMySQLCopy(unittest.TestCase):
+    def setUp(self):
+        self.mysql = MySQL(**_MYSQL_CONN_KWARGS)
+        self.tbl = Table(
+            [
+                ["id", "name", "active"],
+                [1, "O'Brady", True],
+                [2, None, False],
+                [3, "tab\there\\", None],
+            ]
+        )
+
+    def test_copy_executemany(self, mock_connect, mock_exists):
+        cursor = mock_connect.return_value.cursor.return_value
+
+        self.mysql.copy(self.tbl, "test", if_exists="append", chunk_size=2)
+
+        assert mock_connect.call_args.kwargs["allow_local_infile"] is False
+        sql = "INSERT INTO test (id,name,active) VALUES (%s, %s, %s)"
+        assert cursor.executemany.call_args_list == [
+            mock.call(sql, [[1, "O'Brady", True], [2, None, False]]),
+            mock.call(sql, [[3, "tab\there\\", None]]),
+        ]
+
+    def test_copy_load_data_local(self, mock_connect, mock_exists):
+        cursor = mock_connect.return_value.cursor.return_value
+        loaded = []
+
+        def read_infile(sql):
+            path = sql.split("'")[1]
+            loaded.append(Path(path).read_text(encoding="utf-8"))
+
+        cursor.execute.side_effect = read_infile
+
+        self.mysql.copy(self.tbl, "test", if_exists="append", load_data_local=True)
+
+        assert mock_connect.call_args.kwargs["allow_local_infile"] is True
+        sql = cursor.execute.call_args.args[0]
+        assert sql.startswith("LOAD DATA LOCAL INFILE")
+        assert sql.endswith("(id,name,active)")
+        assert loaded == ["1\tO'Brady\t1\n2\t\\N\t0\n3\ttab\\there\\\\\t\\N\n"]
+        cursor.executemany.assert_not_called()
+
+
 # These tests interact directly with the MySQL database. To run, set env variable "LIVE_TEST=True"
 @pytest.mark.live
 class TestMySQLLive(unittest.TestCase):
@@ -121,6 +168,13 @@ class TestMySQLLive(unittest.TestCase):
 
         assert_matching_tables(Table([{"name": "me", "user_name": "myuser"}]), r)
 
+    def test_copy(self):
+        tbl = Table([{"name": "O'Brady", "user_name": None}, {"name": "me", "user_name": "a\tb"}])
+
+        for load_data_local in (False, True):
+            self.mysql.copy(tbl, "test", if_exists="drop", load_data_local=load_data_local)
+            assert_matching_tables(tbl, self.mysql.query("select * from test"))
+
 
 # These tests interact directly with the MySQL database. To run, set env variable "LIVE_TEST=True"
 @pytest.mark.live
@@ -239,11 +293,11 @@ class TestMySQLTable(unittest.TestCase):
     def test_evaluate_table(self):
         table_map = [
             {"name": "ID", "type": "smallint", "width": 0},
-            {"name": "Name", "type": "varchar", "width": 8},
+            {"name": "Name", "type": "varchar", "width": 5},
             {"name": "Score", "type": "float", "width": 0},
         ]
         assert self.mysql.evaluate_table(self.tbl) == table_map
 
     def test_create_statement(self):
-        stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(10) \n,score float \n);"
+        stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(6) \n,score float \n);"
         assert self.mysql.create_statement(self.tbl, "test_table") == stmt
@@ -0,0 +1,86 @@
+"""Tests for Parquet file operations"""
+
+from pathlib import Path
+
+import pytest
+
+from parsons import Table
+from test.conftest import assert_matching_tables
+
+pa = pytest.importorskip("pyarrow")
+
+
+class TestParquetOperations:
+    """Tests for Parquet file read/write operations"""
+
+    def test_to_from_parquet_basic(self, tbl, tmp_path: Path):
+        parquet_file = tmp_path / "test.parquet"
+
+        assert tbl.to_parquet(parquet_file) == parquet_file
+        assert parquet_file.exists()
+
+        result_tbl = Table.from_parquet(parquet_file)
+        assert_matching_tables(tbl, result_tbl)
+
+    def test_to_parquet_temp_file(self, tbl):
+        parquet_file = tbl.to_parquet()
+
+        assert parquet_file.endswith(".parquet")
+        assert_matching_tables(tbl, Table.from_parquet(parquet_file))
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 100])
+    def test_to_from_parquet_batches(self, tmp_path: Path, batch_size):
+        parquet_file = tmp_path / "test.parquet"
+        tbl = Table([{"id": i, "name": f"name_{i}", "score": i / 2} for i in range(7)])
+
+        tbl.to_parquet(parquet_file, batch_size=batch_size)
+
+        result_tbl = Table.from_parquet(parquet_file, batch_size=batch_size)
+        assert_matching_tables(tbl, result_tbl)
+
+    def test_to_parquet_with_schema(self, tmp_path: Path):
+        parquet_file = tmp_path / "test.parquet"
+        tbl = Table([{"id": None, "name": "Bob"}, {"id": 2, "name": None}])
+        schema = pa.schema([("id", pa.int64()), ("name", pa.string())])
+
+        tbl.to_parquet(parquet_file, schema=schema, batch_size=1)
+
+        assert_matching_tables(tbl, Table.from_parquet(parquet_file))
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [{"a": 1}, {"a": 2.5}, {"a": 3}],
+            [{"a": None}, {"a": None}, {"a": "x"}],
+            [{"a": None}, {"a": 1}, {"a": 2.5}],
+        ],
+    )
+    def test_to_parquet_widens_types(self, tmp_path: Path, rows):
+        parquet_file = tmp_path / "test.parquet"
+        tbl = Table(rows)
+
+        tbl.to_parquet(parquet_file, batch_size=1)
+
+        assert Table.from_parquet(parquet_file)["a"] == tbl["a"]
+
+    def test_to_parquet_incompatible_types(self, tmp_path: Path):
+        tbl = Table([{"a": 1}, {"a": "x"}])
+
+        with pytest.raises(ValueError, match="Pass a schema"):
+            tbl.to_parquet(tmp_path / "test.parquet", batch_size=1)
+
+    def test_to_parquet_empty_table(self, tmp_path: Path):
+        parquet_file = tmp_path / "test.parquet"
+        Table([["first", "last"]]).to_parquet(parquet_file)
+
+        result_tbl = Table.from_parquet(parquet_file)
+        assert result_tbl.columns == ["first", "last"]
+        assert result_tbl.num_rows == 0
+
+    def test_from_parquet_columns(self, tbl, tmp_path: Path):
+        parquet_file = tmp_path / "test.parquet"
+        tbl.to_parquet(parquet_file)
+
+        result_tbl = Table.from_parquet(parquet_file, columns=["last"])
+        assert result_tbl.columns == ["last"]
+        assert result_tbl["last"] == tbl["last"]
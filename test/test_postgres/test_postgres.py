@@ -192,6 +192,43 @@ class TestPostgresPortPrecedence(unittest.TestCase):
             assert pg.port == 5432
 
 
+class TestPostgresQueryIter(unittest.TestCase):
+    @mock.patch("parsons.databases.postgres.postgres_core.psycopg2.connect")
+    def test_query_iter(self, mock_connect):
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.description = [("id",), ("name",)]
+        cursor.fetchmany.side_effect = [[(1, "Jim"), (2, "John")], [(3, "Sarah")], []]
+
+        pg = Postgres(username="test", password="test", host="test", db="test", port=123)
+        batches = list(pg.query_iter("select * from people", batch_size=2))
+
+        # A named cursor makes psycopg2 stream results from the server
+        assert mock_connect.return_value.cursor.call_args.kwargs["name"].startswith("parsons_")
+        cursor.fetchmany.assert_called_with(2)
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert batches[1][0] == {"id": 3, "name": "Sarah"}
+        mock_connect.return_value.commit.assert_called_once()
+
+
+class TestPostgresCopy(unittest.TestCase):
+    @mock.patch("parsons.databases.postgres.postgres_core.psycopg2.connect")
+    def test_copy_streams_csv(self, mock_connect):
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (1,)
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, f: copied.append(f.read())
+
+        pg = Postgres(username="test", password="test", host="test", db="test", port=123)
+        tbl = Table([["id", "name"], [1, "Jim"], [2, None]]).convert_column("id", str)
+
+        with mock.patch.object(Table, "to_csv", side_effect=AssertionError("wrote a temp file")):
+            pg.copy(tbl, "people", if_exists="append")
+
+        sql = cursor.copy_expert.call_args.args[0]
+        assert sql == 'COPY "people" ("id","name") FROM STDIN CSV HEADER;'
+        assert copied == [b"id,name\r\n1,Jim\r\n2,\r\n"]
+
+
 # These tests interact directly with the Postgres database
 
 
@@ -1,12 +1,18 @@
+import gzip
+import json
 import os
 import re
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import pytest
 from testfixtures import LogCapture
 
 from parsons import S3, Redshift, Table
-from test.conftest import assert_matching_tables, validate_list
+from parsons.databases.row_hash_index import RowHashIndex
+from test.conftest import assert_matching_tables, counting_table, validate_list
 
 # The name of the schema and will be temporarily created for the tests
 TEMP_SCHEMA = "parsons_test2"
@@ -388,6 +394,137 @@ class TestRedshift(unittest.TestCase):
         for o in expected_options:
             assert sql.find(o) != -1
 
+    def test_copy_single_pass(self):
+        uploaded = []
+
+        def temp_s3_copy(tbl, **kwargs):
+            uploaded.append(tbl.to_csv_stream().read())
+            return "key.csv.gz"
+
+        rs = self.rs
+        rs.connection = mock.MagicMock()
+        rs._create_table_precheck = mock.MagicMock(return_value=True)
+        rs.query_with_connection = mock.MagicMock()
+        rs.temp_s3_copy = mock.MagicMock(side_effect=temp_s3_copy)
+        rs.temp_s3_delete = mock.MagicMock()
+        rs.s3_temp_bucket = "bucket"
+
+        tbl, counter = counting_table(("ID", "Name"), [(1, "Jim"), (2, "John"), (3, "Sarah")])
+        rs.copy(
+            tbl,
+            "tmc.test",
+            distkey="ID",
+            aws_access_key_id="abc123",
+            aws_secret_access_key="abc123",
+            single_pass=True,
+        )
+
+        assert counter.passes == 1
+        assert uploaded == [b"id,name\r\n1,Jim\r\n2,John\r\n3,Sarah\r\n"]
+
+        create_sql, copy_sql = [c[0][0] for c in rs.query_with_connection.call_args_list]
+        assert create_sql == (
+            """create table tmc.test (\n  "id" int,\n  "name" varchar(5)) \ndistkey(ID) ;"""
+        )
+        assert "from 's3://bucket/key.csv.gz'" in copy_sql
+        rs.temp_s3_delete.assert_called_once_with("key.csv.gz")
+
+    def test_upsert_hash_index(self):
+        staged = []
+
+        def copy(tbl, table_name, **kwargs):
+            staged.append([list(row) for row in tbl.table])
+
+        rs = self.rs
+        rs.connection = mock.MagicMock()
+        rs.query_with_connection = mock.MagicMock()
+        rs.table_exists = mock.MagicMock(return_value=True)
+        rs.copy = mock.MagicMock(side_effect=copy)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            hash_index = str(Path(tmp_dir) / "hashes.db")
+
+            def upsert(tbl):
+                rs.upsert(
+                    tbl,
+                    "tmc.test",
+                    "id",
+                    vacuum=False,
+                    distinct_check=False,
+                    alter_table=False,
+                    hash_index=hash_index,
+                )
+
+            with mock.patch.object(
+                RowHashIndex, "close", autospec=True, side_effect=RowHashIndex.close
+            ) as close_mock:
+                upsert(Table([["id", "name"], [1, "Jim"], [2, "John"]]))
+                assert staged == [[["id", "name"], [1, "Jim"], [2, "John"]]]
+
+                # A failed upsert closes the index without saving its hashes
+                rs.copy.side_effect = ValueError("copy failed")
+                with pytest.raises(ValueError, match="copy failed"):
+                    upsert(Table([["id", "name"], [1, "Jim"], [2, "Jon"], [3, "Sarah"]]))
+                assert close_mock.call_count == 2
+
+                # Only the changed and new rows are staged
+                rs.copy.side_effect = copy
+                upsert(Table([["id", "name"], [1, "Jim"], [2, "Jon"], [3, "Sarah"]]))
+                assert staged[-1] == [["id", "name"], [2, "Jon"], [3, "Sarah"]]
+
+                # Nothing changed, so nothing is staged
+                rs.copy.reset_mock()
+                upsert(Table([["id", "name"], [1, "Jim"], [2, "Jon"], [3, "Sarah"]]))
+                rs.copy.assert_not_called()
+                assert close_mock.call_count == 4
+
+    @mock.patch("parsons.databases.redshift.rs_copy_table.S3")
+    def test_temp_s3_copy_parts(self, s3_mock):
+        uploaded = {}
+
+        def put_stream(bucket, key, stream):
+            uploaded[key] = gzip.decompress(stream.read()).decode()
+
+        def put_file(bucket, key, local_path):
+            uploaded[key] = json.loads(Path(local_path).read_text())
+
+        s3_mock.return_value.put_stream.side_effect = put_stream
+        s3_mock.return_value.put_file.side_effect = put_file
+        rs = self.rs
+        rs.s3_temp_bucket = "bucket"
+        rs.s3_temp_bucket_prefix = None
+
+        tbl = Table([{"id": i} for i in range(2500)])
+        key = rs.temp_s3_copy(tbl, parts=2)
+
+        prefix = key.rsplit("/", 1)[0]
+        assert key == f"{prefix}/manifest.json"
+        manifest = uploaded.pop(key)
+        assert sorted(uploaded) == [f"{prefix}/part-00000.csv.gz", f"{prefix}/part-00001.csv.gz"]
+        # Every part has a header and is loaded with ignoreheader
+        assert [len(uploaded[part_key].splitlines()) for part_key in sorted(uploaded)] == [
+            1501,
+            1001,
+        ]
+
+        assert manifest == {
+            "entries": [
+                {"url": f"s3://bucket/{part_key}", "mandatory": True}
+                for part_key in sorted(uploaded)
+            ]
+        }
+
+        sql = rs.copy_statement(
+            "tmc.test",
+            "bucket",
+            key,
+            manifest=True,
+            aws_access_key_id="abc123",
+            aws_secret_access_key="abc123",
+        )
+        assert f"from 's3://bucket/{key}'" in sql
+        assert "manifest" in sql
+
 
 # These tests interact directly with the Redshift database
 
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import pytest
 
 from parsons import S3, Table
+from parsons.utilities import files
 from test.conftest import assert_matching_tables
 
 # Requires a s3 credentials stored in aws config or env variable
@@ -87,6 +88,24 @@ class TestS3(unittest.TestCase):
         keys = self.s3.list_keys(self.test_bucket, prefix="nope")
         assert key not in keys
 
+    def test_iter_keys(self):
+        csv_path = self.tbl.to_csv()
+        for key in ["iter/a.csv", "iter/b.csv", "iter/nested/c.csv"]:
+            self.s3.put_file(self.test_bucket, key, csv_path)
+
+        keys = [k["Key"] for k in self.s3.iter_keys(self.test_bucket, prefix="iter/")]
+        assert keys == ["iter/a.csv", "iter/b.csv", "iter/nested/c.csv"]
+
+        # The delimiter prunes nested keys, and start_after skips ahead
+        keys = self.s3.iter_keys(
+            self.test_bucket, prefix="iter/", delimiter="/", start_after="iter/a.csv"
+        )
+        assert [k["Key"] for k in keys] == ["iter/b.csv"]
+
+        # Stops early
+        keys = self.s3.iter_keys(self.test_bucket, prefix="iter/")
+        assert next(keys)["Key"] == "iter/a.csv"
+
     def test_key_exists(self):
         csv_path = self.tbl.to_csv()
         key = "test/test.csv"
@@ -133,6 +152,15 @@ class TestS3(unittest.TestCase):
         result_tbl = Table.from_csv(path)
         assert_matching_tables(self.tbl, result_tbl)
 
+    def test_put_stream(self):
+        s3 = S3(transfer_config={"multipart_threshold": 5 * 1024**2, "max_concurrency": 4})
+        tbl = Table([{"first": f"Bob {i}", "last": "Smith"} for i in range(100000)])
+
+        s3.put_stream(self.test_bucket, "stream.csv.gz", tbl.to_csv_stream(compression="gzip"))
+
+        path = s3.get_file(self.test_bucket, "stream.csv.gz")
+        assert_matching_tables(tbl, Table.from_csv(path))
+
     def test_get_url(self):
         # Test that you can download from URL
         url = self.s3.get_url(self.test_bucket, self.test_key)
@@ -180,9 +208,71 @@ class TestS3(unittest.TestCase):
         assert_matching_tables(self.tbl_2, result_tbl_2)
         assert not self.s3.key_exists(self.test_bucket, self.test_key_2)
 
+    def test_transfer_bucket_concurrent_with_checkpoint(self):
+        destination_bucket = f"{self.test_bucket}-test"
+        self.s3.create_bucket(destination_bucket)
+        checkpoint_path = files.create_temp_file()
+
+        csv_path = self.tbl.to_csv()
+        for i in range(5):
+            self.s3.put_file(self.test_bucket, f"transfer/{i}.csv", csv_path)
+
+        # Nothing has been transferred yet
+        assert (
+            self.s3.transfer_bucket(self.test_bucket, "transfer/", destination_bucket, dry_run=True)
+            == 5
+        )
+
+        # Transfer one key, then resume from the checkpoint to transfer the rest
+        self.s3.transfer_bucket(
+            self.test_bucket, "transfer/0.csv", destination_bucket, checkpoint_path=checkpoint_path
+        )
+        count = self.s3.transfer_bucket(
+            self.test_bucket,
+            "transfer/",
+            destination_bucket,
+            max_workers=4,
+            checkpoint_path=checkpoint_path,
+        )
+
+        assert count == 4
+        assert len(self.s3.list_keys(destination_bucket, prefix="transfer/")) == 5
+
     def test_get_buckets_with_subname(self):
         buckets_with_subname_true = self.s3.get_buckets_type(self.test_bucket_subname)
         assert self.test_bucket in buckets_with_subname_true
 
         buckets_with_subname_false = self.s3.get_buckets_type("bucketsubnamedoesnotexist")
         assert self.test_bucket not in buckets_with_subname_false
+
+
+def test_put_stream_multipart(monkeypatch):
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+    with moto.mock_aws():
+        s3 = S3(
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            transfer_config={
+                "multipart_threshold": 5 * 1024**2,
+                "multipart_chunksize": 5 * 1024**2,
+            },
+        )
+        s3.create_bucket("bucket")
+
+        operations = []
+        s3.client.meta.events.register(
+            "before-call.s3.*", lambda model, **kwargs: operations.append(model.name)
+        )
+
+        # About 12 MB of CSV, which a raw stream hands over a few bytes at a time
+        tbl = Table([{"id": i, "text": f"{i:060d}"} for i in range(200000)])
+        s3.put_stream("bucket", "stream.csv", tbl.to_csv_stream())
+
+        assert "PutObject" not in operations
+        assert operations.count("CreateMultipartUpload") == 1
+        assert operations.count("UploadPart") == 3
+
+        path = s3.get_file("bucket", "stream.csv")
+        assert_matching_tables(tbl, Table.from_csv(path).convert_column("id", int))
@@ -1,7 +1,11 @@
+import time
+
 import pytest
+from requests.exceptions import HTTPError
 from requests_mock import Mocker
 
-from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.api_connector import APIConnector, pages_to_table
+from parsons.utilities.rate_limiter import RateLimiter
 
 
 @pytest.fixture
@@ -56,3 +60,173 @@ def test_request_merges_base_and_additional_headers(
     assert req.headers["content-type"] == "application/json"
     assert req.headers["Authorization"] == "Bearer token123"
     assert req.headers["X-Custom-Header"] == "value"
+
+
+def test_requests_share_a_session(connector: APIConnector, requests_mock: Mocker) -> None:
+    requests_mock.get(
+        "https://api.example.com/v1/data",
+        json={},
+        headers={"Set-Cookie": "session=abc"},
+    )
+
+    session = connector.session
+    connector.request("data", "GET")
+    connector.request("data", "GET")
+
+    assert connector.session is session
+    assert requests_mock.call_count == 2
+    # Cookies aren't carried between requests
+    assert "Cookie" not in requests_mock.last_request.headers
+
+    connector.close()
+    assert connector.session is not session
+
+
+def test_session_adapters() -> None:
+    connector = APIConnector(
+        uri="https://api.example.com/v1", pool_size=25, max_retries=3, backoff_factor=0.5
+    )
+    adapter = connector.session.get_adapter("https://api.example.com/v1/data")
+
+    assert adapter._pool_maxsize == 25
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert 503 in adapter.max_retries.status_forcelist
+
+    assert (
+        APIConnector(uri="https://api.example.com")
+        .session.get_adapter("http://api.example.com")
+        .max_retries.total
+        == 0
+    )
+
+
+def test_get_pages_keeps_order_and_stops_at_empty_page(connector: APIConnector) -> None:
+    requested = []
+
+    def fetch_page(page):
+        requested.append(page)
+        # Later pages finish first
+        time.sleep(0.01 * (5 - page) if page < 5 else 0)
+        if page > 3:
+            if page == 4:
+                return []
+            raise ValueError("Past the last page")
+        return [page * 10, page * 10 + 1]
+
+    pages = list(connector.get_pages(fetch_page, max_workers=3))
+
+    assert pages == [[10, 11], [20, 21], [30, 31]]
+    assert max(requested) <= 6
+
+
+def test_get_pages_stops_when_closed(connector: APIConnector) -> None:
+    requested = []
+
+    def fetch_page(page):
+        requested.append(page)
+        return [page]
+
+    pages = connector.get_pages(fetch_page, start_page=5)
+    assert next(pages) == [5]
+    pages.close()
+
+    assert requested == [5]
+
+
+def test_get_pages_requests_per_second(connector: APIConnector) -> None:
+    start = time.monotonic()
+    pages = list(
+        connector.get_pages(
+            lambda page: [page] if page < 4 else [], max_workers=4, requests_per_second=20
+        )
+    )
+
+    assert pages == [[1], [2], [3]]
+    # At least four requests, spaced 50ms apart
+    assert time.monotonic() - start >= 0.15
+
+
+def test_rate_limited_request_retries_after_backoff(requests_mock: Mocker) -> None:
+    connector = APIConnector(
+        "https://rate-limited.example.com/v1", requests_per_second=100, max_retries=2
+    )
+    requests_mock.get(
+        "https://rate-limited.example.com/v1/data",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "0.2"}},
+            {"json": {"ok": True}, "status_code": 200},
+        ],
+    )
+
+    start = time.monotonic()
+    assert connector.get_request("data") == {"ok": True}
+
+    assert requests_mock.call_count == 2
+    assert time.monotonic() - start >= 0.2
+    assert connector.rate_limiter is RateLimiter.for_host("rate-limited.example.com", 100)
+
+
+def test_rate_limited_request_gives_up(requests_mock: Mocker) -> None:
+    connector = APIConnector(
+        "https://rate-limited-2.example.com/v1", requests_per_second=100, max_retries=1
+    )
+    requests_mock.get("https://rate-limited-2.example.com/v1/data", status_code=429)
+
+    with pytest.raises(HTTPError, match="Code: 429"):
+        connector.get_request("data")
+
+    assert requests_mock.call_count == 2
+
+
+def test_pages_to_table_is_lazy() -> None:
+    requested = []
+
+    def pages():
+        for page in range(3):
+            requested.append(page)
+            yield [{"page": page, "row": row} for row in range(600)]
+
+    tbl = pages_to_table(pages(), lazy=True)
+    # Only enough pages to find the columns are requested up front
+    assert requested == [0, 1]
+    assert tbl.columns == ["page", "row"]
+
+    assert tbl.num_rows == 1800
+    assert requested == [0, 1, 2]
+    # The rows are cached, so reading the table again doesn't request pages again
+    assert tbl.column_data("page")[-1] == 2
+    assert requested == [0, 1, 2]
+
+
+def test_pages_to_table_errors() -> None:
+    def pages():
+        for page in range(3):
+            if page == 2:
+                raise HTTPError("Page 2 failed")
+            yield [{"page": page, "row": row} for row in range(600)]
+
+    # By default every page is requested up front, so the error is raised right away
+    with pytest.raises(HTTPError, match="Page 2 failed"):
+        pages_to_table(pages())
+
+    # A lazy table raises the error on every read, not just the first
+    tbl = pages_to_table(pages(), lazy=True)
+    for _ in range(2):
+        with pytest.raises(HTTPError, match="Page 2 failed"):
+            tbl.materialize()
+
+
+def test_pages_to_table_limit() -> None:
+    requested = []
+
+    def pages():
+        for page in range(100):
+            requested.append(page)
+            yield [{"id": page * 10 + i} for i in range(10)]
+
+    tbl = pages_to_table(pages(), limit=25)
+
+    assert tbl.column_data("id") == list(range(25))
+    assert requested == [0, 1, 2]
+    assert pages_to_table(iter([])).num_rows == 0
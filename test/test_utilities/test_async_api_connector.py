@@ -0,0 +1,122 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from requests.exceptions import HTTPError
+
+pytest.importorskip("httpx")
+
+from parsons.utilities.async_api_connector import AsyncAPIConnector, pages_to_table
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        server = self.server
+
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        # Hold the request open long enough for others to overlap it
+        time.sleep(0.02)
+
+        with server.lock:
+            server.in_flight -= 1
+
+        if url.path == "/v1/people":
+            page = int(query["page"][0])
+            self._reply(200, {"data": [{"id": page}] if page <= 3 else []})
+        elif url.path.startswith("/v1/people/"):
+            self._reply(200, {"id": int(url.path.rsplit("/", 1)[1]), "auth": self.headers["X-Key"]})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self._reply(201, json.loads(self.rfile.read(length)))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.in_flight = httpd.max_in_flight = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def connector(server, **kwargs):
+    host, port = server.server_address
+    return AsyncAPIConnector(
+        f"http://{host}:{port}/v1", headers={"X-Key": "abc"}, data_key="data", **kwargs
+    )
+
+
+def test_get_and_post_request(server):
+    async def run():
+        async with connector(server) as api:
+            person = await api.get_request("people/7")
+            created = await api.post_request("people", json={"name": "Ida"})
+            return person, created
+
+    person, created = asyncio.run(run())
+
+    assert person == {"id": 7, "auth": "abc"}
+    assert created == {"name": "Ida"}
+
+
+def test_error_raises_http_error(server):
+    async def run():
+        async with connector(server) as api:
+            await api.get_request("missing")
+
+    with pytest.raises(HTTPError, match="Code: 404"):
+        asyncio.run(run())
+
+
+def test_gather_limits_concurrency(server):
+    server.in_flight = server.max_in_flight = 0
+
+    async def run():
+        async with connector(server, max_concurrency=3) as api:
+            return await api.gather(lambda i: api.get_request(f"people/{i}"), range(12))
+
+    people = asyncio.run(run())
+
+    assert [p["id"] for p in people] == list(range(12))
+    assert 1 < server.max_in_flight <= 3
+
+
+def test_get_pages(server):
+    async def run():
+        async with connector(server) as api:
+
+            async def fetch_page(page):
+                return api.data_parse(await api.get_request("people", params={"page": page}))
+
+            return await pages_to_table(api.get_pages(fetch_page, max_workers=2))
+
+    tbl = asyncio.run(run())
+
+    assert tbl.columns == ["id"]
+    assert tbl["id"] == [1, 2, 3]
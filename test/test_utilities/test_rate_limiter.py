@@ -0,0 +1,66 @@
+import time
+
+import pytest
+import requests
+
+from parsons.utilities.rate_limiter import RateLimiter, retry_after_seconds
+
+
+def test_reserve_allows_burst_then_spaces_requests():
+    limiter = RateLimiter(requests_per_second=10, burst=3)
+
+    delays = [limiter.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_backoff_delays_next_request():
+    limiter = RateLimiter(requests_per_second=100)
+    limiter.backoff(0.5)
+
+    assert limiter.reserve() == pytest.approx(0.5, abs=0.01)
+
+
+def test_acquire_waits():
+    limiter = RateLimiter(requests_per_second=20)
+    start = time.monotonic()
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 0.15
+
+
+def test_for_host_shares_limiter():
+    first = RateLimiter.for_host("rate-limiter-test.example.com", 5, burst=4)
+    second = RateLimiter.for_host("rate-limiter-test.example.com", 2, burst=4)
+
+    assert first is second
+    assert (second.requests_per_second, second.burst) == (2, 4)
+
+
+def test_for_host_keeps_slowest_limit():
+    slow = RateLimiter.for_host("rate-limiter-slowest.example.com", 2, burst=4)
+    fast = RateLimiter.for_host("rate-limiter-slowest.example.com", 10, burst=2)
+
+    assert slow is fast
+    assert (fast.requests_per_second, fast.burst) == (2, 2)
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError, match="greater than 0"):
+        RateLimiter(requests_per_second=0)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, None), ("3", 3.0), ("-1", 0.0), ("soon", None), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)],
+)
+def test_retry_after_seconds(header, expected):
+    resp = requests.Response()
+    if header is not None:
+        resp.headers["Retry-After"] = header
+
+    assert retry_after_seconds(resp) == expected
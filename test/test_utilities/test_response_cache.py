@@ -0,0 +1,110 @@
+import pytest
+from requests_mock import Mocker
+
+from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.response_cache import (
+    CachedResponse,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+)
+
+URL = "https://api.example.com/v1/metadata"
+
+
+@pytest.fixture
+def connector() -> APIConnector:
+    return APIConnector("https://api.example.com/v1", headers={"X-Key": "abc"}, cache=MemoryCache())
+
+
+def test_incomplete_cache_cannot_be_created():
+    class NoClearCache(ResponseCache):
+        def get(self, key):
+            return None
+
+        def set(self, key, entry):
+            pass
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClearCache()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", CachedResponse(URL, 200, {}, b"a"))
+    cache.set("b", CachedResponse(URL, 200, {}, b"b"))
+    cache.get("a")
+    cache.set("c", CachedResponse(URL, 200, {}, b"c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a").content == b"a"
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path)
+    cache.set("a", CachedResponse(URL, 200, {"ETag": '"v1"'}, b'{"a": 1}', stored_at=5.0))
+    cache.close()
+
+    entry = SQLiteCache(path).get("a")
+
+    assert (entry.url, entry.status_code, entry.content, entry.stored_at) == (
+        URL,
+        200,
+        b'{"a": 1}',
+        5.0,
+    )
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+
+def test_get_request_is_cached(connector: APIConnector, requests_mock: Mocker) -> None:
+    requests_mock.get(URL, json={"fields": [1, 2]})
+
+    assert connector.get_request("metadata") == {"fields": [1, 2]}
+    assert connector.get_request("metadata") == {"fields": [1, 2]}
+
+    assert requests_mock.call_count == 1
+
+
+def test_cache_key_includes_params_and_headers(
+    connector: APIConnector, requests_mock: Mocker
+) -> None:
+    requests_mock.get(URL, json={})
+
+    connector.get_request("metadata", params={"page": 1})
+    connector.get_request("metadata", params={"page": 2})
+    connector.request("metadata", "GET", additional_headers={"X-Key": "other"})
+
+    assert requests_mock.call_count == 3
+
+
+def test_stale_response_is_revalidated(connector: APIConnector, requests_mock: Mocker) -> None:
+    connector.cache.ttl = 0
+    requests_mock.get(
+        URL,
+        [
+            {"json": {"fields": [1]}, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    connector.get_request("metadata")
+    assert connector.get_request("metadata") == {"fields": [1]}
+
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+
+def test_only_get_is_cached(connector: APIConnector, requests_mock: Mocker) -> None:
+    requests_mock.post(URL, json={"id": 1}, status_code=201)
+    requests_mock.get(
+        "https://api.example.com/v1/private", json={}, headers={"Cache-Control": "no-store"}
+    )
+
+    connector.post_request("metadata")
+    connector.post_request("metadata")
+    connector.get_request("private")
+    connector.get_request("private")
+
+    assert requests_mock.call_count == 4